@@ -0,0 +1,85 @@
+"""
+Benchmark: N concurrent streamed requests on the asyncio path
+
+Runs requests against the local fake backend through async_generate_response
+and async_stream_response, and compares wall-clock time with running the
+same requests one after another on the synchronous path. Also checks that
+timeouts and cancellation stop in-flight streams. Run from the repository
+root:
+
+    python -m benchmarks.bench_async_concurrency
+"""
+
+import asyncio
+import time
+
+from benchmarks.fake_backend import FakeGenerativeModel
+from utils.async_model_handler import async_generate_response, async_stream_response
+from utils.model_handler import stream_response
+
+CONCURRENCY_LEVELS = [1, 8, 32, 128]
+PROMPT = ["Persistent cough and fever for 3 weeks", "system prompt"]
+
+
+def _make_model() -> FakeGenerativeModel:
+    # ~1.6 s per request: 0.3 s to first token, 64 chunks at 20 ms
+    return FakeGenerativeModel(first_token_latency=0.3, chunk_interval=0.02, output_chars=64 * 80)
+
+
+async def _one_request(model) -> int:
+    response = await async_generate_response(model, PROMPT, stream=True)
+    chars = 0
+    async for text in async_stream_response(response):
+        chars += len(text)
+    return chars
+
+
+async def _run_concurrent(n: int) -> float:
+    model = _make_model()
+    start = time.perf_counter()
+    await asyncio.gather(*(_one_request(model) for _ in range(n)))
+    return time.perf_counter() - start
+
+
+def _sync_request_seconds() -> float:
+    model = _make_model()
+    start = time.perf_counter()
+    for _ in stream_response(model.generate_content(PROMPT, stream=True)):
+        pass
+    return time.perf_counter() - start
+
+
+async def _check_timeout_and_cancel():
+    model = _make_model()
+    try:
+        await async_generate_response(model, PROMPT, timeout=0.05)
+        timed_out = False
+    except asyncio.TimeoutError:
+        timed_out = True
+
+    task = asyncio.create_task(_one_request(model))
+    await asyncio.sleep(0.5)
+    task.cancel()
+    try:
+        await task
+        cancelled = False
+    except asyncio.CancelledError:
+        cancelled = True
+    return timed_out, cancelled
+
+
+def main():
+    per_request = _sync_request_seconds()
+    print(f"single synchronous request: {per_request:.2f}s\n")
+    print(f"{'requests':>9}{'async wall':>12}{'sequential':>12}{'speedup':>9}")
+    for n in CONCURRENCY_LEVELS:
+        wall = asyncio.run(_run_concurrent(n))
+        sequential = per_request * n
+        print(f"{n:>9}{wall:>11.2f}s{sequential:>11.2f}s{sequential / wall:>8.1f}x")
+
+    timed_out, cancelled = asyncio.run(_check_timeout_and_cancel())
+    print(f"\ntimeout raised: {timed_out}  cancellation propagated: {cancelled}")
+
+
+if __name__ == "__main__":
+    main()
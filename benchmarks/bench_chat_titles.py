@@ -0,0 +1,91 @@
+"""
+Benchmark: chat title keyword matching as the lexicon grows
+
+Compares the original approach (a substring scan of the query per keyword)
+with the compiled TermMatcher, for the built-in lexicon and for lexicons
+padded to several thousand terms, then re-titles a batch of history items
+with generate_chat_titles. Run from the repository root:
+
+    python -m benchmarks.bench_chat_titles
+"""
+
+import random
+import time
+
+from config.medical_terms import MEDICAL_TERMS
+from utils.chat_titles import TermMatcher, generate_chat_titles
+
+LEXICON_SIZES = [1000, 5000, 20000]
+HISTORY_ITEMS = 20000
+QUERIES = [
+    "Persistent dry cough and mild fever for two weeks, no shortness of breath",
+    "A 45-year-old patient presents with chest pain radiating to the left arm for 3 days",
+    "Swelling and pain in the right knee after a fall while running; the affected area is warm",
+    "Itchy red rashes on both forearms after gardening, spreading slowly",
+    "dolor de cabeza y fiebre desde ayer",
+    "Ich habe seit drei Tagen Rückenschmerzen und Fieber",
+    "어제부터 두통이 심하고 기침이 나요",
+    "Follow-up on my CT scan results and the lesion they found near the liver",
+]
+
+
+def _lexicon(size: int):
+    """The built-in terms padded with made-up multi-word terms to `size`"""
+    terms = [term for language_terms in MEDICAL_TERMS.values() for term in language_terms]
+    rng = random.Random(size)
+    syllables = ["car", "dio", "neu", "ro", "gas", "tro", "pul", "mo", "nal", "itis", "osis", "algia"]
+    while len(terms) < size:
+        word = "".join(rng.choices(syllables, k=rng.randint(2, 4)))
+        terms.append(word if rng.random() < 0.6 else f"{word} {rng.choice(syllables)}{rng.choice(syllables)}")
+    return terms[:size]
+
+
+def _substring_scan(keywords, query):
+    """The original generate_chat_title loop, minus its early exit at two matches"""
+    q_lower = query.lower()
+    found = []
+    for kw in keywords:
+        if kw in q_lower and kw not in found:
+            found.append(kw)
+    return found
+
+
+def _per_query_us(function, repeats: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in QUERIES:
+            function(query)
+    return (time.perf_counter() - start) / (repeats * len(QUERIES)) * 1e6
+
+
+def main():
+    print(f"{'terms':>8}{'compile ms':>12}{'substring us':>15}{'matcher us':>13}")
+    for size in LEXICON_SIZES:
+        terms = _lexicon(size)
+        keywords = [term.lower() for term in terms]
+        start = time.perf_counter()
+        matcher = TermMatcher(terms)
+        compile_ms = (time.perf_counter() - start) * 1000
+        substring_us = _per_query_us(lambda query: _substring_scan(keywords, query))
+        matcher_us = _per_query_us(matcher.find_all)
+        print(f"{size:>8}{compile_ms:>12.1f}{substring_us:>15.1f}{matcher_us:>13.1f}")
+
+    rng = random.Random(0)
+    items = [
+        {
+            "query": f"{rng.choice(QUERIES)} (visit {rng.randrange(HISTORY_ITEMS)})",
+            "input_mode": "Text Only",
+            "language": "English"
+        }
+        for _ in range(HISTORY_ITEMS)
+    ]
+    generate_chat_titles(items[:1])  # Compiles the built-in matcher outside the timing
+    start = time.perf_counter()
+    generate_chat_titles(items)
+    elapsed = time.perf_counter() - start
+    print(f"\ngenerate_chat_titles: {HISTORY_ITEMS} items in {elapsed * 1000:.0f} ms "
+          f"({elapsed / HISTORY_ITEMS * 1e6:.1f} us/item)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: import-time budget for cold start and reruns
+
+Each measurement runs in a fresh interpreter. Checks that the app's own
+imports stay within budget on top of Streamlit, that the first script run
+of the main and history pages does not load the Gemini SDK, cryptography or
+Pillow, and that a rerun (what every widget click costs) stays cheap.
+Exits with status 1 when a budget is exceeded. Run from the repository root:
+
+    python -m benchmarks.bench_import_time
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEATS = 5
+RERUNS = 20
+
+# Modules that must only load once an analysis needs them
+HEAVY_MODULES = ["google.generativeai", "grpc", "cryptography", "PIL", "numpy"]
+
+# Milliseconds; generous enough for a loaded CI machine
+BUDGETS = {
+    "app_imports_ms": 150,
+    "first_run_home_ms": 600,
+    "first_run_history_ms": 600,
+    "rerun_home_ms": 150
+}
+
+_APP_IMPORTS = """
+import json, sys, time
+import streamlit
+start = time.perf_counter()
+import config
+from components import render_main_page
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "heavy": [m for m in HEAVY if m in sys.modules]}))
+"""
+
+_SCRIPT_RUNS = """
+import json, logging, sys, time, warnings
+warnings.filterwarnings("ignore")
+logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=60)
+at.session_state["current_page"] = PAGE
+start = time.perf_counter()
+at.run()
+first = time.perf_counter() - start
+heavy = [m for m in HEAVY if m in sys.modules]
+reruns = []
+for _ in range(RERUNS):
+    start = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - start)
+print(json.dumps({"first": first, "reruns": reruns, "heavy": heavy, "errors": [e.value for e in at.exception]}))
+"""
+
+
+def _run(code: str, **constants) -> dict:
+    prelude = "".join(f"{name} = {value!r}\n" for name, value in constants.items())
+    completed = subprocess.run(
+        [sys.executable, "-c", prelude + code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    results = {}
+    heavy_loaded = {}
+
+    samples = [_run(_APP_IMPORTS, HEAVY=HEAVY_MODULES) for _ in range(REPEATS)]
+    results["app_imports_ms"] = statistics.median(s["seconds"] for s in samples) * 1000
+    heavy_loaded["app imports"] = samples[0]["heavy"]
+
+    for page in ("home", "history"):
+        samples = [_run(_SCRIPT_RUNS, HEAVY=HEAVY_MODULES, PAGE=page, RERUNS=RERUNS) for _ in range(REPEATS)]
+        errors = samples[0]["errors"]
+        if errors:
+            print(f"{page} page raised: {errors}")
+            return 1
+        results[f"first_run_{page}_ms"] = statistics.median(s["first"] for s in samples) * 1000
+        heavy_loaded[f"{page} page"] = samples[0]["heavy"]
+        if page == "home":
+            results["rerun_home_ms"] = statistics.median(r for s in samples for r in s["reruns"]) * 1000
+
+    failed = False
+    for name, value in results.items():
+        budget = BUDGETS[name]
+        status = "ok" if value <= budget else "OVER BUDGET"
+        failed |= value > budget
+        print(f"{name:<24}{value:>10.1f} ms   budget {budget:>5} ms   {status}")
+    for where, modules in heavy_loaded.items():
+        if modules:
+            failed = True
+            print(f"{where} loaded heavy modules: {', '.join(modules)}")
+    print("\nFAIL" if failed else "\nPASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
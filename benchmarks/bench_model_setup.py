@@ -0,0 +1,60 @@
+"""
+Benchmark: model setup overhead per analysis
+
+Compares the previous per-request setup (genai.configure + a fresh
+GenerativeModel + the SDK default client it lazily creates) with the pooled
+models returned by initialize_model. No requests are sent; channels are
+created lazily, so this measures client-side setup only. Run from the
+repository root:
+
+    python -m benchmarks.bench_model_setup
+"""
+
+import time
+
+import google.generativeai as genai
+from google.generativeai import client as genai_client
+
+from config.settings import GENERATION_CONFIG, SAFETY_SETTINGS
+from utils.client_pool import ModelClientPool
+
+ITERATIONS = 200
+FAKE_API_KEYS = [f"AIza{'x' * 30}{i:05d}" for i in range(4)]
+MODEL_ID = "gemini-2.5-flash-lite"
+
+
+def _per_request_setup(api_key: str):
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel(
+        model_name=MODEL_ID,
+        generation_config=GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS
+    )
+    # generate_content() would create this on first use
+    model._client = genai_client.get_default_generative_client()
+    return model
+
+
+def _time(label: str, setup):
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        setup(FAKE_API_KEYS[i % len(FAKE_API_KEYS)])
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22}{elapsed / ITERATIONS * 1e6:>12.1f} us/call")
+    return elapsed
+
+
+def main():
+    pool = ModelClientPool()
+
+    def _pooled_setup(api_key: str):
+        return pool.get_model(api_key, MODEL_ID, GENERATION_CONFIG, SAFETY_SETTINGS)
+
+    print(f"{ITERATIONS} setups across {len(FAKE_API_KEYS)} API keys\n")
+    before = _time("configure + model", _per_request_setup)
+    after = _time("pooled model", _pooled_setup)
+    print(f"\nspeedup: {before / after:.1f}x  pool stats: {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: per-chunk formatting and render cost while streaming a report
+
+Compares the original approach (re-format and re-send the whole accumulated
+response on every chunk) with the incremental formatter + block renderer used
+by process_analysis. Run from the repository root:
+
+    python -m benchmarks.bench_streaming_format
+"""
+
+import time
+
+from utils.response_renderer import (
+    format_medical_response,
+    IncrementalMedicalFormatter,
+    StreamingMarkdownRenderer
+)
+
+CHARS_PER_TOKEN = 4
+MAX_OUTPUT_TOKENS = 4096
+CHUNK_CHARS = 80  # Roughly what a Gemini stream chunk carries
+REPORT_POINTS = [256, 512, 1024, 2048, 4096]
+
+SECTION = (
+    "**Observational Analysis:**\n"
+    "The image shows mild opacity in the lower lobe. It is advisable to "
+    "consult a medical professional for confirmation.\n\n"
+    "**Recommendations:**\n"
+    "1. Follow-up imaging in two weeks.\n"
+    "2. If breathing worsens, seek immediate medical attention.\n\n"
+)
+
+
+class _RecordingPlaceholder:
+    def __init__(self, sink):
+        self._sink = sink
+
+    def markdown(self, text):
+        self._sink.append(len(text.encode("utf-8")))
+
+
+class _RecordingContainer:
+    """Stands in for st.container() and counts bytes sent per element update"""
+
+    def __init__(self):
+        self.sent = []
+
+    def empty(self):
+        return _RecordingPlaceholder(self.sent)
+
+
+def _make_chunks():
+    total_chars = MAX_OUTPUT_TOKENS * CHARS_PER_TOKEN
+    text = (SECTION * (total_chars // len(SECTION) + 1))[:total_chars]
+    return [text[i:i + CHUNK_CHARS] for i in range(0, len(text), CHUNK_CHARS)]
+
+
+def _run_full_reformat(chunks):
+    container = _RecordingContainer()
+    placeholder = container.empty()
+    timings = []
+    full_response = ""
+    for chunk in chunks:
+        start = time.perf_counter()
+        full_response += chunk
+        placeholder.markdown(format_medical_response(full_response))
+        timings.append(time.perf_counter() - start)
+    return timings, container.sent
+
+
+def _run_incremental(chunks):
+    container = _RecordingContainer()
+    renderer = StreamingMarkdownRenderer(container)
+    formatter = IncrementalMedicalFormatter()
+    timings = []
+    for chunk in chunks:
+        start = time.perf_counter()
+        renderer.write(formatter.feed(chunk))
+        timings.append(time.perf_counter() - start)
+    renderer.write(formatter.flush())
+    renderer.close()
+    return timings, container.sent
+
+
+def _window_stats(timings, sent, tokens):
+    """Average per-chunk cost for the chunk window ending at `tokens`"""
+    end = min(len(timings), tokens * CHARS_PER_TOKEN // CHUNK_CHARS)
+    start = max(0, end - 10)
+    window = timings[start:end]
+    avg_us = sum(window) / len(window) * 1e6
+    return avg_us, sent[end - 1] if end <= len(sent) else sent[-1]
+
+
+def main():
+    chunks = _make_chunks()
+    results = {
+        "full reformat": _run_full_reformat(chunks),
+        "incremental": _run_incremental(chunks)
+    }
+
+    print(f"{len(chunks)} chunks of {CHUNK_CHARS} chars "
+          f"({MAX_OUTPUT_TOKENS} output tokens)\n")
+    print(f"{'mode':<15}{'tokens':>8}{'us/chunk':>12}{'bytes/update':>15}")
+    for mode, (timings, sent) in results.items():
+        for tokens in REPORT_POINTS:
+            avg_us, last_bytes = _window_stats(timings, sent, tokens)
+            print(f"{mode:<15}{tokens:>8}{avg_us:>12.1f}{last_bytes:>15,}")
+        print(f"{'':<15}{'total':>8}{sum(timings) * 1e3:>10.2f}ms"
+              f"{sum(sent):>15,}\n")
+
+
+if __name__ == "__main__":
+    main()
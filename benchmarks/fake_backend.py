@@ -0,0 +1,149 @@
+"""
+Local stand-in for google.generativeai.GenerativeModel
+
+Streams canned report text at a configurable time-to-first-token and chunk
+rate, synchronously and via asyncio, so the app's own overhead can be
+measured without network calls or an API key.
+"""
+
+import asyncio
+import time
+
+CANNED_REPORT = (
+    "**Observational Analysis:**\n"
+    "The chest radiograph shows increased opacity in the right lower zone "
+    "with blunting of the costophrenic angle. Cardiac silhouette is within "
+    "normal limits.\n\n"
+    "**General Insights:**\n"
+    "These findings can be associated with consolidation or a small pleural "
+    "effusion. Correlation with the reported cough and fever is important.\n\n"
+    "**Recommendations:**\n"
+    "1. Clinical examination and auscultation.\n"
+    "2. Complete blood count and CRP.\n"
+    "3. Follow-up imaging after treatment. Please consult a medical professional.\n\n"
+    "**Cautionary Notes:**\n"
+    "If breathing becomes difficult, seek immediate medical attention.\n\n"
+    "**Disclaimer:**\n"
+    "This is an AI-generated analysis for informational purposes only.\n\n"
+)
+
+
+class FakeUsageMetadata:
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+        self.thoughts_token_count = 0
+
+
+class FakeChunk:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeResponseBase:
+    def __init__(self, model, prompt_parts):
+        self._model = model
+        self._chunks = model.make_chunks()
+        self._prompt_chars = sum(len(p) for p in prompt_parts if isinstance(p, str))
+        self.usage_metadata = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def _finish(self):
+        self.usage_metadata = FakeUsageMetadata(
+            prompt_token_count=self._prompt_chars // 4 + 258,
+            candidates_token_count=len(self.text) // 4
+        )
+
+
+class FakeResponse(_FakeResponseBase):
+    """Synchronous streamed response"""
+
+    def __iter__(self):
+        for index, text in enumerate(self._chunks):
+            if index:
+                time.sleep(self._model.chunk_interval)
+            else:
+                self._model.last_first_chunk_at = time.perf_counter()
+            yield FakeChunk(text)
+        self._finish()
+
+
+class FakeAsyncResponse(_FakeResponseBase):
+    """Async streamed response"""
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for index, text in enumerate(self._chunks):
+            if index:
+                await asyncio.sleep(self._model.chunk_interval)
+            yield FakeChunk(text)
+        self._finish()
+
+
+class FakeGenerativeModel:
+    """
+    Drop-in for GenerativeModel.generate_content / generate_content_async.
+
+    first_token_latency: seconds before the first chunk
+    chunk_interval: seconds between subsequent chunks
+    output_chars: length of the streamed report
+    chunk_chars: characters per chunk
+    """
+
+    def __init__(
+        self,
+        first_token_latency: float = 0.3,
+        chunk_interval: float = 0.02,
+        output_chars: int = 4096 * 4,
+        chunk_chars: int = 80,
+        model_name: str = "models/fake-gemini"
+    ):
+        self.first_token_latency = first_token_latency
+        self.chunk_interval = chunk_interval
+        self.output_chars = output_chars
+        self.chunk_chars = chunk_chars
+        self.model_name = model_name
+        self.calls = 0
+        self.last_first_chunk_at = None  # perf_counter() when the latest sync stream yielded
+
+    def make_chunks(self) -> list:
+        text = (CANNED_REPORT * (self.output_chars // len(CANNED_REPORT) + 1))[:self.output_chars]
+        return [text[i:i + self.chunk_chars] for i in range(0, len(text), self.chunk_chars)]
+
+    def generate_content(self, prompt_parts, stream: bool = False, **kwargs):
+        self.calls += 1
+        time.sleep(self.first_token_latency)
+        response = FakeResponse(self, prompt_parts)
+        if not stream:
+            time.sleep(self.chunk_interval * (len(response._chunks) - 1))
+            response._finish()
+        return response
+
+    async def generate_content_async(self, prompt_parts, stream: bool = False, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.first_token_latency)
+        response = FakeAsyncResponse(self, prompt_parts)
+        if not stream:
+            await asyncio.sleep(self.chunk_interval * (len(response._chunks) - 1))
+            response._finish()
+        return response
+
+
+def install_fake_backend(model: FakeGenerativeModel):
+    """
+    Route every pooled model lookup in this process to model, and turn off
+    the response cache and rate limiter so repeated runs measure generation
+    """
+    import utils.client_pool
+    import utils.rate_limiter
+    import utils.response_cache
+
+    utils.client_pool.ModelClientPool.get_model = lambda self, *args, **kwargs: model
+    utils.client_pool.ModelClientPool.get_async_model = lambda self, *args, **kwargs: model
+    utils.rate_limiter.RATE_LIMIT_ENABLED = False
+    utils.response_cache.RESPONSE_CACHE_ENABLED = False
@@ -0,0 +1,494 @@
+"""
+End-to-end benchmark suite against the fake Gemini backend
+
+Measures the app's own overhead with the model replaced by
+benchmarks.fake_backend, and writes flat, lower-is-better metrics to a JSON
+file so runs on different commits can be compared:
+
+- startup: cold import and first script run times (fresh interpreters)
+- payload: markdown/HTML bytes the home page sends on every rerun
+- analysis: time-to-first-render and per-chunk render cost in process_analysis
+- prompt: image preprocessing and prepare_prompt cost for large images
+- history: render_history_page time with many stored items
+- similar: perceptual hashing and near-duplicate lookups in a 100k-image index
+- semantic: reworded-question lookups in a full semantic cache
+- memory: peak and retained memory per Streamlit session
+
+Run from the repository root:
+
+    python -m benchmarks.run_suite [--output FILE] [--compare BASELINE.json] [--quick]
+"""
+
+import argparse
+import gc
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+FAKE_API_KEY = "AIza" + "b" * 35
+SYMPTOMS = "Persistent cough and fever for 3 weeks, mild shortness of breath"
+REGRESSION_THRESHOLD = 0.10
+
+STARTUP_SNIPPETS = {
+    "import_components": "import components",
+    "import_server": "import server.app",
+    "first_script_run": (
+        "from streamlit.testing.v1 import AppTest\n"
+        "at = AppTest.from_file('app.py', default_timeout=60)\n"
+        "start = time.perf_counter()\n"
+        "at.run()"
+    )
+}
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _median_ms(samples) -> float:
+    return _ms(statistics.median(samples))
+
+
+def _p95(values):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def bench_startup(repeats: int) -> dict:
+    """Cold timings in fresh interpreters so module caches don't hide imports"""
+    env = dict(os.environ, PYTHONWARNINGS="ignore")
+    metrics = {}
+    for name, snippet in STARTUP_SNIPPETS.items():
+        code = (
+            "import time\n"
+            "start = time.perf_counter()\n"
+            f"{snippet}\n"
+            "print(time.perf_counter() - start)"
+        )
+        samples = []
+        for _ in range(repeats):
+            completed = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+            )
+            samples.append(float(completed.stdout.strip().splitlines()[-1]))
+        metrics[f"startup.{name}_ms"] = _median_ms(samples)
+    return metrics
+
+
+def bench_payload() -> dict:
+    """Markdown and HTML bytes sent per rerun of the home page"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+    at.run()
+    markdown = [m.value for m in at.markdown]
+    return {
+        "payload.home_markdown_bytes": sum(len(value.encode("utf-8")) for value in markdown),
+        "payload.home_style_bytes": sum(len(value.encode("utf-8")) for value in markdown if "<style" in value)
+    }
+
+
+class _RenderProbe:
+    """Times IncrementalMedicalFormatter.feed and StreamingMarkdownRenderer.write"""
+
+    def __init__(self):
+        from utils.response_renderer import IncrementalMedicalFormatter, StreamingMarkdownRenderer
+        self.feed_seconds = []
+        self.write_seconds = []
+        self.first_render_at = None
+
+        original_feed = IncrementalMedicalFormatter.feed
+        original_write = StreamingMarkdownRenderer.write
+        probe = self
+
+        def feed(formatter, chunk):
+            start = time.perf_counter()
+            result = original_feed(formatter, chunk)
+            probe.feed_seconds.append(time.perf_counter() - start)
+            return result
+
+        def write(renderer, delta):
+            start = time.perf_counter()
+            original_write(renderer, delta)
+            end = time.perf_counter()
+            probe.write_seconds.append(end - start)
+            if delta and probe.first_render_at is None:
+                probe.first_render_at = end
+
+        IncrementalMedicalFormatter.feed = feed
+        StreamingMarkdownRenderer.write = write
+
+    def reset(self):
+        self.feed_seconds.clear()
+        self.write_seconds.clear()
+        self.first_render_at = None
+
+
+def _new_session():
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+    at.sidebar.text_input[0].input(FAKE_API_KEY).run()
+    return at
+
+
+def _click_generate(at, text: str):
+    at.text_area[0].input(text).run()
+    button = next(b for b in at.button if "Generate" in b.label)
+    button.click().run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+
+def bench_analysis(model, probe: _RenderProbe, repeats: int) -> dict:
+    """Streamed analysis through process_analysis with the fake model"""
+    at = _new_session()
+    first_render, after_first_token, totals, per_chunk = [], [], [], []
+
+    for attempt in range(repeats):
+        probe.reset()
+        at.text_area[0].input(f"{SYMPTOMS} (run {attempt})").run()
+        button = next(b for b in at.button if "Generate" in b.label)
+        start = time.perf_counter()
+        button.click().run()
+        total = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+
+        totals.append(total)
+        first_render.append(probe.first_render_at - start)
+        after_first_token.append(probe.first_render_at - model.last_first_chunk_at)
+        per_chunk.extend(f + w for f, w in zip(probe.feed_seconds, probe.write_seconds))
+
+    chunks = len(model.make_chunks())
+    model_seconds = model.first_token_latency + model.chunk_interval * (chunks - 1)
+    return {
+        "analysis.time_to_first_render_ms": _median_ms(first_render),
+        "analysis.first_render_after_first_token_ms": _median_ms(after_first_token),
+        "analysis.render_per_chunk_mean_us": round(statistics.mean(per_chunk) * 1e6, 2),
+        "analysis.render_per_chunk_p95_us": round(_p95(per_chunk) * 1e6, 2),
+        "analysis.total_run_ms": _median_ms(totals),
+        "analysis.app_overhead_ms": _ms(statistics.median(totals) - model_seconds)
+    }
+
+
+def _large_images() -> dict:
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(0)
+    # Smooth gradient plus sensor-like noise, roughly what a scanned film compresses like
+    y, x = np.mgrid[0:3000, 0:4000]
+    base = ((x + y) / 7000 * 255).astype(np.uint8)
+    noisy = np.clip(base + rng.normal(0, 12, base.shape), 0, 255).astype(np.uint8)
+    image = Image.fromarray(np.stack([noisy] * 3, axis=-1))
+
+    images = {}
+    for name, fmt, options in (("jpeg_12mp", "JPEG", {"quality": 95}), ("png_12mp", "PNG", {})):
+        buffer = io.BytesIO()
+        image.save(buffer, fmt, **options)
+        images[name] = buffer.getvalue()
+    return images
+
+
+def bench_prompt(repeats: int) -> dict:
+    """Per-request CPU work before generation for a large uploaded image"""
+    from config.prompts import get_system_prompt
+    from utils.image_processor import preprocess_image, get_max_image_pixels
+    from utils.model_handler import prepare_prompt
+    from utils.response_cache import build_cache_key
+    from utils.token_counter import estimate_prompt_tokens
+
+    metrics = {}
+    max_pixels = get_max_image_pixels("Gemini 2.5 Flash-Lite")
+    for name, data in _large_images().items():
+        preprocess, prepare, estimate, cache_key = [], [], [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            processed = preprocess_image(data, max_pixels)
+            preprocess.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            parts = prepare_prompt(
+                system_prompt=get_system_prompt("English"),
+                user_text=SYMPTOMS,
+                image_data=processed.data,
+                image_mime_type=processed.mime_type
+            )
+            prepare.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            estimate_prompt_tokens(parts)
+            estimate.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            build_cache_key("Gemini 2.5 Flash-Lite", parts, "English")
+            cache_key.append(time.perf_counter() - start)
+
+        metrics[f"prompt.{name}.preprocess_ms"] = _median_ms(preprocess)
+        metrics[f"prompt.{name}.prepare_prompt_ms"] = _median_ms(prepare)
+        metrics[f"prompt.{name}.estimate_tokens_ms"] = _median_ms(estimate)
+        metrics[f"prompt.{name}.cache_key_ms"] = _median_ms(cache_key)
+        metrics[f"prompt.{name}.sent_bytes"] = len(processed.data)
+    return metrics
+
+
+def bench_similar(entries: int, lookups: int = 2000) -> dict:
+    """Perceptual hash cost and HammingIndex insert/lookup latency at the configured distance"""
+    import random
+    import numpy as np
+    from PIL import Image
+    from utils.perceptual_hash import HammingIndex, image_hash
+
+    y, x = np.mgrid[0:1500, 0:2000]
+    image = Image.fromarray((np.sin(x / 90) * np.cos(y / 130) * 80 + 128).astype(np.uint8)).convert("RGB")
+    hash_times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        image_hash(image)
+        hash_times.append(time.perf_counter() - start)
+
+    rng = random.Random(0)
+    index = HammingIndex()
+    hashes = [rng.getrandbits(64) for _ in range(entries)]
+    start = time.perf_counter()
+    for position, value in enumerate(hashes):
+        index.add(value, position, "bench")
+    add_seconds = time.perf_counter() - start
+
+    hit_times, miss_times = [], []
+    for _ in range(lookups):
+        query = hashes[rng.randrange(entries)]
+        for bit in rng.sample(range(64), index.max_distance):
+            query ^= 1 << bit
+        start = time.perf_counter()
+        index.find(query, "bench")
+        hit_times.append(time.perf_counter() - start)
+
+        query = rng.getrandbits(64)
+        start = time.perf_counter()
+        index.find(query, "bench")
+        miss_times.append(time.perf_counter() - start)
+
+    return {
+        "similar.hash_3mp_ms": _median_ms(hash_times),
+        "similar.add_us": round(add_seconds / entries * 1e6, 3),
+        "similar.lookup_hit_p50_us": round(statistics.median(hit_times) * 1e6, 3),
+        "similar.lookup_hit_p95_us": round(_p95(hit_times) * 1e6, 3),
+        "similar.lookup_miss_p50_us": round(statistics.median(miss_times) * 1e6, 3)
+    }
+
+
+def bench_semantic(lookups: int = 1000) -> dict:
+    """SemanticCache insert and lookup latency with every entry in one context"""
+    import random
+    from utils.semantic_cache import SemanticCache
+
+    rng = random.Random(0)
+    vocabulary = [f"term{index}" for index in range(5000)]
+    cache = SemanticCache()
+    queries = [" ".join(rng.choices(vocabulary, k=25)) for _ in range(cache.max_entries)]
+    start = time.perf_counter()
+    for position, query in enumerate(queries):
+        cache.add(query, position, "bench")
+    add_seconds = time.perf_counter() - start
+    cache.find(queries[0], "bench")  # Fits IDF outside the timed lookups
+
+    hit_times, miss_times = [], []
+    for _ in range(lookups):
+        words = rng.choice(queries).split()
+        rng.shuffle(words)  # Reworded: same content words, different order
+        start = time.perf_counter()
+        cache.find(" ".join(words), "bench")
+        hit_times.append(time.perf_counter() - start)
+
+        query = " ".join(rng.choices(vocabulary, k=25))
+        start = time.perf_counter()
+        cache.find(query, "bench")
+        miss_times.append(time.perf_counter() - start)
+
+    return {
+        "semantic.add_us": round(add_seconds / len(queries) * 1e6, 3),
+        "semantic.lookup_hit_p50_us": round(statistics.median(hit_times) * 1e6, 3),
+        "semantic.lookup_hit_p95_us": round(_p95(hit_times) * 1e6, 3),
+        "semantic.lookup_miss_p50_us": round(statistics.median(miss_times) * 1e6, 3)
+    }
+
+
+def bench_history(item_counts, repeats: int) -> dict:
+    """render_history_page with a pre-filled history store"""
+    from utils.history_store import build_history_item, get_history_store
+
+    store = get_history_store()
+    response = "Observational analysis. " * 120
+    metrics = {}
+    for count in item_counts:
+        owner = f"bench-history-{count}"
+        item = build_history_item(SYMPTOMS, response, "Text Only", "English", "Gemini 2.5 Flash-Lite", 4600)
+        for offset in range(0, count, 1000):
+            if store is not None:
+                store.add_many(owner, [item] * min(1000, count - offset))
+        if store is not None:
+            store.flush()
+
+        samples = []
+        for _ in range(repeats):
+            from streamlit.testing.v1 import AppTest
+            at = AppTest.from_file(APP_PATH, default_timeout=120)
+            at.session_state["history_owner"] = owner
+            at.session_state["current_page"] = "history"
+            start = time.perf_counter()
+            at.run()
+            samples.append(time.perf_counter() - start)
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+        metrics[f"history.render_{count}_items_ms"] = _median_ms(samples)
+    return metrics
+
+
+def bench_memory(sessions: int) -> dict:
+    """Peak traced memory during one analysis and memory retained per live session"""
+    # One-off lazy initialisation in Streamlit is not per-session memory
+    _new_session()
+    gc.collect()
+    tracemalloc.start()
+    live = []
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        at = _new_session()
+        tracemalloc.reset_peak()
+        _click_generate(at, SYMPTOMS)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        live.append(at)
+
+        for index in range(1, sessions):
+            at = _new_session()
+            _click_generate(at, f"{SYMPTOMS} ({index})")
+            live.append(at)
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "memory.analysis_peak_kb": round(peak / 1024, 1),
+        "memory.retained_per_session_kb": round(retained / len(live) / 1024, 1)
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """Print metric changes; return the names that regressed beyond threshold"""
+    regressions = []
+    print(f"\n{'metric':<52}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, value in current["metrics"].items():
+        old = baseline.get("metrics", {}).get(name)
+        if old is None:
+            continue
+        change = (value - old) / old if old else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  <- regression"
+        print(f"{name:<52}{old:>12.2f}{value:>12.2f}{change:>8.0%}{flag}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+    parser.add_argument("--quick", action="store_true", help="Fewer repeats and smaller histories")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if any metric regressed")
+    args = parser.parse_args(argv)
+
+    repeats = 2 if args.quick else 5
+    commit = _git_commit()
+    output = args.output or os.path.join(REPO_ROOT, "benchmarks", "results", f"{commit}.json")
+    output = os.path.abspath(output)
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    sys.path.insert(0, REPO_ROOT)
+    # Databases and caches use relative paths; keep them out of the working tree
+    workdir = tempfile.mkdtemp(prefix="medivision-bench-")
+    if os.path.isdir(os.path.join(REPO_ROOT, ".streamlit")):
+        # Streamlit reads .streamlit/config.toml from the working directory
+        shutil.copytree(os.path.join(REPO_ROOT, ".streamlit"), os.path.join(workdir, ".streamlit"))
+    os.chdir(workdir)
+
+    from benchmarks.fake_backend import FakeGenerativeModel, install_fake_backend
+    model = FakeGenerativeModel(first_token_latency=0.2, chunk_interval=0.002, output_chars=4096 * 4, chunk_chars=80)
+    install_fake_backend(model)
+    probe = _RenderProbe()
+
+    metrics = {}
+    sections = (
+        ("startup", lambda: bench_startup(3 if args.quick else 5)),
+        ("payload", bench_payload),
+        ("analysis", lambda: bench_analysis(model, probe, repeats)),
+        ("prompt", lambda: bench_prompt(repeats)),
+        ("history", lambda: bench_history([100, 2000] if args.quick else [100, 10000], 3)),
+        ("similar", lambda: bench_similar(100_000)),
+        ("semantic", bench_semantic),
+        ("memory", lambda: bench_memory(3 if args.quick else 10))
+    )
+    for name, run in sections:
+        start = time.perf_counter()
+        section = run()
+        metrics.update(section)
+        print(f"{name}: {time.perf_counter() - start:.1f}s")
+        for metric, value in section.items():
+            print(f"  {metric} = {value}")
+
+    results = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "fake_backend": {
+                "first_token_latency": model.first_token_latency,
+                "chunk_interval": model.chunk_interval,
+                "output_chars": model.output_chars,
+                "chunk_chars": model.chunk_chars
+            }
+        },
+        "metrics": metrics
+    }
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
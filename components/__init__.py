@@ -1,27 +1,40 @@
 """
 __init__.py for components package
+
+Submodules are imported on first attribute access, like the utils package.
 """
 
-from .ui_components import (
-    render_navbar,
-    render_feedback_section,
-    render_model_selector,
-    render_prompt_style_selector,
-    render_regenerate_options
-)
-from .pages import (
-    render_main_page,
-    render_history_page,
-    process_analysis
-)
-
-__all__ = [
-    'render_navbar',
-    'render_feedback_section',
-    'render_model_selector',
-    'render_prompt_style_selector',
-    'render_regenerate_options',
-    'render_main_page',
-    'render_history_page',
-    'process_analysis'
-]
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # UI Components
+    'render_navbar': 'ui_components',
+    'render_feedback_section': 'ui_components',
+    'render_model_selector': 'ui_components',
+    'render_prompt_style_selector': 'ui_components',
+    'render_regenerate_options': 'ui_components',
+    'render_metrics_panel': 'ui_components',
+    # Pages
+    'render_main_page': 'pages',
+    'render_history_page': 'pages',
+    'render_history_item': 'pages',
+    'render_batch_page': 'pages',
+    'process_analysis': 'pages',
+    'process_multilanguage_analysis': 'pages'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 Page components for MediVision AI
 """
 
+import time
 import streamlit as st
 
 
@@ -20,9 +21,19 @@ def render_main_page():
         initialize_session_state,
         get_api_key,
         store_api_key,
-        validate_api_key
+        validate_api_key,
+        api_key_fingerprint,
+        set_history_owner,
+        get_session_value
+    )
+    from config import (
+        APP_TAGLINE,
+        INPUT_MODES,
+        SUPPORTED_LANGUAGES,
+        SUPPORTED_IMAGE_FORMATS,
+        MULTI_LANGUAGE_MAX,
+        MULTI_LANGUAGE_STRATEGIES
     )
-    from config import APP_TAGLINE, INPUT_MODES, SUPPORTED_LANGUAGES, SUPPORTED_IMAGE_FORMATS
     
     # Apply theme
     apply_custom_theme()
@@ -48,6 +59,9 @@ def render_main_page():
             st.sidebar.error("❌ Invalid API key format")
     
     stored_key = get_api_key()
+    if stored_key:
+        # Keep history under a stable per-key identity so it survives restarts
+        set_history_owner(api_key_fingerprint(stored_key))
     
     # Model selector
     selected_model = render_model_selector()
@@ -61,7 +75,24 @@ def render_main_page():
     
     # Language selection
     st.sidebar.markdown("### 🌍 Language")
-    language = st.sidebar.selectbox("Output Language:", SUPPORTED_LANGUAGES, label_visibility="collapsed")
+    multi_language = st.sidebar.checkbox("Multiple languages", help="Get the same analysis in several languages at once")
+    fanout_strategy = None
+    if multi_language:
+        languages = st.sidebar.multiselect(
+            "Output Languages:",
+            SUPPORTED_LANGUAGES,
+            default=["English"],
+            max_selections=MULTI_LANGUAGE_MAX
+        )
+        fanout_strategy = st.sidebar.radio(
+            "Fan-out mode:",
+            list(MULTI_LANGUAGE_STRATEGIES),
+            captions=list(MULTI_LANGUAGE_STRATEGIES.values())
+        )
+        language = languages[0] if languages else "English"
+    else:
+        language = st.sidebar.selectbox("Output Language:", SUPPORTED_LANGUAGES, label_visibility="collapsed")
+        languages = [language]
     
     # Prompt style
     prompt_style = render_prompt_style_selector()
@@ -74,6 +105,14 @@ def render_main_page():
     if st.session_state.current_page == "history":
         render_history_page()
         return
+    elif st.session_state.current_page == "batch":
+        render_batch_page(
+            api_key=stored_key,
+            model_name=selected_model,
+            language=language,
+            prompt_style=prompt_style
+        )
+        return
     else:
         create_gradient_header("MediVision AI 🩺", APP_TAGLINE)
     
@@ -115,6 +154,17 @@ def render_main_page():
             st.error("⚠️ Please enter your Google API key in the sidebar")
         elif not (file_uploaded or user_text):
             st.warning("⚠️ Please provide either text input or upload an image")
+        elif multi_language and len(languages) > 1:
+            process_multilanguage_analysis(
+                api_key=stored_key,
+                model_name=selected_model,
+                user_text=user_text,
+                file_uploaded=file_uploaded,
+                languages=languages,
+                input_mode=option,
+                prompt_style=prompt_style,
+                strategy=fanout_strategy
+            )
         else:
             process_analysis(
                 api_key=stored_key,
@@ -126,8 +176,36 @@ def render_main_page():
                 prompt_style=prompt_style
             )
     
+    # The user asked for a new analysis instead of a similar request's cached one
+    if st.session_state.pop("fresh_analysis", False) and stored_key:
+        process_analysis(
+            api_key=stored_key,
+            model_name=selected_model,
+            user_text=get_session_value("last_user_text", user_text),
+            file_uploaded=st.session_state.get("last_image", file_uploaded),
+            language=language,
+            input_mode=option,
+            prompt_style=prompt_style,
+            reuse_similar=False
+        )
+    
+    # The user accepted the earlier answer offered for a reworded question or similar image
+    accepted_answer = st.session_state.pop("accepted_answer", None)
+    if accepted_answer and stored_key:
+        process_analysis(
+            api_key=stored_key,
+            model_name=selected_model,
+            user_text=get_session_value("last_user_text", user_text),
+            file_uploaded=st.session_state.get("last_image"),
+            language=language,
+            input_mode=option,
+            prompt_style=prompt_style,
+            reuse_similar=False,
+            accepted_answer=accepted_answer
+        )
+    
     # Show regenerate options if response exists
-    if st.session_state.get("current_response"):
+    if get_session_value("current_response"):
         st.markdown("---")
         render_regenerate_options()
         
@@ -136,8 +214,8 @@ def render_main_page():
             process_analysis(
                 api_key=stored_key,
                 model_name=selected_model,
-                user_text=st.session_state.get("last_user_text", user_text),
-                file_uploaded=st.session_state.get("last_file_uploaded", file_uploaded),
+                user_text=get_session_value("last_user_text", user_text),
+                file_uploaded=st.session_state.get("last_image", file_uploaded),
                 language=language,
                 input_mode=option,
                 regenerate_instruction=st.session_state.regenerate_instruction
@@ -153,94 +231,356 @@ def process_analysis(
     language: str,
     input_mode: str,
     prompt_style: str = None,
-    regenerate_instruction: str = None
+    regenerate_instruction: str = None,
+    reuse_similar: bool = True,
+    accepted_answer: str = None
 ):
     """Process medical analysis request"""
+    from utils import request_trace
+    from config import METRICS_DEBUG_PANEL
+    
+    with request_trace("process_analysis") as trace:
+        _run_analysis(
+            api_key, model_name, user_text, file_uploaded, language,
+            input_mode, prompt_style, regenerate_instruction, reuse_similar, accepted_answer
+        )
+    
+    if trace is not None and METRICS_DEBUG_PANEL:
+        from components.ui_components import render_metrics_panel
+        render_metrics_panel(trace)
+
+
+def _request_fresh_analysis():
+    st.session_state.fresh_analysis = True
+
+
+def _accept_similar_answer(cache_key: str):
+    st.session_state.accepted_answer = cache_key
+
+
+def _store_upload(file_uploaded):
+    """Put an uploaded file in the image blob store; sessions keep only the returned ImageRef"""
+    from utils import get_image_blob_store, ImageRef
+    
+    if not file_uploaded or isinstance(file_uploaded, ImageRef):
+        return file_uploaded
+    return get_image_blob_store().put(file_uploaded.getvalue(), file_uploaded.type)
+
+
+def _run_analysis(
+    api_key: str,
+    model_name: str,
+    user_text: str,
+    file_uploaded,
+    language: str,
+    input_mode: str,
+    prompt_style: str = None,
+    regenerate_instruction: str = None,
+    reuse_similar: bool = True,
+    accepted_answer: str = None
+):
     from utils import (
-        initialize_model,
-        generate_response,
+        generate_with_fallback,
+        is_rate_limit_error,
         stream_response,
         validate_response,
         check_safety_block,
         prepare_prompt,
-        estimate_tokens,
+        OutputTokenCounter,
+        estimate_prompt_tokens,
+        resolve_token_usage,
+        get_rate_limiter,
+        RateLimitExceeded,
         calculate_cost,
         update_token_stats,
         add_to_history,
-        format_medical_response,
+        IncrementalMedicalFormatter,
+        StreamingMarkdownRenderer,
         format_markdown_export,
-        get_export_filename
+        get_export_filename,
+        build_cache_key,
+        get_response_cache,
+        replay_response,
+        preprocess_image_async,
+        build_followup_contents,
+        estimate_request_bytes,
+        get_upload_cache,
+        RegenerationSavings,
+        record_regeneration_savings,
+        get_regeneration_savings,
+        format_byte_size,
+        span,
+        get_image_blob_store,
+        compact_prompt_parts,
+        expand_prompt_parts,
+        get_session_value,
+        set_session_value,
+        get_similar_image_index,
+        get_semantic_cache,
+        get_history_owner,
+        STREAM_ERROR_PREFIX
     )
     from config import get_system_prompt
     
-    # Store for regeneration
-    st.session_state.last_user_text = user_text
-    st.session_state.last_file_uploaded = file_uploaded
+    start_time = time.perf_counter()
     
-    # Initialize model
-    with st.spinner("🔄 Initializing AI model..."):
-        model = initialize_model(api_key, model_name)
-    
-    if not model:
-        st.error("❌ Failed to initialize model")
-        return
+    # Store for regeneration
+    image_ref = _store_upload(file_uploaded)
+    set_session_value("last_user_text", user_text)
+    st.session_state.last_image = image_ref
     
-    # Prepare prompt
-    system_prompt = get_system_prompt(language)
+    # Regeneration refines the previous answer as a follow-up turn
+    previous = get_session_value("last_analysis") if regenerate_instruction else None
+    if previous and previous["language"] != language:
+        previous = None
     
     image_data = None
-    if file_uploaded:
-        image_data = file_uploaded.getvalue()
-    
-    prompt_parts = prepare_prompt(
-        system_prompt=system_prompt,
-        user_text=user_text,
-        image_data=image_data,
-        prompt_style=prompt_style,
-        regenerate_instruction=regenerate_instruction
-    )
+    image_mime_type = None
+    image_hash = None
+    similar_index = get_similar_image_index()
+    if previous:
+        previous_parts = expand_prompt_parts(previous["prompt_parts"])
+        prompt_parts = build_followup_contents(previous_parts, previous["response"], regenerate_instruction)
+    else:
+        # Prepare prompt
+        system_prompt = get_system_prompt(language)
+        
+        if image_ref:
+            # Downsample and re-encode off the script thread
+            image_future = preprocess_image_async(
+                get_image_blob_store().get(image_ref), model_name, with_hash=similar_index is not None
+            )
+            with st.spinner("🖼️ Optimizing image..."), span("preprocess_image"):
+                processed_image = image_future.result()
+            image_data = processed_image.data
+            image_mime_type = processed_image.mime_type
+            image_hash = processed_image.perceptual_hash
+            st.caption(processed_image.summary())
+        
+        prompt_parts = prepare_prompt(
+            system_prompt=system_prompt,
+            user_text=user_text,
+            image_data=image_data,
+            prompt_style=prompt_style,
+            regenerate_instruction=regenerate_instruction,
+            image_mime_type=image_mime_type
+        )
+    
+    # Identical requests are answered from the response cache
+    response_cache = get_response_cache()
+    cache_key = None
+    cached_response = None
+    if response_cache is not None:
+        with span("response_cache.get"):
+            cache_key = build_cache_key(
+                model_name=model_name,
+                prompt_parts=prompt_parts,
+                language=language,
+                instruction=regenerate_instruction or prompt_style
+            )
+            cached_response = response_cache.get(cache_key)
+    
+    # The user's own earlier answer is offered, never shown unasked
+    served_accepted = False
+    if cached_response is None and accepted_answer and response_cache is not None:
+        cached_response = response_cache.get(accepted_answer)
+        served_accepted = cached_response is not None
+    
+    # The same film re-photographed or re-cropped hashes a few bits apart
+    similar_context = (get_history_owner(), model_name, language, prompt_style or "", (user_text or "").strip())
+    if cached_response is None and image_hash is not None and similar_index is not None and response_cache is not None and reuse_similar:
+        with span("similar_image.find"):
+            similar_match = similar_index.find(image_hash, similar_context)
+        if similar_match is not None and response_cache.get(similar_match.value) is not None:
+            st.info(
+                f"♻️ This image closely matches one you analyzed before ({similar_match.distance} of 64 hash bits differ). "
+                "Use that analysis, or analyze this image fresh?"
+            )
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button("📄 Use the earlier analysis", on_click=_accept_similar_answer, args=(similar_match.value,))
+            with col2:
+                st.button("🔬 Analyze this image fresh", on_click=_request_fresh_analysis)
+            return
+    
+    # Likewise for a reworded text-only question
+    semantic_cache = get_semantic_cache() if not image_ref and not previous else None
+    semantic_context = (get_history_owner(), model_name, language, prompt_style or "")
+    if cached_response is None and semantic_cache is not None and response_cache is not None and reuse_similar:
+        with span("semantic_cache.find"):
+            semantic_match = semantic_cache.find(user_text, semantic_context)
+        if semantic_match is not None:
+            if response_cache.get(semantic_match.value) is None:
+                semantic_cache.discard(semantic_match)
+            else:
+                st.info(
+                    f"♻️ You asked this before in other words: \"{semantic_match.query}\". "
+                    "Show that answer, or answer this question fresh?"
+                )
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.button("📄 Show the earlier answer", on_click=_accept_similar_answer, args=(semantic_match.value,))
+                with col2:
+                    st.button("🔬 Answer this question anyway", on_click=_request_fresh_analysis)
+                return
+    
+    # Refer to the image by its File API upload instead of sending it again
+    request_parts = prompt_parts
+    reused_upload = False
+    uploaded_bytes = 0
+    upload_cache = get_upload_cache()
+    if previous and cached_response is None and upload_cache is not None:
+        image_part = next((p for p in previous_parts if isinstance(p, dict) and "data" in p), None)
+        if image_part:
+            # The first regeneration of an image uploads it; that upload counts as bytes sent
+            if not upload_cache.has(api_key, image_part["data"]):
+                uploaded_bytes = len(image_part["data"])
+            with st.spinner("📎 Preparing uploaded image..."), span("upload_image"):
+                handle = upload_cache.get(api_key, image_part["data"], image_part["mime_type"])
+            if handle:
+                request_parts = build_followup_contents(
+                    previous_parts, previous["response"], regenerate_instruction, handle.part
+                )
+                reused_upload = True
+    
+    # Queue behind the model's free-tier quota instead of hitting 429s
+    rate_limiter = get_rate_limiter()
+    reservation = None
+    if rate_limiter is not None and cached_response is None:
+        try:
+            reservation = rate_limiter.reserve(api_key, model_name, estimate_prompt_tokens(request_parts))
+        except RateLimitExceeded as e:
+            st.warning(f"⏳ {e}. Please try again shortly or choose another model.")
+            return
+        
+        if reservation.wait_seconds > 0:
+            queue_notice = st.empty()
+            with span("rate_limit_wait"):
+                rate_limiter.wait(
+                    reservation,
+                    on_tick=lambda remaining: queue_notice.info(
+                        f"⏳ Queued for {model_name} free-tier quota, starting in ~{remaining:.0f}s"
+                    )
+                )
+            queue_notice.empty()
     
     # Generate response with streaming
     st.markdown(f"## 🏥 Medical Analysis ({language})")
     st.markdown("---")
     
-    response_placeholder = st.empty()
-    full_response = ""
+    response_renderer = StreamingMarkdownRenderer(st.container())
+    formatter = IncrementalMedicalFormatter()
+    response_chunks = []
+    output_counter = OutputTokenCounter()
     
     try:
         with st.spinner("🔬 Analyzing..."):
-            response = generate_response(model, prompt_parts, stream=True)
+            if cached_response is not None:
+                response = replay_response(cached_response)
+            else:
+                # Retries transient failures and falls back to faster models
+                try:
+                    # Includes the wait for the first chunk (time to first token)
+                    with span("generate_with_fallback"):
+                        response = generate_with_fallback(api_key, model_name, request_parts)
+                except Exception as e:
+                    if is_rate_limit_error(e):
+                        st.error("⏳ The model's free-tier quota is exhausted right now. Please wait a minute or choose another model.")
+                    else:
+                        st.error(f"Generation error: {e}")
+                    response = None
             
             if response:
+                # Format and render only the newly arrived text per chunk
                 for chunk in stream_response(response):
-                    full_response += chunk
-                    formatted_response = format_medical_response(full_response)
-                    response_placeholder.markdown(formatted_response)
+                    response_chunks.append(chunk)
+                    output_counter.add(chunk)
+                    with span("render_chunk"):
+                        response_renderer.write(formatter.feed(chunk))
+                response_renderer.write(formatter.flush())
+                response_renderer.close()
+        
+        full_response = "".join(response_chunks)
+        answered_by = getattr(response, "model_name", model_name)
+        
+        if served_accepted:
+            st.caption("⚡ Your earlier analysis of a similar image" if image_ref else "⚡ Your earlier answer to this question")
+        elif cached_response is not None:
+            st.caption("⚡ Served from cache")
+        elif response is not None:
+            if answered_by != model_name:
+                st.caption(f"🔀 Answered by {answered_by} ({model_name} was unavailable)")
+            else:
+                st.caption(f"🤖 Answered by {answered_by}")
+            retries = [event for event in getattr(response, "events", []) if ": retry " in event]
+            if retries:
+                st.caption(f"🔁 Recovered after {len(retries)} retr{'y' if len(retries) == 1 else 'ies'}")
+            # Fallback answers are not cached under the requested model's key
+            if cache_key and full_response and answered_by == model_name and STREAM_ERROR_PREFIX not in full_response:
+                response_cache.set(cache_key, full_response)
+                if image_hash is not None and similar_index is not None:
+                    similar_index.add(image_hash, cache_key, similar_context)
+                if semantic_cache is not None:
+                    semantic_cache.add(user_text, cache_key, semantic_context)
         
         # Store response
-        st.session_state.current_response = full_response
+        set_session_value("current_response", full_response)
+        
+        if full_response and STREAM_ERROR_PREFIX not in full_response:
+            elapsed_seconds = time.perf_counter() - start_time
+            if previous:
+                if cached_response is None:
+                    # Compare with re-running the full request, image inline
+                    savings = RegenerationSavings(
+                        full_bytes=estimate_request_bytes(previous_parts) + len(regenerate_instruction.encode("utf-8")),
+                        sent_bytes=estimate_request_bytes(request_parts) + uploaded_bytes,
+                        full_seconds=previous["elapsed_seconds"],
+                        regen_seconds=elapsed_seconds,
+                        reused_upload=reused_upload
+                    )
+                    record_regeneration_savings(savings.bytes_saved, savings.seconds_saved)
+                    totals = get_regeneration_savings()
+                    st.caption(
+                        f"{savings.summary()} · session total: {format_byte_size(max(totals['bytes_saved'], 0))} "
+                        f"over {totals['count']} regeneration{'s' if totals['count'] != 1 else ''}"
+                    )
+                # Further refinements build on this answer
+                previous["response"] = full_response
+            else:
+                set_session_value("last_analysis", {
+                    # Inline images become blob references rather than staying in session state
+                    "prompt_parts": compact_prompt_parts(prompt_parts),
+                    "response": full_response,
+                    "language": language,
+                    "elapsed_seconds": elapsed_seconds
+                })
         
-        # Calculate tokens and cost
-        input_tokens = estimate_tokens(str(prompt_parts))
-        output_tokens = estimate_tokens(full_response)
-        total_tokens = input_tokens + output_tokens
-        cost = calculate_cost(input_tokens, output_tokens)
+        # Calculate tokens and cost, preferring the API's usage metadata
+        usage = resolve_token_usage(response, request_parts, output_counter)
+        total_tokens = usage.total_tokens
+        cost = calculate_cost(usage.input_tokens, usage.output_tokens)
+        if reservation is not None:
+            # A fallback model spent its own quota; refund the requested model's estimate
+            rate_limiter.settle(reservation, total_tokens if answered_by == model_name else 0)
+            reservation = None
         
         # Update stats
         update_token_stats(total_tokens, cost)
         
         # Add to history
-        add_to_history(
-            query=user_text or "Image Analysis",
-            response=full_response,
-            input_mode=input_mode,
-            language=language,
-            model=model_name,
-            tokens=total_tokens
-        )
+        with span("add_to_history"):
+            add_to_history(
+                query=user_text or "Image Analysis",
+                response=full_response,
+                input_mode=input_mode,
+                language=language,
+                model=answered_by,
+                tokens=total_tokens
+            )
         
         # Show token info
-        st.info(f"📊 Tokens used: {total_tokens:,} | Estimated cost: ${cost:.4f}")
+        usage_label = {"reported": "", "estimated": " (estimated)", "cache": " (served from cache)"}[usage.source]
+        st.info(f"📊 Tokens used: {total_tokens:,}{usage_label} | Estimated cost: ${cost:.4f}")
         
         # Export button
         st.markdown("---")
@@ -249,7 +589,7 @@ def process_analysis(
             response=full_response,
             input_mode=input_mode,
             language=language,
-            model=model_name
+            model=answered_by
         )
         
         st.download_button(
@@ -266,17 +606,164 @@ def process_analysis(
         
     except Exception as e:
         st.error(f"❌ An error occurred during analysis: {e}")
+    finally:
+        if reservation is not None:
+            # Failed or stopped before usage was known; refund the estimate
+            rate_limiter.settle(reservation, 0)
+
+
+def process_multilanguage_analysis(
+    api_key: str,
+    model_name: str,
+    user_text: str,
+    file_uploaded,
+    languages: list,
+    input_mode: str,
+    prompt_style: str = None,
+    strategy: str = "Translate"
+):
+    """Process one analysis into several languages concurrently, one tab each"""
+    from utils import (
+        prepare_prompt,
+        preprocess_image_async,
+        fan_out_languages,
+        choose_pivot_language,
+        calculate_cost,
+        update_token_stats,
+        add_to_history,
+        IncrementalMedicalFormatter,
+        StreamingMarkdownRenderer,
+        format_markdown_export,
+        get_export_filename,
+        get_image_blob_store,
+        compact_prompt_parts,
+        set_session_value
+    )
+    from config import get_system_prompt, TRANSLATION_MODEL
+    
+    image_ref = _store_upload(file_uploaded)
+    set_session_value("last_user_text", user_text)
+    st.session_state.last_image = image_ref
+    start_time = time.perf_counter()
+    
+    image_data = None
+    image_mime_type = None
+    if image_ref:
+        image_future = preprocess_image_async(get_image_blob_store().get(image_ref), model_name)
+        with st.spinner("🖼️ Optimizing image..."):
+            processed_image = image_future.result()
+        image_data = processed_image.data
+        image_mime_type = processed_image.mime_type
+        st.caption(processed_image.summary())
+    
+    def build_prompt(language: str) -> list:
+        return prepare_prompt(
+            system_prompt=get_system_prompt(language),
+            user_text=user_text,
+            image_data=image_data,
+            prompt_style=prompt_style,
+            image_mime_type=image_mime_type
+        )
+    
+    st.markdown("## 🏥 Medical Analysis")
+    if strategy == "Parallel":
+        st.caption(f"🌍 {len(languages)} analyses running in parallel on {model_name}")
+    else:
+        pivot = choose_pivot_language(languages)
+        st.caption(f"🌍 Analyzing in {pivot} on {model_name}, translating with {TRANSLATION_MODEL} as it streams")
+    st.markdown("---")
+    
+    tabs = dict(zip(languages, st.tabs(languages)))
+    renderers = {language: StreamingMarkdownRenderer(tabs[language].container()) for language in languages}
+    formatters = {language: IncrementalMedicalFormatter() for language in languages}
+    chunks = {language: [] for language in languages}
+    results = {}
+    
+    try:
+        with st.spinner("🔬 Analyzing..."):
+            for event in fan_out_languages(api_key, model_name, languages, build_prompt, strategy):
+                language = event.language
+                if event.text:
+                    chunks[language].append(event.text)
+                    renderers[language].write(formatters[language].feed(event.text))
+                if event.done:
+                    renderers[language].write(formatters[language].flush())
+                    renderers[language].close()
+                    results[language] = event
+    except Exception as e:
+        st.error(f"❌ An error occurred during analysis: {e}")
+        return
+    
+    total_tokens = 0
+    total_cost = 0.0
+    for language in languages:
+        event = results[language]
+        full_response = "".join(chunks[language]).strip()
+        with tabs[language]:
+            if event.error:
+                st.error(f"Generation error: {event.error}")
+                continue
+            if not full_response:
+                st.warning("⚠️ No output was produced for this language")
+                continue
+            
+            tokens = event.input_tokens + event.output_tokens
+            cost = calculate_cost(event.input_tokens, event.output_tokens)
+            total_tokens += tokens
+            total_cost += cost
+            st.caption(f"🤖 Answered by {event.model_name} · 📊 {tokens:,} tokens · ${cost:.4f}")
+            
+            add_to_history(
+                query=user_text or "Image Analysis",
+                response=full_response,
+                input_mode=input_mode,
+                language=language,
+                model=event.model_name,
+                tokens=tokens
+            )
+            st.download_button(
+                label=f"📥 Download {language} Report",
+                data=format_markdown_export(
+                    query=user_text or "Image Analysis",
+                    response=full_response,
+                    input_mode=input_mode,
+                    language=language,
+                    model=event.model_name
+                ),
+                file_name=get_export_filename(f"MediVision_Analysis_{language}"),
+                mime="text/markdown",
+                use_container_width=True,
+                key=f"download_{language}"
+            )
+    
+    update_token_stats(total_tokens, total_cost)
+    st.info(f"📊 Tokens used: {total_tokens:,} across {len(languages)} languages | Estimated cost: ${total_cost:.4f}")
+    
+    pivot = choose_pivot_language(languages)
+    if not results[pivot].error:
+        response = "".join(chunks[pivot]).strip()
+        set_session_value("current_response", response)
+        # Refinements continue from the pivot analysis
+        set_session_value("last_analysis", {
+            "prompt_parts": compact_prompt_parts(build_prompt(pivot)),
+            "response": response,
+            "language": pivot,
+            "elapsed_seconds": time.perf_counter() - start_time
+        })
 
 
 def render_history_page():
-    """Render history page with all conversations"""
-    from utils import get_history, create_gradient_header
+    """Render history page one page at a time"""
+    from utils import get_history, get_history_stats, create_gradient_header
+    from config import HISTORY_PAGE_SIZE
     
     create_gradient_header("📜 Analysis History", "Review your past medical analyses")
     
-    history = get_history()
+    # Aggregates come from counters maintained by the history store
+    stats = get_history_stats()
+    total_items = stats["count"]
     
-    if not history:
+    if not total_items:
         st.info("📭 No analysis history yet. Start by creating your first analysis!")
         if st.button("➕ Create New Analysis"):
             st.switch_page("app.py")
@@ -287,61 +774,203 @@ def render_history_page():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Analyses", len(history))
+        st.metric("Total Analyses", f"{total_items:,}")
     
     with col2:
-        total_tokens = sum(item.get("tokens", 0) for item in history)
-        st.metric("Total Tokens", f"{total_tokens:,}")
+        st.metric("Total Tokens", f"{stats['total_tokens']:,}")
     
     with col3:
-        languages = set(item.get("language", "Unknown") for item in history)
-        st.metric("Languages Used", len(languages))
+        st.metric("Languages Used", len(stats["languages"]))
     
     with col4:
-        models = set(item.get("model", "Unknown") for item in history)
-        st.metric("Models Used", len(models))
+        st.metric("Models Used", len(stats["models"]))
     
     st.markdown("---")
     st.markdown("### 📋 Conversation History")
     
-    # Display each history item
-    for idx, item in enumerate(history):
-        with st.expander(
-            f"**{item['chat_name']}** - {item['timestamp']}",
-            expanded=(idx == 0)
-        ):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"**Model:** {item['model']}")
-                st.markdown(f"**Language:** {item['language']}")
-                st.markdown(f"**Input Mode:** {item['input_mode']}")
-            
-            with col2:
-                st.metric("Tokens", f"{item['tokens']:,}")
-            
-            st.markdown("---")
-            st.markdown("**Query:**")
-            st.info(item['query'])
-            
-            st.markdown("**Analysis:**")
-            st.markdown(item['response'])
-            
-            # Export this item
-            from utils import format_markdown_export, get_export_filename
-            export_content = format_markdown_export(
-                query=item['query'],
-                response=item['response'],
-                input_mode=item['input_mode'],
-                language=item['language'],
-                model=item['model'],
-                timestamp=item['timestamp']
-            )
-            
+    # Pagination
+    total_pages = max(1, -(-total_items // HISTORY_PAGE_SIZE))
+    page = min(st.session_state.get("history_page", 0), total_pages - 1)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("⬅️ Newer", key="history_prev", disabled=page == 0, use_container_width=True):
+            st.session_state.history_page = page - 1
+            st.rerun()
+    with col2:
+        st.caption(f"Page {page + 1} of {total_pages}")
+    with col3:
+        if st.button("Older ➡️", key="history_next", disabled=page >= total_pages - 1, use_container_width=True):
+            st.session_state.history_page = page + 1
+            st.rerun()
+    
+    # Only the current page is loaded
+    history = get_history(offset=page * HISTORY_PAGE_SIZE, limit=HISTORY_PAGE_SIZE)
+    selected_id = st.session_state.get("history_selected")
+    
+    for item in history:
+        col1, col2, col3 = st.columns([5, 1, 1])
+        
+        with col1:
+            st.markdown(f"**{item['chat_name']}** - {item['timestamp']}")
+            st.caption(f"{item['model']} · {item['language']} · {item['input_mode']}")
+        
+        with col2:
+            st.metric("Tokens", f"{item['tokens']:,}")
+        
+        with col3:
+            is_open = item["id"] == selected_id
+            if st.button("🔼 Hide" if is_open else "👁 View", key=f"history_view_{item['id']}", use_container_width=True):
+                selected_id = None if is_open else item["id"]
+                st.session_state.history_selected = selected_id
+                st.rerun()
+        
+        # Full response and export only for the opened item
+        if item["id"] == selected_id:
+            render_history_item(item)
+        
+        st.markdown("---")
+
+
+def render_history_item(item: dict):
+    """Render one history entry; the export is built only on request"""
+    from utils import format_markdown_export, get_export_filename
+    
+    st.markdown("**Query:**")
+    st.info(item['query'])
+    
+    st.markdown("**Analysis:**")
+    st.markdown(item['response'])
+    
+    if st.session_state.get("history_export_id") != item["id"]:
+        if st.button("📄 Prepare Download", key=f"prepare_{item['id']}"):
+            st.session_state.history_export_id = item["id"]
+            st.rerun()
+        return
+    
+    export_content = format_markdown_export(
+        query=item['query'],
+        response=item['response'],
+        input_mode=item['input_mode'],
+        language=item['language'],
+        model=item['model'],
+        timestamp=item['timestamp']
+    )
+    
+    st.download_button(
+        label="📥 Download This Analysis",
+        data=export_content,
+        file_name=get_export_filename(f"MediVision_{item['id']}"),
+        mime="text/markdown",
+        key=f"download_{item['id']}"
+    )
+
+
+def render_batch_page(api_key: str, model_name: str, language: str, prompt_style: str = None):
+    """Render batch analysis page for many images or symptom texts"""
+    import os
+    import tempfile
+    from utils import (
+        create_gradient_header,
+        initialize_model,
+        update_token_stats,
+        calculate_cost,
+        BatchCase,
+        run_batch,
+        open_result_writer,
+        load_cases_from_csv,
+        check_unique_case_ids
+    )
+    from config import BATCH_DEFAULT_CONCURRENCY, BATCH_MAX_CONCURRENCY, BATCH_OUTPUT_FORMATS, SUPPORTED_IMAGE_FORMATS
+    
+    create_gradient_header("📦 Batch Analysis", "Run many cases with the same model, language and style")
+    
+    st.caption(f"🤖 {model_name} · 🌍 {language} · settings from the sidebar apply to every case")
+    
+    source = st.radio("Cases from:", ["Images", "CSV of symptom texts"], horizontal=True)
+    
+    cases = []
+    if source == "Images":
+        uploaded_files = st.file_uploader(
+            "Upload medical images",
+            type=SUPPORTED_IMAGE_FORMATS,
+            accept_multiple_files=True
+        )
+        shared_text = st.text_area("Optional context applied to every image:", height=80)
+        for uploaded in uploaded_files or []:
+            cases.append(BatchCase(
+                case_id=uploaded.name,
+                user_text=shared_text,
+                image_data=uploaded.getvalue(),
+                image_name=uploaded.name
+            ))
+        try:
+            check_unique_case_ids(cases)
+        except ValueError as e:
+            st.error(f"❌ {e}: upload each file name once")
+            cases = []
+    else:
+        csv_file = st.file_uploader("Upload CSV with a 'text' column (optional 'case_id')", type=["csv"])
+        if csv_file:
+            try:
+                cases = load_cases_from_csv(csv_file.getvalue().decode("utf-8-sig"))
+            except ValueError as e:
+                st.error(f"❌ {e}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        max_concurrency = st.slider("Concurrent requests", 1, BATCH_MAX_CONCURRENCY, BATCH_DEFAULT_CONCURRENCY)
+    with col2:
+        output_format = st.selectbox("Output format", BATCH_OUTPUT_FORMATS)
+    
+    st.markdown(f"**{len(cases)}** case(s) ready")
+    
+    if st.button("🚀 Run Batch", type="primary", disabled=not cases):
+        if not api_key:
+            st.error("⚠️ Please enter your Google API key in the sidebar")
+            return
+        
+        model = initialize_model(api_key, model_name)
+        if not model:
+            st.error("❌ Failed to initialize model")
+            return
+        
+        output_dir = tempfile.mkdtemp(prefix="medivision_batch_")
+        output_path = os.path.join(output_dir, f"batch_results.{output_format.lower()}")
+        
+        progress = st.progress(0.0, text="Starting...")
+        status_table = st.empty()
+        rows = []
+        failures = 0
+        total_input = total_output = 0
+        
+        with open_result_writer(output_path, output_format, model_name=model_name, language=language) as writer:
+            for done, result in enumerate(
+                run_batch(cases, model, model_name, language, prompt_style, max_concurrency, api_key=api_key), start=1
+            ):
+                writer.write(result)
+                failures += result.status != "ok"
+                total_input += result.input_tokens
+                total_output += result.output_tokens
+                rows.insert(0, {
+                    "case": result.case_id,
+                    "status": "✅" if result.status == "ok" else f"❌ {result.error}",
+                    "seconds": result.elapsed_seconds,
+                    "tokens": result.input_tokens + result.output_tokens
+                })
+                progress.progress(done / len(cases), text=f"{done}/{len(cases)} done · {failures} failed")
+                status_table.dataframe(rows[:50], use_container_width=True)
+        
+        update_token_stats(total_input + total_output, calculate_cost(total_input, total_output))
+        st.session_state.batch_output_path = output_path
+        st.success(f"✅ Batch finished: {len(cases) - failures} succeeded, {failures} failed")
+    
+    output_path = st.session_state.get("batch_output_path")
+    if output_path and os.path.exists(output_path):
+        with open(output_path, "rb") as f:
             st.download_button(
-                label="📥 Download This Analysis",
-                data=export_content,
-                file_name=get_export_filename(f"MediVision_{idx}"),
-                mime="text/markdown",
-                key=f"download_{idx}"
+                label="📥 Download Batch Results",
+                data=f.read(),
+                file_name=os.path.basename(output_path),
+                use_container_width=True
             )
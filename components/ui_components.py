@@ -14,7 +14,7 @@ def render_navbar():
     display_stats = get_token_stats_display(stats["total_tokens"], stats["total_cost"])
     
     # Navigation tabs
-    col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
+    col1, col2, col5, col3, col4 = st.columns([1, 1, 1, 2, 2])
     
     with col1:
         if st.button("🏠 Home", key="nav_home", use_container_width=True):
@@ -28,6 +28,11 @@ def render_navbar():
             st.session_state.current_page = "history"
             st.rerun()
     
+    with col5:
+        if st.button("📦 Batch", key="nav_batch", use_container_width=True):
+            st.session_state.current_page = "batch"
+            st.rerun()
+    
     with col3:
         st.markdown(f'<div style="text-align: center; padding: 8px;"><div style="color: #b4b4b4; font-size: 10px;">TOKENS</div><div style="color: #ffffff; font-weight: 600;">{display_stats["tokens"]}</div></div>', unsafe_allow_html=True)
     
@@ -172,3 +177,37 @@ def render_regenerate_options():
 
 
 
+
+
+def render_metrics_panel(trace):
+    """Render the timing breakdown of one request and the process-wide latency percentiles"""
+    from utils import get_metrics_registry
+    
+    with st.expander(f"⏱️ Timing breakdown ({trace.duration * 1000:.0f} ms)", expanded=False):
+        rows = [
+            {
+                "Span": row["span"],
+                "Calls": row["calls"],
+                "Starts at (ms)": round(row["start_ms"], 1),
+                "Total (ms)": round(row["total_ms"], 1),
+                "Share": f"{row['total_ms'] / (trace.duration * 1000):.0%}" if trace.duration else "-"
+            }
+            for row in trace.breakdown()
+        ]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        
+        st.caption("All requests since the server started")
+        st.dataframe(
+            [
+                {
+                    "Span": row["span"],
+                    "Count": row["count"],
+                    "p50 (ms)": round(row["p50_ms"], 1),
+                    "p95 (ms)": round(row["p95_ms"], 1),
+                    "p99 (ms)": round(row["p99_ms"], 1)
+                }
+                for row in get_metrics_registry().summary()
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
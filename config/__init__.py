@@ -18,9 +18,77 @@ __all__ = [
     'INPUT_MODES',
     'SUPPORTED_IMAGE_FORMATS',
     'MAX_HISTORY_ITEMS',
+    'API_KEY_CACHE_TTL_SECONDS',
     'TOKEN_COST',
     'THEME_COLORS',
+    'RESPONSE_CACHE_ENABLED',
+    'RESPONSE_CACHE_MAX_BYTES',
+    'RESPONSE_CACHE_TTL_SECONDS',
+    'RESPONSE_CACHE_DB_PATH',
+    'RESPONSE_CACHE_REPLAY_CHUNK_CHARS',
+    'SIMILAR_IMAGE_ENABLED',
+    'SIMILAR_IMAGE_HASH',
+    'SIMILAR_IMAGE_MAX_DISTANCE',
+    'SIMILAR_IMAGE_INDEX_MAX_ENTRIES',
+    'SEMANTIC_CACHE_ENABLED',
+    'SEMANTIC_CACHE_THRESHOLD',
+    'SEMANTIC_CACHE_FEATURES',
+    'SEMANTIC_CACHE_MAX_ENTRIES',
+    'CLIENT_POOL_MAX_MODELS',
+    'CLIENT_POOL_IDLE_TTL_SECONDS',
+    'IMAGE_PREPROCESS_ENABLED',
+    'IMAGE_DEFAULT_MAX_PIXELS',
+    'IMAGE_JPEG_QUALITY',
+    'IMAGE_PREPROCESS_WORKERS',
+    'IMAGE_BLOB_MEMORY_BYTES',
+    'IMAGE_BLOB_SPILL_DIR',
+    'IMAGE_BLOB_DISK_MAX_BYTES',
+    'SESSION_MEMORY_BUDGET_BYTES',
+    'SESSION_OFFLOAD_DIR',
+    'SESSION_OFFLOAD_IDLE_SECONDS',
+    'HISTORY_BACKEND',
+    'HISTORY_DB_PATH',
+    'HISTORY_PAGE_SIZE',
+    'HISTORY_WRITE_BATCH_SIZE',
+    'HISTORY_FLUSH_INTERVAL_SECONDS',
+    'CHAT_TITLE_LEXICON_PATH',
+    'CHAT_TITLE_MAX_TERMS',
+    'BATCH_DEFAULT_CONCURRENCY',
+    'BATCH_MAX_CONCURRENCY',
+    'BATCH_OUTPUT_FORMATS',
+    'ASYNC_REQUEST_TIMEOUT_SECONDS',
+    'ASYNC_CHUNK_TIMEOUT_SECONDS',
+    'RATE_LIMIT_ENABLED',
+    'RATE_LIMIT_DB_PATH',
+    'RATE_LIMIT_MAX_WAIT_SECONDS',
+    'RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE',
+    'RETRY_MAX_ATTEMPTS',
+    'RETRY_BASE_DELAY_SECONDS',
+    'RETRY_MAX_DELAY_SECONDS',
+    'HEDGE_ENABLED',
+    'HEDGE_LATENCY_BUDGET_SECONDS',
+    'MODEL_FALLBACK_CHAINS',
+    'MULTI_LANGUAGE_MAX',
+    'MULTI_LANGUAGE_PIVOT',
+    'TRANSLATION_MODEL',
+    'TRANSLATION_SEGMENT_CHARS',
+    'MULTI_LANGUAGE_STRATEGIES',
+    'REGENERATION_REUSE_UPLOADS',
+    'UPLOAD_HANDLE_TTL_SECONDS',
+    'UPLOAD_WAIT_SECONDS',
+    'API_HOST',
+    'API_PORT',
+    'API_WORKERS',
+    'API_MAX_CONCURRENT_ANALYSES',
+    'API_MAX_UPLOAD_BYTES',
+    'API_ANALYSIS_TTL_SECONDS',
+    'API_MAX_STORED_ANALYSES',
+    'METRICS_ENABLED',
+    'METRICS_DEBUG_PANEL',
+    'METRICS_DUMP_PATH',
+    'METRICS_HISTOGRAM_BUCKETS',
     'get_system_prompt',
+    'get_translation_prompt',
     'PROMPT_STYLES',
     'REGENERATION_OPTIONS',
     'EXAMPLE_TEMPLATES'
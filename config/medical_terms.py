@@ -0,0 +1,948 @@
+"""
+Medical terms recognized in queries when generating chat titles
+
+Terms are matched case-insensitively on word boundaries, allowing a plural
+"s"/"es" (Chinese and Japanese, written without spaces, match anywhere;
+Korean needs only a word start, since particles attach to the end). They
+are shown in titles as written here; all-lowercase terms are title-cased.
+Multi-word terms win over the single words they contain. More terms can be
+loaded from CHAT_TITLE_LEXICON_PATH.
+"""
+
+MEDICAL_TERMS = {
+    "English": [
+        # Anatomy
+        "skull", "scalp", "forehead", "eye", "eyelid", "ear", "nose", "sinus",
+        "mouth", "lip", "tongue", "tooth", "teeth", "gum", "jaw", "throat", "tonsil", "larynx",
+        "neck", "spine", "cervical spine", "lumbar spine", "thoracic spine", "vertebra", "disc",
+        "shoulder", "collarbone", "clavicle", "scapula", "arm", "upper arm", "elbow", "forearm",
+        "wrist", "hand", "palm", "finger", "thumb", "nail", "chest", "rib", "breast", "sternum",
+        "back", "lower back", "upper back", "abdomen", "stomach", "belly", "navel", "groin",
+        "pelvis", "hip", "buttock", "thigh", "leg", "knee", "kneecap", "shin", "calf", "ankle",
+        "foot", "heel", "toe", "skin", "scalp skin", "muscle", "tendon", "ligament",
+        "cartilage", "joint", "bone", "heart", "lung", "brain", "liver", "kidney", "bladder",
+        "gallbladder", "pancreas", "spleen", "intestine", "colon", "bowel", "rectum", "anus",
+        "esophagus", "thyroid", "prostate", "uterus", "ovary", "testicle", "lymph node",
+        "artery", "vein", "aorta", "nerve", "retina", "cornea", "eardrum", "appendix",
+        "trachea", "bronchus", "diaphragm", "meniscus", "achilles tendon", "rotator cuff",
+        # Symptoms
+        "pain", "ache", "chest pain", "back pain", "lower back pain", "neck pain", "joint pain",
+        "abdominal pain", "stomach ache", "headache", "migraine", "toothache", "earache",
+        "sore throat", "fever", "high fever", "chills", "sweating", "night sweats", "fatigue",
+        "tiredness", "weakness", "dizziness", "vertigo", "fainting", "numbness", "tingling",
+        "cough", "dry cough", "wet cough", "wheezing", "shortness of breath",
+        "difficulty breathing", "breathlessness", "runny nose", "congestion", "sneezing",
+        "nausea", "vomiting", "diarrhea", "diarrhoea", "constipation", "bloating", "heartburn",
+        "indigestion", "loss of appetite", "weight loss", "weight gain", "thirst",
+        "frequent urination", "painful urination", "blood in urine", "blood in stool",
+        "swelling", "bruise", "bruising", "bleeding", "nosebleed", "itching", "itch", "rash",
+        "hives", "redness", "blister", "lump", "bump", "discharge", "palpitations",
+        "irregular heartbeat", "stiffness", "cramp", "spasm", "tremor", "seizure",
+        "confusion", "memory loss", "insomnia", "anxiety", "depression", "blurred vision",
+        "double vision", "hearing loss", "tinnitus", "hoarseness", "jaundice", "limp",
+        "hair loss", "dry skin", "dark spot", "mole", "wart", "ulcer", "sore", "scar",
+        "inflammation", "tenderness", "burning sensation",
+        # Conditions
+        "fracture", "broken bone", "hairline fracture", "stress fracture", "dislocation",
+        "sprain", "strain", "injury", "sports injury", "wound", "laceration", "burn",
+        "bite", "sting", "infection", "abscess", "cellulitis", "pneumonia", "bronchitis",
+        "asthma", "copd", "tuberculosis", "covid", "covid-19", "influenza", "flu", "cold",
+        "common cold", "sinusitis", "tonsillitis", "strep throat", "ear infection",
+        "conjunctivitis", "pink eye", "cataract", "glaucoma", "stye", "allergy",
+        "allergic reaction", "anaphylaxis", "eczema", "psoriasis", "acne", "dermatitis",
+        "fungal infection", "ringworm", "athlete's foot", "scabies", "shingles", "chickenpox",
+        "measles", "herpes", "cold sore", "impetigo", "melanoma", "skin cancer", "cancer",
+        "tumor", "tumour", "cyst", "polyp", "nodule", "lesion", "benign", "malignant",
+        "metastasis", "lymphoma", "leukemia", "breast cancer", "lung cancer", "diabetes",
+        "type 1 diabetes", "type 2 diabetes", "hypertension", "high blood pressure",
+        "low blood pressure", "hypotension", "heart attack", "heart failure", "angina",
+        "arrhythmia", "atrial fibrillation", "stroke", "aneurysm", "blood clot",
+        "deep vein thrombosis", "embolism", "varicose veins", "anemia", "anaemia",
+        "high cholesterol", "obesity", "thyroid disorder", "hypothyroidism",
+        "hyperthyroidism", "goiter", "kidney stone", "gallstone", "urinary tract infection",
+        "uti", "appendicitis", "gastritis", "acid reflux", "gerd", "irritable bowel syndrome",
+        "ibs", "crohn's disease", "ulcerative colitis", "hemorrhoids", "hernia", "hepatitis",
+        "cirrhosis", "fatty liver", "pancreatitis", "arthritis", "osteoarthritis",
+        "rheumatoid arthritis", "gout", "osteoporosis", "scoliosis", "herniated disc",
+        "slipped disc", "sciatica", "tendonitis", "tendinitis", "bursitis", "carpal tunnel",
+        "plantar fasciitis", "torn ligament", "acl tear", "meniscus tear", "frozen shoulder",
+        "tennis elbow", "whiplash", "concussion", "head injury", "epilepsy", "dementia",
+        "alzheimer's", "parkinson's", "multiple sclerosis", "neuropathy", "bell's palsy",
+        "pregnancy", "miscarriage", "endometriosis", "pcos", "menstrual cramps",
+        "dehydration", "heat stroke", "hypothermia", "frostbite", "sepsis", "edema",
+        "oedema", "effusion", "pleural effusion", "pneumothorax", "emphysema", "fibrosis",
+        "calcification", "opacity", "consolidation", "degeneration",
+        # Imaging, tests and procedures
+        "x-ray", "xray", "chest x-ray", "radiograph", "scan", "CT", "CT Scan", "MRI",
+        "MRI Scan", "PET Scan", "ultrasound", "sonogram", "echocardiogram", "ECG", "EKG",
+        "EEG", "mammogram", "endoscopy", "colonoscopy", "biopsy", "blood test", "urine test",
+        "blood sugar", "HbA1c", "cholesterol test", "dental x-ray", "bone density scan",
+        "angiogram", "doppler", "fluoroscopy", "surgery", "stitches", "splint", "vaccination",
+        "vaccine", "injection", "prescription", "medication", "antibiotic", "physiotherapy",
+        "physical therapy", "dialysis", "chemotherapy", "radiotherapy", "transplant",
+        # Infections
+        "mumps", "rubella", "whooping cough", "pertussis", "diphtheria", "tetanus", "polio",
+        "rabies", "malaria", "dengue", "dengue fever", "yellow fever", "typhoid",
+        "typhoid fever", "cholera", "leprosy", "lyme disease", "syphilis", "gonorrhea",
+        "gonorrhoea", "chlamydia", "HIV", "hepatitis a", "hepatitis b", "hepatitis c",
+        "mononucleosis", "glandular fever", "scarlet fever", "rheumatic fever", "meningitis",
+        "encephalitis", "tick bite", "zika", "ebola", "mpox", "monkeypox", "smallpox",
+        "hand foot and mouth disease", "norovirus", "rotavirus", "salmonella", "giardiasis",
+        "toxoplasmosis", "candidiasis", "thrush", "yeast infection", "bacterial vaginosis",
+        "trichomoniasis", "genital warts", "genital herpes", "HPV", "head lice", "lice",
+        "pinworms", "tapeworm", "hookworm", "roundworm", "schistosomiasis", "leishmaniasis",
+        "chagas disease", "histoplasmosis", "aspergillosis", "cryptococcosis",
+        "pneumocystis pneumonia", "MRSA", "clostridium difficile", "septic shock", "bacteremia",
+        "osteomyelitis", "septic arthritis", "endocarditis", "myocarditis", "pericarditis",
+        "pyelonephritis", "cystitis", "urethritis", "prostatitis", "epididymitis", "orchitis",
+        "pelvic inflammatory disease", "cervicitis", "vaginitis", "mastitis", "otitis media",
+        "otitis externa", "swimmer's ear", "labyrinthitis", "pharyngitis", "laryngitis",
+        "epiglottitis", "croup", "bronchiolitis", "RSV", "legionnaires' disease", "q fever",
+        "brucellosis", "anthrax", "plague", "tularemia", "leptospirosis", "cat scratch disease",
+        "tinea", "jock itch", "folliculitis", "carbuncle", "erysipelas",
+        "necrotizing fasciitis", "gangrene", "molluscum contagiosum", "fifth disease",
+        "roseola", "long covid", "bird flu", "swine flu", "SARS", "MERS", "viral infection",
+        "bacterial infection", "wound infection", "chest infection", "respiratory infection",
+        "upper respiratory infection", "lower respiratory tract infection",
+        "sexually transmitted infection", "STI", "STD", "hand infection", "eye infection",
+        "skin infection",
+        # Heart and circulation
+        "coronary artery disease", "coronary heart disease", "myocardial infarction",
+        "cardiac arrest", "cardiomyopathy", "hypertrophic cardiomyopathy",
+        "dilated cardiomyopathy", "congestive heart failure", "heart murmur",
+        "mitral valve prolapse", "mitral regurgitation", "mitral stenosis", "aortic stenosis",
+        "aortic regurgitation", "heart valve disease", "tachycardia", "bradycardia",
+        "supraventricular tachycardia", "ventricular tachycardia", "ventricular fibrillation",
+        "atrial flutter", "heart block", "long qt syndrome", "wolff-parkinson-white syndrome",
+        "peripheral artery disease", "atherosclerosis", "arteriosclerosis", "aortic aneurysm",
+        "abdominal aortic aneurysm", "aortic dissection", "pulmonary embolism",
+        "pulmonary hypertension", "thrombosis", "thrombophlebitis", "phlebitis", "vasculitis",
+        "raynaud's", "raynaud's phenomenon", "orthostatic hypotension", "syncope",
+        "transient ischemic attack", "mini-stroke", "ischemic stroke", "hemorrhagic stroke",
+        "brain hemorrhage", "brain bleed", "subarachnoid hemorrhage", "cerebral aneurysm",
+        "brain aneurysm", "carotid stenosis", "congenital heart defect", "hole in the heart",
+        "atrial septal defect", "ventricular septal defect", "heart palpitations",
+        "high triglycerides", "hyperlipidemia", "hypercholesterolemia", "lymphedema",
+        "spider veins", "chronic venous insufficiency", "kawasaki disease", "heart disease",
+        "cardiovascular disease", "heart attack symptoms", "rapid heartbeat", "racing heart",
+        "slow heartbeat", "skipped beats", "poor circulation", "cold hands", "cold feet",
+        # Lungs and airways
+        "chronic bronchitis", "bronchiectasis", "cystic fibrosis", "pulmonary fibrosis",
+        "interstitial lung disease", "sarcoidosis", "sleep apnea", "sleep apnoea",
+        "obstructive sleep apnea", "pleurisy", "lung nodule", "pulmonary nodule",
+        "collapsed lung", "respiratory failure", "ARDS", "acute respiratory distress syndrome",
+        "hay fever", "allergic rhinitis", "rhinitis", "nasal polyps", "deviated septum",
+        "asbestosis", "silicosis", "pneumoconiosis", "atelectasis", "lung abscess", "empyema",
+        "hemoptysis", "coughing up blood", "aspiration pneumonia", "walking pneumonia",
+        "exercise-induced asthma", "asthma attack", "lung disease", "lung infection",
+        "chest tightness", "tight chest", "chest discomfort", "phlegm", "mucus", "sputum",
+        "bloody sputum", "productive cough", "persistent cough", "chronic cough",
+        "barking cough", "hiccups", "choking", "rapid breathing", "shallow breathing",
+        "noisy breathing", "stridor", "low oxygen", "hypoxia",
+        # Digestion
+        "peptic ulcer", "stomach ulcer", "duodenal ulcer", "gastroenteritis", "stomach flu",
+        "food poisoning", "celiac disease", "coeliac disease", "lactose intolerance",
+        "diverticulitis", "diverticulosis", "inflammatory bowel disease", "IBD", "colitis",
+        "colon cancer", "colorectal cancer", "bowel cancer", "bowel obstruction",
+        "intestinal obstruction", "anal fissure", "fistula", "anal fistula", "hiatal hernia",
+        "hiatus hernia", "inguinal hernia", "umbilical hernia", "femoral hernia",
+        "incisional hernia", "barrett's esophagus", "esophagitis", "oesophagitis", "achalasia",
+        "dysphagia", "difficulty swallowing", "gastroparesis", "cholecystitis",
+        "gallbladder attack", "biliary colic", "liver failure", "liver disease",
+        "non-alcoholic fatty liver disease", "NAFLD", "alcoholic liver disease", "hepatomegaly",
+        "splenomegaly", "ascites", "pancreatic cancer", "stomach cancer", "gastric cancer",
+        "liver cancer", "esophageal cancer", "helicobacter pylori", "h. pylori",
+        "malabsorption", "short bowel syndrome", "peritonitis", "ruptured appendix",
+        "rectal bleeding", "melena", "black stool", "black stools", "hematemesis",
+        "vomiting blood", "flatulence", "belching", "burping", "abdominal cramps",
+        "stomach cramps", "dyspepsia", "volvulus", "intussusception", "pyloric stenosis",
+        "hirschsprung's disease", "gilbert's syndrome", "hemochromatosis", "wilson's disease",
+        "primary biliary cholangitis", "primary sclerosing cholangitis", "autoimmune hepatitis",
+        "portal hypertension", "esophageal varices", "pancreatic cyst", "gallbladder polyp",
+        "anal itching", "pilonidal cyst", "rectal prolapse", "fecal incontinence",
+        "bowel incontinence", "upset stomach", "stomach pain", "abdominal swelling",
+        "abdominal distension", "pale stool", "bloody stool", "mucus in stool",
+        "change in bowel habits", "loose stools", "watery diarrhea", "bloody diarrhea",
+        "acid indigestion", "reflux", "regurgitation", "stomach bug", "colic", "infant colic",
+        # Hormones and metabolism
+        "prediabetes", "gestational diabetes", "diabetic ketoacidosis", "hypoglycemia",
+        "hyperglycemia", "low blood sugar", "high blood sugar", "insulin resistance",
+        "metabolic syndrome", "thyroid nodule", "thyroiditis", "hashimoto's",
+        "hashimoto's thyroiditis", "graves' disease", "thyroid cancer", "addison's disease",
+        "cushing's syndrome", "adrenal insufficiency", "pheochromocytoma",
+        "hyperparathyroidism", "hypoparathyroidism", "pituitary tumor", "acromegaly",
+        "diabetes insipidus", "growth hormone deficiency", "hypogonadism", "low testosterone",
+        "menopause", "perimenopause", "hot flashes", "hot flushes", "polycystic ovary syndrome",
+        "vitamin d deficiency", "vitamin b12 deficiency", "iron deficiency",
+        "iron deficiency anemia", "folate deficiency", "malnutrition", "hyperkalemia",
+        "hypokalemia", "hyponatremia", "hypernatremia", "hypercalcemia", "hypocalcemia",
+        "electrolyte imbalance", "dyslipidemia", "porphyria", "phenylketonuria",
+        "hyperuricemia", "diabetic foot", "diabetic retinopathy", "diabetic neuropathy",
+        "diabetic nephropathy", "excessive thirst", "unexplained weight loss",
+        # Kidneys and urinary tract
+        "chronic kidney disease", "CKD", "acute kidney injury", "kidney failure",
+        "renal failure", "kidney infection", "kidney cyst", "polycystic kidney disease",
+        "nephrotic syndrome", "nephritis", "glomerulonephritis", "hydronephrosis",
+        "bladder infection", "overactive bladder", "urinary incontinence", "incontinence",
+        "urinary retention", "enlarged prostate", "benign prostatic hyperplasia", "BPH",
+        "prostate cancer", "bladder cancer", "kidney cancer", "renal cell carcinoma",
+        "testicular cancer", "erectile dysfunction", "bladder stone", "hematuria",
+        "proteinuria", "varicocele", "hydrocele", "phimosis", "testicular torsion",
+        "undescended testicle", "interstitial cystitis", "neurogenic bladder", "bedwetting",
+        "nocturia", "dark urine", "cloudy urine", "foamy urine", "burning urination",
+        "urinary urgency", "testicular pain", "scrotal swelling", "kidney pain", "flank pain",
+        # Pregnancy and women's health
+        "ectopic pregnancy", "preeclampsia", "pre-eclampsia", "eclampsia", "placenta previa",
+        "placental abruption", "morning sickness", "hyperemesis gravidarum", "premature labor",
+        "preterm labor", "stillbirth", "postpartum depression", "postnatal depression",
+        "postpartum hemorrhage", "infertility", "fibroids", "uterine fibroids", "ovarian cyst",
+        "ovarian cancer", "cervical cancer", "uterine cancer", "endometrial cancer",
+        "menorrhagia", "heavy periods", "irregular periods", "missed period", "amenorrhea",
+        "dysmenorrhea", "painful periods", "premenstrual syndrome", "PMS", "PMDD",
+        "vaginal discharge", "vaginal bleeding", "pelvic pain", "breast lump", "breast pain",
+        "fibrocystic breasts", "fibroadenoma", "pelvic organ prolapse", "uterine prolapse",
+        "vulvodynia", "adenomyosis", "cervical dysplasia", "abnormal pap smear", "lactation",
+        "gestational hypertension", "rh incompatibility", "molar pregnancy", "contraception",
+        "birth control", "IVF", "prenatal care", "antenatal care", "bleeding in pregnancy",
+        "reduced fetal movement", "braxton hicks", "cervical insufficiency", "breech baby",
+        # Bones, joints and muscles
+        "ankylosing spondylitis", "spondylosis", "spondylolisthesis", "spinal stenosis",
+        "degenerative disc disease", "disc bulge", "bulging disc", "pinched nerve",
+        "radiculopathy", "fibromyalgia", "lupus", "systemic lupus erythematosus",
+        "sjogren's syndrome", "scleroderma", "polymyalgia rheumatica", "psoriatic arthritis",
+        "reactive arthritis", "juvenile arthritis", "bone spur", "osteopenia",
+        "paget's disease", "rickets", "osteomalacia", "bunion", "hammer toe", "flat feet",
+        "morton's neuroma", "heel spur", "achilles tendonitis", "shin splints", "runner's knee",
+        "patellofemoral pain syndrome", "jumper's knee", "golfer's elbow", "trigger finger",
+        "de quervain's tenosynovitis", "ganglion cyst", "dupuytren's contracture",
+        "rotator cuff tear", "labral tear", "shoulder impingement", "shoulder dislocation",
+        "hip fracture", "wrist fracture", "ankle fracture", "ankle sprain",
+        "compression fracture", "vertebral fracture", "rib fracture", "skull fracture",
+        "greenstick fracture", "comminuted fracture", "displaced fracture", "open fracture",
+        "avulsion fracture", "colles fracture", "scaphoid fracture", "hamstring strain",
+        "groin strain", "pulled muscle", "muscle strain", "muscle tear", "muscle cramp",
+        "muscle pain", "muscle weakness", "myalgia", "muscular dystrophy", "rhabdomyolysis",
+        "compartment syndrome", "costochondritis", "TMJ", "TMJ disorder",
+        "temporomandibular joint disorder", "kyphosis", "lordosis", "hip dysplasia", "clubfoot",
+        "osteosarcoma", "bone cancer", "joint swelling", "joint stiffness", "knee pain",
+        "hip pain", "shoulder pain", "foot pain", "heel pain", "wrist pain", "elbow pain",
+        "ankle pain", "jaw pain", "leg pain", "arm pain", "hand pain", "finger pain",
+        "toe pain", "pelvic fracture", "collarbone fracture", "repetitive strain injury",
+        "cauda equina syndrome", "sacroiliac joint dysfunction", "coccydynia", "tailbone pain",
+        "piriformis syndrome", "it band syndrome", "baker's cyst", "osgood-schlatter disease",
+        "perthes disease", "slipped capital femoral epiphysis", "torn meniscus",
+        "torn rotator cuff", "torn muscle", "broken wrist", "broken ankle", "broken arm",
+        "broken leg", "broken rib", "broken finger", "broken toe", "broken nose", "broken hip",
+        "dislocated shoulder", "dislocated finger", "dislocated kneecap", "stiff neck",
+        "neck stiffness", "back spasms", "muscle spasms", "muscle twitching", "twitching",
+        "sore muscles", "body aches", "muscle aches", "joint aches",
+        # Brain and nerves
+        "migraine with aura", "cluster headache", "tension headache", "sinus headache",
+        "trigeminal neuralgia", "neuralgia", "peripheral neuropathy", "restless legs syndrome",
+        "essential tremor", "huntington's disease", "amyotrophic lateral sclerosis",
+        "motor neurone disease", "myasthenia gravis", "guillain-barre syndrome",
+        "cerebral palsy", "spina bifida", "hydrocephalus", "brain tumor", "brain tumour",
+        "glioma", "glioblastoma", "meningioma", "traumatic brain injury", "spinal cord injury",
+        "paralysis", "hemiplegia", "paraplegia", "quadriplegia", "narcolepsy",
+        "neuropathic pain", "nerve damage", "nerve pain", "facial palsy", "ataxia", "dystonia",
+        "tic disorder", "tourette syndrome", "benign paroxysmal positional vertigo", "BPPV",
+        "meniere's disease", "vestibular neuritis", "lewy body dementia", "vascular dementia",
+        "frontotemporal dementia", "alzheimer's disease", "parkinson's disease",
+        "mild cognitive impairment", "cognitive decline", "delirium", "febrile seizure",
+        "status epilepticus", "absence seizure", "post-concussion syndrome",
+        "chronic fatigue syndrome", "ulnar nerve entrapment", "cubital tunnel syndrome",
+        "carpal tunnel syndrome", "thoracic outlet syndrome", "complex regional pain syndrome",
+        "phantom limb pain", "postherpetic neuralgia", "pins and needles", "loss of balance",
+        "slurred speech", "speech difficulty", "aphasia", "memory problems", "brain fog",
+        "head trauma", "loss of consciousness", "unconsciousness", "blackout",
+        "fainting spells", "lightheadedness", "facial numbness", "facial drooping",
+        "weakness on one side", "difficulty walking", "loss of coordination", "clumsiness",
+        "disorientation", "poor concentration", "difficulty concentrating", "forgetfulness",
+        "sensitivity to light", "photophobia", "sensitivity to sound",
+        # Mental health
+        "major depression", "clinical depression", "bipolar disorder", "schizophrenia",
+        "psychosis", "generalized anxiety disorder", "panic attack", "panic disorder",
+        "social anxiety", "phobia", "OCD", "obsessive-compulsive disorder", "PTSD",
+        "post-traumatic stress disorder", "ADHD", "autism", "autism spectrum disorder",
+        "eating disorder", "anorexia", "anorexia nervosa", "bulimia", "binge eating disorder",
+        "sleep disorder", "burnout", "stress", "self-harm", "suicidal thoughts",
+        "substance abuse", "alcoholism", "alcohol use disorder", "addiction", "withdrawal",
+        "mood swings", "irritability", "personality disorder",
+        "borderline personality disorder", "seasonal affective disorder", "grief",
+        "hallucinations", "paranoia", "nightmares", "night terrors", "sleepwalking", "dyslexia",
+        "learning disability", "developmental delay", "agitation", "low mood",
+        "emotional distress", "difficulty sleeping", "excessive sleepiness",
+        "daytime sleepiness", "sleep deprivation",
+        # Eyes
+        "myopia", "nearsightedness", "short-sightedness", "hyperopia", "farsightedness",
+        "long-sightedness", "astigmatism", "presbyopia", "macular degeneration",
+        "age-related macular degeneration", "retinopathy", "retinal detachment",
+        "detached retina", "uveitis", "iritis", "keratitis", "blepharitis", "chalazion",
+        "dry eye", "dry eyes", "eye strain", "floaters", "eye floaters", "amblyopia",
+        "lazy eye", "strabismus", "squint", "optic neuritis", "color blindness",
+        "colour blindness", "night blindness", "blindness", "vision loss", "red eye",
+        "itchy eyes", "watery eyes", "eye pain", "corneal abrasion", "scratched cornea",
+        "subconjunctival hemorrhage", "ptosis", "droopy eyelid", "pterygium", "keratoconus",
+        "puffy eyes", "swollen eyelid", "eye discharge", "flashes of light", "tunnel vision",
+        "eye injury",
+        # Ears, nose, throat and mouth
+        "ear wax", "earwax", "blocked ear", "perforated eardrum", "ruptured eardrum",
+        "ear pain", "ear discharge", "hearing impairment", "deafness", "ringing in the ears",
+        "ear ringing", "sinus infection", "sinus pressure", "sinus pain", "blocked sinuses",
+        "facial pain", "nasal congestion", "blocked nose", "stuffy nose", "post-nasal drip",
+        "loss of smell", "anosmia", "loss of taste", "mouth ulcer", "canker sore",
+        "oral thrush", "gingivitis", "gum disease", "periodontitis", "tooth decay", "cavity",
+        "cavities", "dental caries", "tooth abscess", "dental abscess", "wisdom tooth",
+        "wisdom teeth", "impacted tooth", "impacted wisdom tooth", "tooth sensitivity",
+        "sensitive teeth", "bad breath", "halitosis", "dry mouth", "teeth grinding", "bruxism",
+        "tongue tie", "voice loss", "vocal cord nodules", "snoring", "adenoids",
+        "enlarged tonsils", "quinsy", "peritonsillar abscess", "throat cancer", "mouth cancer",
+        "oral cancer", "head and neck cancer", "nasopharyngeal cancer", "laryngeal cancer",
+        "nose bleed", "hoarse voice", "lump in throat", "swollen tonsils", "swollen gums",
+        "bleeding gums", "jaw stiffness", "lockjaw", "cracked tooth", "chipped tooth",
+        "broken tooth", "loose tooth", "tooth pain", "gum pain", "mouth sores", "white tongue",
+        "swollen tongue", "cleft lip", "cleft palate", "drooling", "gagging",
+        # Skin, hair and nails
+        "rosacea", "vitiligo", "melasma", "hyperpigmentation", "seborrheic dermatitis",
+        "dandruff", "contact dermatitis", "atopic dermatitis", "urticaria", "angioedema",
+        "keloid", "stretch marks", "sunburn", "sun damage", "actinic keratosis",
+        "seborrheic keratosis", "skin tag", "basal cell carcinoma", "squamous cell carcinoma",
+        "birthmark", "hemangioma", "port-wine stain", "hidradenitis suppurativa",
+        "lichen planus", "pityriasis rosea", "tinea versicolor", "alopecia", "alopecia areata",
+        "bald patch", "ingrown toenail", "ingrown hair", "nail fungus", "fungal nail infection",
+        "paronychia", "callus", "calluses", "bed sore", "pressure ulcer", "pressure sore",
+        "diabetic foot ulcer", "leg ulcer", "venous ulcer", "insect bite", "bee sting",
+        "wasp sting", "spider bite", "dog bite", "cat bite", "snake bite", "hyperhidrosis",
+        "excessive sweating", "dry patches", "flaky skin", "peeling skin", "skin rash",
+        "itchy skin", "skin lesion", "skin discoloration", "pimple", "blackheads", "whiteheads",
+        "cystic acne", "chafing", "heat rash", "prickly heat", "diaper rash", "nappy rash",
+        "cradle cap", "age spots", "liver spots", "dermatofibroma", "lipoma", "sebaceous cyst",
+        "epidermoid cyst", "pemphigus", "pemphigoid", "bullous pemphigoid", "erythema",
+        "petechiae", "purpura", "cyanosis", "pallor", "pale skin", "yellow skin", "scar tissue",
+        "hypertrophic scar", "cracked skin", "skin ulcer", "open wound", "abrasion",
+        "puncture wound", "splinter", "burn blister", "chemical burn", "second-degree burn",
+        "third-degree burn", "thinning hair", "brittle nails", "nail discoloration",
+        "yellow nails",
+        # Blood, immunity and cancer
+        "sickle cell disease", "sickle cell anemia", "thalassemia", "hemophilia", "haemophilia",
+        "von willebrand disease", "thrombocytopenia", "low platelets", "neutropenia",
+        "leukopenia", "polycythemia", "myeloma", "multiple myeloma", "hodgkin lymphoma",
+        "non-hodgkin lymphoma", "acute myeloid leukemia", "acute lymphoblastic leukemia",
+        "chronic lymphocytic leukemia", "chronic myeloid leukemia", "myelodysplastic syndrome",
+        "aplastic anemia", "pernicious anemia", "hemolytic anemia", "blood disorder",
+        "bleeding disorder", "clotting disorder", "immunodeficiency", "autoimmune disease",
+        "sarcoma", "carcinoma", "adenocarcinoma", "neuroblastoma", "retinoblastoma",
+        "wilms tumor", "mesothelioma", "pancreatic tumor", "bone metastasis",
+        "brain metastasis", "liver metastasis", "cancer recurrence", "benign tumor",
+        "malignant tumor", "precancerous", "swollen lymph nodes", "swollen glands",
+        "enlarged lymph node", "lymphadenopathy", "food allergy", "peanut allergy",
+        "nut allergy", "drug allergy", "penicillin allergy", "latex allergy", "dust allergy",
+        "dust mite allergy", "pollen allergy", "pet allergy", "shellfish allergy",
+        "egg allergy", "milk allergy", "gluten intolerance", "gluten sensitivity",
+        "easy bruising", "frequent infections", "weakened immune system",
+        # General symptoms
+        "malaise", "lethargy", "collapse", "high temperature", "low-grade fever",
+        "fever and chills", "swollen ankles", "swollen legs", "swollen feet", "leg swelling",
+        "facial swelling", "swollen face", "swollen hands", "swollen joints", "weight changes",
+        "sharp pain", "dull ache", "throbbing pain", "shooting pain", "radiating pain",
+        "chronic pain", "acute pain", "sudden pain", "burning pain", "stabbing pain",
+        "cramping", "eye twitching", "dehydration symptoms", "heat exhaustion", "sunstroke",
+        "altitude sickness", "motion sickness", "travel sickness", "sea sickness", "jet lag",
+        "hangover", "poisoning", "overdose", "carbon monoxide poisoning", "electric shock",
+        "drowning", "near drowning", "choking hazard", "car accident", "sports concussion",
+        # Body parts and systems
+        "frontal lobe", "temporal lobe", "occipital lobe", "parietal lobe", "cerebellum",
+        "brainstem", "brain stem", "hippocampus", "spinal cord", "pituitary gland",
+        "adrenal gland", "salivary gland", "parathyroid", "thymus", "pharynx", "epiglottis",
+        "vocal cords", "sinuses", "nasal septum", "nasal cavity", "palate", "uvula", "molar",
+        "incisor", "canine tooth", "jawbone", "mandible", "maxilla", "cheekbone", "eye socket",
+        "optic nerve", "sclera", "conjunctiva", "macula", "tear duct", "inner ear",
+        "middle ear", "outer ear", "ear canal", "cochlea", "eustachian tube", "humerus", "ulna",
+        "femur", "tibia", "fibula", "patella", "sacrum", "coccyx", "tailbone", "hip joint",
+        "knee joint", "shoulder joint", "ankle joint", "metacarpal", "metatarsal", "phalanges",
+        "carpal bones", "tarsal bones", "calcaneus", "talus", "ribcage", "rib cage",
+        "spinal disc", "intervertebral disc", "quadriceps", "hamstring", "biceps", "triceps",
+        "deltoid", "pectoral muscle", "abdominal muscles", "glutes", "gluteus maximus",
+        "calf muscle", "trapezius", "hip flexor", "groin muscle", "pelvic floor", "ACL", "MCL",
+        "PCL", "LCL", "anterior cruciate ligament", "medial collateral ligament",
+        "plantar fascia", "achilles", "bursa", "synovial fluid", "left ventricle",
+        "right ventricle", "atrium", "heart valve", "mitral valve", "aortic valve",
+        "tricuspid valve", "pulmonary valve", "coronary artery", "carotid artery",
+        "femoral artery", "pulmonary artery", "jugular vein", "vena cava", "capillaries",
+        "lymphatic system", "bone marrow", "bronchi", "bronchioles", "alveoli", "pleura",
+        "lung lobe", "small intestine", "large intestine", "duodenum", "jejunum", "ileum",
+        "cecum", "sigmoid colon", "bile duct", "gall bladder", "ureter", "urethra",
+        "renal pelvis", "cervix", "vagina", "vulva", "fallopian tube", "placenta",
+        "umbilical cord", "amniotic fluid", "fetus", "foetus", "embryo", "penis", "scrotum",
+        "testes", "epididymis", "seminal vesicle", "nipple", "areola", "armpit", "underarm",
+        "axilla", "earlobe", "chin", "cheek", "nostril", "eyebrow", "eyelashes", "fingernail",
+        "toenail", "knuckle", "big toe", "little toe", "arch of the foot", "instep",
+        "hair follicle", "sweat gland", "sebaceous gland", "epidermis", "dermis",
+        "subcutaneous tissue", "connective tissue", "blood vessel", "red blood cells",
+        "white blood cells", "platelets", "plasma", "immune system", "nervous system",
+        "digestive system", "respiratory system", "cardiovascular system", "urinary tract",
+        "reproductive system", "endocrine system", "adam's apple", "collar bone",
+        "shoulder blade", "breastbone", "hamstring muscle", "achilles heel", "pelvic bone",
+        "hip bone", "thigh bone", "shin bone",
+        # Examinations and tests
+        "CT angiogram", "CT angiography", "MRI with contrast", "contrast dye", "PET-CT",
+        "SPECT", "bone scan", "nuclear medicine scan", "thyroid scan", "DEXA scan", "DEXA",
+        "abdominal ultrasound", "pelvic ultrasound", "transvaginal ultrasound",
+        "obstetric ultrasound", "pregnancy scan", "carotid ultrasound", "renal ultrasound",
+        "breast ultrasound", "thyroid ultrasound", "doppler ultrasound", "cardiac MRI",
+        "stress test", "exercise stress test", "treadmill test", "holter monitor",
+        "event monitor", "tilt table test", "cardiac catheterization", "coronary angiogram",
+        "pulmonary function test", "spirometry", "peak flow", "oximetry", "pulse oximetry",
+        "oxygen saturation", "arterial blood gas", "sleep study", "polysomnography",
+        "nerve conduction study", "EMG", "electromyography", "lumbar puncture", "spinal tap",
+        "bone marrow biopsy", "fine needle aspiration", "needle biopsy", "skin biopsy",
+        "liver biopsy", "kidney biopsy", "pap smear", "pap test", "cervical screening",
+        "HPV test", "PSA test", "PSA", "prostate exam", "mammography", "breast exam",
+        "gastroscopy", "upper endoscopy", "sigmoidoscopy", "capsule endoscopy", "bronchoscopy",
+        "cystoscopy", "laparoscopy", "arthroscopy", "hysteroscopy", "colposcopy", "ERCP",
+        "barium swallow", "barium enema", "complete blood count", "CBC", "full blood count",
+        "metabolic panel", "lipid panel", "liver function test", "kidney function test",
+        "thyroid function test", "TSH", "vitamin d test", "ferritin", "hemoglobin",
+        "haemoglobin", "white blood cell count", "platelet count", "creatinine", "eGFR",
+        "blood urea nitrogen", "electrolytes", "CRP", "c-reactive protein", "ESR", "troponin",
+        "d-dimer", "BNP", "INR", "blood culture", "urine culture", "stool test", "stool sample",
+        "urinalysis", "throat swab", "nasal swab", "PCR test", "antigen test", "covid test",
+        "rapid test", "allergy test", "skin prick test", "patch test", "glucose tolerance test",
+        "fasting blood sugar", "blood glucose", "blood pressure", "blood pressure reading",
+        "heart rate", "resting heart rate", "BMI", "body mass index", "genetic test",
+        "genetic testing", "karyotype", "amniocentesis", "prenatal screening",
+        "newborn screening", "hearing test", "audiogram", "eye exam", "vision test",
+        "visual field test", "tonometry", "OCT scan", "fundoscopy", "dental exam",
+        "panoramic x-ray", "bitewing x-ray", "cephalometric x-ray", "cone beam CT",
+        "knee x-ray", "hand x-ray", "wrist x-ray", "ankle x-ray", "foot x-ray", "spine x-ray",
+        "skull x-ray", "abdominal x-ray", "pelvic x-ray", "hip x-ray", "shoulder x-ray",
+        "elbow x-ray", "brain MRI", "spine MRI", "knee MRI", "shoulder MRI", "head CT",
+        "chest CT", "abdominal CT", "low-dose CT", "CT colonography", "electrocardiogram",
+        "electroencephalogram", "lab results", "blood work", "test results", "scan results",
+        "radiology report", "pathology report", "tumor marker",
+        # Treatments and procedures
+        "appendectomy", "cholecystectomy", "gallbladder removal", "hysterectomy", "mastectomy",
+        "lumpectomy", "tonsillectomy", "adenoidectomy", "thyroidectomy", "colectomy",
+        "gastrectomy", "nephrectomy", "prostatectomy", "splenectomy", "laminectomy",
+        "discectomy", "spinal fusion", "hip replacement", "knee replacement",
+        "joint replacement", "shoulder replacement", "ACL reconstruction", "meniscectomy",
+        "carpal tunnel release", "bypass surgery", "coronary artery bypass", "CABG",
+        "angioplasty", "stent", "pacemaker", "defibrillator", "ablation", "cardioversion",
+        "valve replacement", "heart surgery", "open heart surgery", "cesarean section",
+        "caesarean section", "c-section", "episiotomy", "vasectomy", "tubal ligation",
+        "circumcision", "cataract surgery", "LASIK", "laser eye surgery", "hernia repair",
+        "bariatric surgery", "gastric bypass", "gastric sleeve", "liposuction", "skin graft",
+        "amputation", "fracture fixation", "plaster cast", "internal fixation", "bone graft",
+        "tooth extraction", "dental extraction", "dental crown", "dental bridge",
+        "dental implant", "root canal", "dental filling", "anesthesia", "anaesthesia",
+        "general anesthesia", "local anesthesia", "epidural", "nerve block",
+        "steroid injection", "cortisone injection", "joint injection", "botox", "IV fluids",
+        "blood transfusion", "transfusion", "oxygen therapy", "mechanical ventilation",
+        "ventilator", "CPAP", "nebulizer", "inhaler", "insulin pump", "insulin injection",
+        "immunotherapy", "targeted therapy", "hormone therapy", "hormone replacement therapy",
+        "HRT", "radiation therapy", "stem cell transplant", "bone marrow transplant",
+        "kidney transplant", "liver transplant", "heart transplant", "organ transplant",
+        "rehabilitation", "occupational therapy", "speech therapy",
+        "cognitive behavioral therapy", "CBT", "psychotherapy", "counseling", "counselling",
+        "wound care", "sutures", "debridement", "incision and drainage", "catheter",
+        "urinary catheter", "feeding tube", "tracheostomy", "intubation", "CPR",
+        "resuscitation", "first aid", "tetanus shot", "flu shot", "immunization",
+        "immunisation", "MMR vaccine", "HPV vaccine", "covid vaccine", "hepatitis b vaccine",
+        "travel vaccines", "physical exam", "check-up", "checkup", "health check",
+        "second opinion", "crutches", "knee brace", "back brace", "neck brace", "walking boot",
+        "hearing aid", "contact lenses",
+        # Medicines
+        "paracetamol", "acetaminophen", "ibuprofen", "aspirin", "naproxen", "diclofenac",
+        "celecoxib", "meloxicam", "indomethacin", "ketorolac", "codeine", "tramadol",
+        "morphine", "oxycodone", "hydrocodone", "fentanyl", "buprenorphine", "methadone",
+        "gabapentin", "pregabalin", "amitriptyline", "nortriptyline", "duloxetine",
+        "venlafaxine", "sertraline", "fluoxetine", "citalopram", "escitalopram", "paroxetine",
+        "bupropion", "mirtazapine", "trazodone", "lithium", "valproate", "sodium valproate",
+        "lamotrigine", "levetiracetam", "carbamazepine", "phenytoin", "topiramate",
+        "clonazepam", "diazepam", "lorazepam", "alprazolam", "zolpidem", "melatonin",
+        "quetiapine", "olanzapine", "risperidone", "aripiprazole", "haloperidol", "clozapine",
+        "methylphenidate", "amphetamine", "atomoxetine", "donepezil", "memantine", "levodopa",
+        "carbidopa", "sumatriptan", "rizatriptan", "propranolol", "metoprolol", "atenolol",
+        "bisoprolol", "carvedilol", "amlodipine", "nifedipine", "diltiazem", "verapamil",
+        "lisinopril", "enalapril", "ramipril", "perindopril", "losartan", "valsartan",
+        "irbesartan", "candesartan", "telmisartan", "hydrochlorothiazide", "chlorthalidone",
+        "indapamide", "furosemide", "bumetanide", "spironolactone", "eplerenone", "digoxin",
+        "amiodarone", "flecainide", "sotalol", "nitroglycerin", "isosorbide mononitrate",
+        "atorvastatin", "simvastatin", "rosuvastatin", "pravastatin", "ezetimibe",
+        "fenofibrate", "warfarin", "heparin", "enoxaparin", "apixaban", "rivaroxaban",
+        "dabigatran", "edoxaban", "clopidogrel", "ticagrelor", "prasugrel", "metformin",
+        "insulin", "insulin glargine", "glipizide", "gliclazide", "glimepiride", "sitagliptin",
+        "linagliptin", "empagliflozin", "dapagliflozin", "canagliflozin", "liraglutide",
+        "semaglutide", "dulaglutide", "tirzepatide", "pioglitazone", "levothyroxine",
+        "methimazole", "carbimazole", "propylthiouracil", "prednisone", "prednisolone",
+        "methylprednisolone", "dexamethasone", "hydrocortisone", "budesonide", "fluticasone",
+        "beclomethasone", "mometasone", "salbutamol", "albuterol", "salmeterol", "formoterol",
+        "tiotropium", "ipratropium", "montelukast", "theophylline", "cetirizine", "loratadine",
+        "fexofenadine", "desloratadine", "diphenhydramine", "chlorphenamine", "hydroxyzine",
+        "promethazine", "pseudoephedrine", "phenylephrine", "dextromethorphan", "guaifenesin",
+        "omeprazole", "esomeprazole", "lansoprazole", "pantoprazole", "rabeprazole",
+        "ranitidine", "famotidine", "antacid", "loperamide", "bismuth subsalicylate",
+        "ondansetron", "metoclopramide", "domperidone", "prochlorperazine", "lactulose",
+        "senna", "bisacodyl", "docusate", "polyethylene glycol", "psyllium", "mesalamine",
+        "mesalazine", "sulfasalazine", "azathioprine", "mercaptopurine", "methotrexate",
+        "hydroxychloroquine", "leflunomide", "adalimumab", "infliximab", "etanercept",
+        "ustekinumab", "secukinumab", "rituximab", "tocilizumab", "colchicine", "allopurinol",
+        "febuxostat", "alendronate", "risedronate", "zoledronic acid", "denosumab",
+        "calcium supplement", "vitamin d", "vitamin b12", "folic acid", "iron supplement",
+        "ferrous sulfate", "amoxicillin", "amoxicillin-clavulanate", "co-amoxiclav",
+        "penicillin", "flucloxacillin", "cephalexin", "cefuroxime", "ceftriaxone", "cefixime",
+        "azithromycin", "clarithromycin", "erythromycin", "doxycycline", "minocycline",
+        "tetracycline", "ciprofloxacin", "levofloxacin", "moxifloxacin", "metronidazole",
+        "clindamycin", "trimethoprim", "sulfamethoxazole", "co-trimoxazole", "nitrofurantoin",
+        "vancomycin", "gentamicin", "linezolid", "rifampicin", "isoniazid", "ethambutol",
+        "pyrazinamide", "fluconazole", "itraconazole", "terbinafine", "clotrimazole",
+        "miconazole", "nystatin", "ketoconazole", "acyclovir", "aciclovir", "valacyclovir",
+        "oseltamivir", "tamiflu", "remdesivir", "paxlovid", "nirmatrelvir", "tenofovir",
+        "emtricitabine", "dolutegravir", "ivermectin", "albendazole", "mebendazole",
+        "praziquantel", "permethrin", "chloroquine", "artemether", "lumefantrine", "atovaquone",
+        "proguanil", "mefloquine", "hydrocortisone cream", "calamine", "benzoyl peroxide",
+        "tretinoin", "isotretinoin", "adapalene", "clobetasol", "betamethasone",
+        "triamcinolone", "tacrolimus", "pimecrolimus", "minoxidil", "finasteride", "tamsulosin",
+        "dutasteride", "oxybutynin", "solifenacin", "mirabegron", "sildenafil", "tadalafil",
+        "estradiol", "progesterone", "medroxyprogesterone", "levonorgestrel",
+        "oral contraceptive", "contraceptive pill", "clomiphene", "letrozole", "tamoxifen",
+        "anastrozole", "testosterone", "cyclophosphamide", "doxorubicin", "cisplatin",
+        "carboplatin", "paclitaxel", "docetaxel", "fluorouracil", "capecitabine", "gemcitabine",
+        "imatinib", "trastuzumab", "pembrolizumab", "nivolumab", "bevacizumab", "epinephrine",
+        "EpiPen", "adrenaline", "naloxone", "atropine", "lidocaine", "ketamine", "propofol",
+        "midazolam", "nicotine patch", "varenicline", "naltrexone", "disulfiram", "acamprosate",
+        "oral rehydration salts", "antihistamine", "antibiotics", "antiviral", "antifungal",
+        "painkiller", "anti-inflammatory", "NSAID", "steroid", "corticosteroid", "statin",
+        "beta blocker", "ACE inhibitor", "blood thinner", "anticoagulant", "diuretic",
+        "water pill", "antidepressant", "antipsychotic", "anticonvulsant", "sedative",
+        "sleeping pill", "laxative", "decongestant", "cough syrup", "eye drops", "ear drops",
+        "nasal spray", "ointment", "topical steroid", "antiseptic", "probiotic", "side effects",
+        "drug interaction", "dosage", "overdose symptoms",
+    ],
+    "Spanish": [
+        "Dolor", "Dolor de pecho", "Dolor de cabeza", "Dolor de espalda", "Dolor abdominal",
+        "Dolor de garganta", "Fiebre", "Tos", "Tos seca", "Erupción", "Sarpullido", "Hinchazón",
+        "Fractura", "Lesión", "Herida", "Quemadura", "Infección", "Radiografía", "Resonancia",
+        "Resonancia magnética", "Tomografía", "Ecografía", "Corazón", "Pulmón", "Cerebro",
+        "Rodilla", "Hombro", "Espalda", "Abdomen", "Pecho", "Tobillo", "Muñeca", "Cadera",
+        "Piel", "Diabetes", "Hipertensión", "Presión alta", "Asma", "Neumonía", "Tumor",
+        "Cáncer", "Quiste", "Mareo", "Náuseas", "Vómitos", "Diarrea", "Fatiga", "Picazón",
+        "Alergia", "Migraña", "Esguince", "Artritis", "Ansiedad", "Embarazo", "Gripe",
+        "Dolor de muelas", "Dolor de oído", "Dolor de estómago", "Dolor muscular",
+        "Dolor articular", "Dolor de rodilla", "Dolor lumbar", "Dolor de cuello",
+        "Dolor de hombro", "Escalofríos", "Sudores nocturnos", "Cansancio", "Debilidad",
+        "Desmayo", "Vértigo", "Entumecimiento", "Hormigueo", "Falta de aire",
+        "Dificultad para respirar", "Sibilancias", "Congestión nasal", "Estornudos",
+        "Estreñimiento", "Acidez", "Ardor de estómago", "Indigestión", "Hinchazón abdominal",
+        "Pérdida de peso", "Sangrado", "Hemorragia", "Moretón", "Hematoma", "Ampolla", "Bulto",
+        "Palpitaciones", "Convulsiones", "Insomnio", "Depresión", "Visión borrosa",
+        "Pérdida de audición", "Zumbido en los oídos", "Caída del cabello", "Luxación",
+        "Fractura de muñeca", "Fractura de cadera", "Esguince de tobillo", "Contusión",
+        "Conmoción cerebral", "Bronquitis", "Tuberculosis", "Sinusitis", "Amigdalitis",
+        "Faringitis", "Otitis", "Conjuntivitis", "Catarata", "Glaucoma", "Eccema", "Psoriasis",
+        "Acné", "Dermatitis", "Urticaria", "Herpes", "Culebrilla", "Varicela", "Sarampión",
+        "Melanoma", "Cáncer de piel", "Cáncer de mama", "Cáncer de pulmón",
+        "Cáncer de próstata", "Leucemia", "Linfoma", "Metástasis", "Nódulo", "Pólipo",
+        "Infarto", "Ataque al corazón", "Insuficiencia cardíaca", "Arritmia", "Angina de pecho",
+        "Derrame cerebral", "Ictus", "Accidente cerebrovascular", "Trombosis", "Embolia",
+        "Anemia", "Colesterol alto", "Obesidad", "Hipotiroidismo", "Hipertiroidismo",
+        "Cálculo renal", "Piedra en el riñón", "Cálculos biliares", "Infección urinaria",
+        "Apendicitis", "Gastritis", "Reflujo", "Colitis", "Hemorroides", "Hernia", "Hepatitis",
+        "Cirrosis", "Hígado graso", "Pancreatitis", "Artrosis", "Gota", "Osteoporosis",
+        "Escoliosis", "Hernia discal", "Ciática", "Tendinitis", "Bursitis", "Epilepsia",
+        "Demencia", "Alzheimer", "Parkinson", "Esclerosis múltiple", "Neuropatía",
+        "Deshidratación", "Sepsis", "Edema", "Enfisema", "Fibrosis", "Cabeza", "Cuello",
+        "Columna", "Columna vertebral", "Brazo", "Codo", "Mano", "Dedo", "Pierna", "Muslo",
+        "Talón", "Ojo", "Ojos", "Oído", "Oreja", "Nariz", "Boca", "Garganta", "Diente",
+        "Dientes", "Encía", "Mandíbula", "Hígado", "Riñón", "Riñones", "Vejiga", "Estómago",
+        "Intestino", "Colon", "Páncreas", "Tiroides", "Próstata", "Útero", "Ovario", "Músculo",
+        "Hueso", "Huesos", "Tendón", "Ligamento", "Articulación", "Nervio", "Arteria", "Vena",
+        "Sangre", "Análisis de sangre", "Análisis de orina", "Biopsia", "Endoscopia",
+        "Colonoscopia", "Mamografía", "Electrocardiograma", "Cirugía", "Operación", "Vacuna",
+        "Inyección", "Antibiótico", "Medicamento", "Receta", "Fisioterapia", "Quimioterapia",
+        "Radioterapia", "Diálisis", "Trasplante", "Escáner", "TAC", "Rayos X", "Paracetamol",
+        "Ibuprofeno", "Aspirina", "Insulina", "Presión baja", "Glucosa", "Azúcar en la sangre",
+        "Covid", "Resfriado", "Sinusitis crónica", "Dolor pélvico", "Menstruación",
+        "Regla dolorosa", "Aborto espontáneo", "Parto", "Cesárea",
+    ],
+    "French": [
+        "Douleur", "Douleur thoracique", "Mal de tête", "Maux de tête", "Mal de dos",
+        "Douleur abdominale", "Mal de gorge", "Fièvre", "Toux", "Toux sèche", "Éruption",
+        "Éruption cutanée", "Gonflement", "Fracture", "Blessure", "Plaie", "Brûlure",
+        "Infection", "Radiographie", "IRM", "Scanner", "Échographie", "Cœur", "Poumon",
+        "Cerveau", "Genou", "Épaule", "Dos", "Abdomen", "Poitrine", "Cheville", "Poignet",
+        "Hanche", "Peau", "Diabète", "Hypertension", "Asthme", "Pneumonie", "Tumeur", "Cancer",
+        "Kyste", "Vertige", "Nausée", "Vomissements", "Diarrhée", "Fatigue",
+        "Démangeaisons", "Allergie", "Migraine", "Entorse", "Arthrite", "Anxiété", "Grossesse",
+        "Grippe",
+        "Mal aux dents", "Mal d'oreille", "Mal de ventre", "Mal au ventre",
+        "Douleur musculaire", "Douleur articulaire", "Douleur au genou", "Lombalgie",
+        "Mal au cou", "Douleur à l'épaule", "Frissons", "Sueurs nocturnes", "Faiblesse",
+        "Évanouissement", "Malaise", "Engourdissement", "Fourmillements", "Essoufflement",
+        "Difficulté à respirer", "Respiration sifflante", "Nez bouché", "Éternuements",
+        "Constipation", "Brûlures d'estomac", "Indigestion", "Ballonnements", "Perte de poids",
+        "Saignement", "Hémorragie", "Ecchymose", "Hématome", "Ampoule", "Bosse", "Palpitations",
+        "Convulsions", "Insomnie", "Dépression", "Vision floue", "Perte auditive", "Acouphènes",
+        "Chute de cheveux", "Luxation", "Foulure", "Commotion cérébrale", "Bronchite",
+        "Tuberculose", "Sinusite", "Angine", "Otite", "Conjonctivite", "Cataracte", "Glaucome",
+        "Eczéma", "Psoriasis", "Acné", "Dermatite", "Urticaire", "Herpès", "Zona", "Varicelle",
+        "Rougeole", "Mélanome", "Cancer de la peau", "Cancer du sein", "Cancer du poumon",
+        "Cancer de la prostate", "Leucémie", "Lymphome", "Métastase", "Nodule", "Polype",
+        "Infarctus", "Crise cardiaque", "Insuffisance cardiaque", "Arythmie",
+        "Angine de poitrine", "AVC", "Accident vasculaire cérébral", "Thrombose", "Embolie",
+        "Phlébite", "Anémie", "Cholestérol", "Obésité", "Hypothyroïdie", "Hyperthyroïdie",
+        "Calcul rénal", "Calculs biliaires", "Infection urinaire", "Cystite", "Appendicite",
+        "Gastrite", "Reflux", "Colite", "Hémorroïdes", "Hernie", "Hépatite", "Cirrhose",
+        "Pancréatite", "Arthrose", "Goutte", "Ostéoporose", "Scoliose", "Hernie discale",
+        "Sciatique", "Tendinite", "Bursite", "Épilepsie", "Démence", "Alzheimer", "Parkinson",
+        "Sclérose en plaques", "Déshydratation", "Septicémie", "Œdème", "Emphysème", "Fibrose",
+        "Tête", "Cou", "Colonne vertébrale", "Coude", "Doigt", "Jambe", "Cuisse", "Pied",
+        "Talon", "Œil", "Yeux", "Oreille", "Nez", "Bouche", "Gorge", "Gencive", "Mâchoire",
+        "Foie", "Vessie", "Estomac", "Intestin", "Côlon", "Pancréas", "Thyroïde", "Prostate",
+        "Utérus", "Ovaire", "Muscle", "Tendon", "Ligament", "Articulation", "Nerf", "Artère",
+        "Veine", "Prise de sang", "Analyse de sang", "Analyse d'urine", "Biopsie", "Endoscopie",
+        "Coloscopie", "Mammographie", "Électrocardiogramme", "Chirurgie", "Opération", "Vaccin",
+        "Piqûre", "Injection", "Antibiotique", "Médicament", "Ordonnance", "Kinésithérapie",
+        "Chimiothérapie", "Radiothérapie", "Dialyse", "Greffe", "Paracétamol", "Ibuprofène",
+        "Aspirine", "Insuline", "Tension artérielle", "Hypotension", "Glycémie", "Rhume",
+        "Covid", "Règles douloureuses", "Fausse couche", "Accouchement", "Césarienne",
+        "Douleur pelvienne", "Crampe", "Spasme", "Tremblement",
+    ],
+    "German": [
+        "Schmerzen", "Brustschmerzen", "Kopfschmerzen", "Rückenschmerzen", "Bauchschmerzen",
+        "Halsschmerzen", "Fieber", "Husten", "Trockener Husten", "Ausschlag", "Hautausschlag",
+        "Schwellung", "Bruch", "Knochenbruch", "Fraktur", "Verletzung", "Wunde", "Verbrennung",
+        "Infektion", "Entzündung", "Röntgen", "Röntgenbild", "MRT", "CT", "Ultraschall",
+        "Herz", "Lunge", "Gehirn", "Knie", "Schulter", "Rücken", "Bauch", "Brust",
+        "Knöchel", "Handgelenk", "Hüfte", "Haut", "Diabetes", "Bluthochdruck", "Asthma",
+        "Lungenentzündung", "Tumor", "Krebs", "Zyste", "Schwindel", "Übelkeit", "Erbrechen",
+        "Durchfall", "Müdigkeit", "Juckreiz", "Allergie", "Migräne", "Verstauchung",
+        "Arthritis", "Angst", "Schwangerschaft", "Grippe",
+        "Zahnschmerzen", "Ohrenschmerzen", "Magenschmerzen", "Muskelschmerzen",
+        "Gelenkschmerzen", "Knieschmerzen", "Nackenschmerzen", "Schulterschmerzen",
+        "Schüttelfrost", "Nachtschweiß", "Schwäche", "Ohnmacht", "Taubheitsgefühl", "Kribbeln",
+        "Atemnot", "Kurzatmigkeit", "Atembeschwerden", "Verstopfte Nase", "Niesen",
+        "Verstopfung", "Sodbrennen", "Verdauungsstörung", "Blähungen", "Gewichtsverlust",
+        "Blutung", "Bluterguss", "Prellung", "Blase", "Knoten", "Herzrasen", "Herzklopfen",
+        "Krampfanfall", "Schlaflosigkeit", "Depression", "Verschwommenes Sehen", "Hörverlust",
+        "Tinnitus", "Haarausfall", "Ausrenkung", "Zerrung", "Gehirnerschütterung", "Bronchitis",
+        "Tuberkulose", "Nebenhöhlenentzündung", "Sinusitis", "Mandelentzündung",
+        "Mittelohrentzündung", "Bindehautentzündung", "Grauer Star", "Grüner Star", "Ekzem",
+        "Neurodermitis", "Schuppenflechte", "Akne", "Nesselsucht", "Herpes", "Gürtelrose",
+        "Windpocken", "Masern", "Melanom", "Hautkrebs", "Brustkrebs", "Lungenkrebs",
+        "Prostatakrebs", "Leukämie", "Lymphom", "Metastase", "Polyp", "Herzinfarkt",
+        "Herzinsuffizienz", "Herzschwäche", "Herzrhythmusstörung", "Vorhofflimmern",
+        "Schlaganfall", "Thrombose", "Embolie", "Lungenembolie", "Anämie", "Blutarmut",
+        "Cholesterin", "Übergewicht", "Schilddrüsenunterfunktion", "Schilddrüsenüberfunktion",
+        "Nierenstein", "Gallenstein", "Harnwegsinfekt", "Blasenentzündung",
+        "Blinddarmentzündung", "Gastritis", "Magenschleimhautentzündung", "Reflux",
+        "Hämorrhoiden", "Leistenbruch", "Hepatitis", "Leberzirrhose", "Fettleber",
+        "Bauchspeicheldrüsenentzündung", "Arthrose", "Gicht", "Osteoporose", "Skoliose",
+        "Bandscheibenvorfall", "Ischias", "Sehnenentzündung", "Schleimbeutelentzündung",
+        "Epilepsie", "Demenz", "Alzheimer", "Parkinson", "Multiple Sklerose", "Austrocknung",
+        "Blutvergiftung", "Ödem", "Lungenemphysem", "Kopf", "Hals", "Nacken", "Wirbelsäule",
+        "Arm", "Ellenbogen", "Hand", "Finger", "Bein", "Oberschenkel", "Fuß", "Ferse", "Auge",
+        "Augen", "Ohr", "Nase", "Mund", "Zahn", "Zähne", "Zahnfleisch", "Kiefer", "Leber",
+        "Niere", "Nieren", "Harnblase", "Magen", "Darm", "Dickdarm", "Bauchspeicheldrüse",
+        "Schilddrüse", "Prostata", "Gebärmutter", "Eierstock", "Muskel", "Knochen", "Sehne",
+        "Gelenk", "Nerv", "Arterie", "Vene", "Blut", "Bluttest", "Blutuntersuchung", "Blutbild",
+        "Urintest", "Biopsie", "Magenspiegelung", "Darmspiegelung", "Mammographie", "EKG",
+        "Operation", "Impfung", "Spritze", "Antibiotikum", "Medikament", "Rezept",
+        "Physiotherapie", "Krankengymnastik", "Chemotherapie", "Strahlentherapie", "Dialyse",
+        "Transplantation", "Paracetamol", "Ibuprofen", "Aspirin", "Insulin", "Blutdruck",
+        "Niedriger Blutdruck", "Blutzucker", "Erkältung", "Covid", "Regelschmerzen",
+        "Fehlgeburt", "Geburt", "Kaiserschnitt", "Unterleibsschmerzen", "Krampf", "Zittern",
+        "Schnittwunde", "Platzwunde", "Sonnenbrand", "Insektenstich", "Zeckenbiss",
+        "Borreliose", "Mumps", "Keuchhusten", "Lungenfunktion", "Computertomographie",
+        "Magnetresonanztomographie", "Kernspintomographie",
+    ],
+    "Italian": [
+        "Dolore", "Dolore al petto", "Mal di testa", "Mal di schiena", "Dolore addominale",
+        "Mal di gola", "Febbre", "Tosse", "Tosse secca", "Eruzione cutanea", "Gonfiore",
+        "Frattura", "Lesione", "Ferita", "Ustione", "Infezione", "Radiografia", "Risonanza",
+        "Risonanza magnetica", "TAC", "Ecografia", "Cuore", "Polmone", "Cervello",
+        "Ginocchio", "Spalla", "Schiena", "Addome", "Petto", "Caviglia", "Polso", "Anca",
+        "Pelle", "Diabete", "Ipertensione", "Asma", "Polmonite", "Tumore", "Cancro", "Cisti",
+        "Vertigini", "Nausea", "Vomito", "Diarrea", "Stanchezza", "Prurito", "Allergia",
+        "Emicrania", "Distorsione", "Artrite", "Ansia", "Gravidanza", "Influenza",
+        "Mal di denti", "Mal d'orecchio", "Mal di stomaco", "Mal di pancia", "Dolore muscolare",
+        "Dolore articolare", "Dolore al ginocchio", "Lombalgia", "Dolore al collo", "Brividi",
+        "Sudorazione notturna", "Debolezza", "Svenimento", "Intorpidimento", "Formicolio",
+        "Fiato corto", "Mancanza di respiro", "Difficoltà respiratorie", "Naso chiuso",
+        "Starnuti", "Stitichezza", "Bruciore di stomaco", "Acidità", "Indigestione",
+        "Gonfiore addominale", "Perdita di peso", "Sanguinamento", "Emorragia", "Livido",
+        "Ematoma", "Vescica", "Nodulo", "Palpitazioni", "Convulsioni", "Insonnia",
+        "Depressione", "Vista offuscata", "Perdita dell'udito", "Acufene", "Perdita di capelli",
+        "Lussazione", "Stiramento", "Commozione cerebrale", "Bronchite", "Tubercolosi",
+        "Sinusite", "Tonsillite", "Faringite", "Otite", "Congiuntivite", "Cataratta",
+        "Glaucoma", "Eczema", "Psoriasi", "Acne", "Dermatite", "Orticaria", "Herpes",
+        "Fuoco di Sant'Antonio", "Varicella", "Morbillo", "Melanoma", "Cancro della pelle",
+        "Tumore al seno", "Tumore al polmone", "Leucemia", "Linfoma", "Metastasi", "Polipo",
+        "Infarto", "Attacco di cuore", "Insufficienza cardiaca", "Aritmia", "Angina", "Ictus",
+        "Trombosi", "Embolia", "Anemia", "Colesterolo alto", "Obesità", "Ipotiroidismo",
+        "Ipertiroidismo", "Calcolo renale", "Calcoli biliari", "Infezione urinaria", "Cistite",
+        "Appendicite", "Gastrite", "Reflusso", "Colite", "Emorroidi", "Ernia", "Epatite",
+        "Cirrosi", "Fegato grasso", "Pancreatite", "Artrosi", "Osteoporosi", "Scoliosi",
+        "Ernia del disco", "Sciatica", "Tendinite", "Borsite", "Epilessia", "Demenza",
+        "Alzheimer", "Parkinson", "Sclerosi multipla", "Disidratazione", "Sepsi", "Edema",
+        "Enfisema", "Testa", "Collo", "Colonna vertebrale", "Braccio", "Gomito", "Mano", "Dito",
+        "Gamba", "Coscia", "Piede", "Tallone", "Occhio", "Occhi", "Orecchio", "Naso", "Bocca",
+        "Gola", "Dente", "Denti", "Gengiva", "Mascella", "Fegato", "Rene", "Reni", "Stomaco",
+        "Intestino", "Pancreas", "Tiroide", "Prostata", "Utero", "Ovaio", "Seno", "Muscolo",
+        "Osso", "Ossa", "Tendine", "Legamento", "Articolazione", "Nervo", "Arteria", "Vena",
+        "Sangue", "Esami del sangue", "Analisi del sangue", "Esame delle urine", "Biopsia",
+        "Endoscopia", "Colonscopia", "Mammografia", "Elettrocardiogramma",
+        "Intervento chirurgico", "Operazione", "Vaccino", "Iniezione", "Antibiotico", "Farmaco",
+        "Ricetta", "Fisioterapia", "Chemioterapia", "Radioterapia", "Dialisi", "Trapianto",
+        "Paracetamolo", "Ibuprofene", "Aspirina", "Insulina", "Pressione alta",
+        "Pressione bassa", "Glicemia", "Raffreddore", "Covid", "Mestruazioni dolorose",
+        "Aborto spontaneo", "Parto", "Taglio cesareo", "Dolore pelvico", "Crampo", "Tremore",
+        "Scottatura", "Puntura d'insetto", "Raggi X", "Ecografia addominale",
+    ],
+    "Portuguese": [
+        "Dor", "Dor no peito", "Dor de cabeça", "Dor nas costas", "Dor abdominal",
+        "Dor de garganta", "Febre", "Tosse", "Tosse seca", "Erupção cutânea", "Inchaço",
+        "Fratura", "Lesão", "Ferida", "Queimadura", "Infecção", "Raio-X", "Radiografia",
+        "Ressonância", "Ressonância magnética", "Tomografia", "Ultrassom", "Ecografia",
+        "Coração", "Pulmão", "Cérebro", "Joelho", "Ombro", "Costas", "Abdômen", "Peito",
+        "Tornozelo", "Pulso", "Quadril", "Pele", "Diabetes", "Hipertensão", "Pressão alta",
+        "Asma", "Pneumonia", "Tumor", "Câncer", "Cancro", "Cisto", "Tontura", "Náusea",
+        "Vômito", "Diarreia", "Cansaço", "Coceira", "Alergia", "Enxaqueca", "Entorse",
+        "Artrite", "Ansiedade", "Gravidez", "Gripe",
+        "Dor de dente", "Dor de ouvido", "Dor de estômago", "Dor de barriga", "Dor muscular",
+        "Dor nas articulações", "Dor no joelho", "Dor lombar", "Dor no pescoço", "Dor no ombro",
+        "Calafrios", "Suores noturnos", "Fraqueza", "Desmaio", "Vertigem", "Dormência",
+        "Formigamento", "Falta de ar", "Dificuldade para respirar", "Chiado no peito",
+        "Nariz entupido", "Espirros", "Prisão de ventre", "Constipação", "Azia", "Indigestão",
+        "Inchaço abdominal", "Perda de peso", "Sangramento", "Hemorragia", "Hematoma", "Bolha",
+        "Caroço", "Nódulo", "Palpitações", "Convulsões", "Insônia", "Depressão", "Visão turva",
+        "Perda auditiva", "Zumbido no ouvido", "Queda de cabelo", "Luxação",
+        "Distensão muscular", "Concussão", "Bronquite", "Tuberculose", "Sinusite", "Amigdalite",
+        "Faringite", "Otite", "Conjuntivite", "Catarata", "Glaucoma", "Eczema", "Psoríase",
+        "Acne", "Dermatite", "Urticária", "Herpes", "Catapora", "Varicela", "Sarampo",
+        "Melanoma", "Câncer de pele", "Câncer de mama", "Câncer de pulmão",
+        "Câncer de próstata", "Leucemia", "Linfoma", "Metástase", "Pólipo", "Infarto",
+        "Ataque cardíaco", "Insuficiência cardíaca", "Arritmia", "Angina", "AVC", "Derrame",
+        "Trombose", "Embolia", "Anemia", "Colesterol alto", "Obesidade", "Hipotireoidismo",
+        "Hipertireoidismo", "Pedra nos rins", "Cálculo renal", "Cálculo biliar",
+        "Pedra na vesícula", "Infecção urinária", "Cistite", "Apendicite", "Gastrite",
+        "Refluxo", "Colite", "Hemorroidas", "Hérnia", "Hepatite", "Cirrose",
+        "Gordura no fígado", "Pancreatite", "Artrose", "Gota", "Osteoporose", "Escoliose",
+        "Hérnia de disco", "Ciática", "Tendinite", "Bursite", "Epilepsia", "Demência",
+        "Alzheimer", "Parkinson", "Esclerose múltipla", "Desidratação", "Sepse", "Edema",
+        "Enfisema", "Cabeça", "Pescoço", "Coluna", "Coluna vertebral", "Braço", "Cotovelo",
+        "Mão", "Dedo", "Perna", "Coxa", "Pé", "Calcanhar", "Olho", "Olhos", "Ouvido", "Orelha",
+        "Nariz", "Boca", "Garganta", "Dente", "Dentes", "Gengiva", "Mandíbula", "Fígado",
+        "Rins", "Bexiga", "Estômago", "Intestino", "Pâncreas", "Tireoide", "Próstata", "Útero",
+        "Ovário", "Músculo", "Osso", "Ossos", "Tendão", "Ligamento", "Articulação", "Nervo",
+        "Artéria", "Veia", "Sangue", "Exame de sangue", "Exame de urina", "Biópsia",
+        "Endoscopia", "Colonoscopia", "Mamografia", "Eletrocardiograma", "Cirurgia", "Operação",
+        "Vacina", "Injeção", "Antibiótico", "Medicamento", "Receita", "Fisioterapia",
+        "Quimioterapia", "Radioterapia", "Diálise", "Transplante", "Paracetamol", "Ibuprofeno",
+        "Aspirina", "Insulina", "Pressão baixa", "Glicemia", "Açúcar no sangue", "Resfriado",
+        "Constipação nasal", "Covid", "Cólica menstrual", "Aborto espontâneo", "Parto",
+        "Cesariana", "Dor pélvica", "Cãibra", "Tremor", "Queimadura solar", "Picada de inseto",
+    ],
+    "Hindi": [
+        "दर्द", "सीने में दर्द", "सिरदर्द", "सिर दर्द", "पीठ दर्द", "पेट दर्द", "गले में खराश",
+        "बुखार", "खांसी", "सूखी खांसी", "चकत्ते", "सूजन", "फ्रैक्चर", "हड्डी टूटना", "चोट", "घाव",
+        "जलन", "संक्रमण", "एक्स-रे", "एमआरआई", "सीटी स्कैन", "अल्ट्रासाउंड", "हृदय", "दिल",
+        "फेफड़े", "मस्तिष्क", "घुटना", "घुटने", "कंधा", "कंधे", "पीठ", "पेट", "छाती", "टखना",
+        "कलाई", "कूल्हा", "त्वचा", "मधुमेह", "डायबिटीज", "उच्च रक्तचाप", "दमा", "अस्थमा",
+        "निमोनिया", "ट्यूमर", "कैंसर", "चक्कर", "मतली", "उल्टी", "दस्त", "थकान", "खुजली",
+        "एलर्जी", "माइग्रेन", "मोच", "गठिया", "चिंता", "गर्भावस्था", "फ्लू",
+        "दांत दर्द", "कान दर्द", "मांसपेशियों में दर्द", "जोड़ों का दर्द", "घुटने का दर्द",
+        "कमर दर्द", "गर्दन दर्द", "कंधे का दर्द", "ठंड लगना", "कंपकंपी", "रात को पसीना",
+        "कमजोरी", "बेहोशी", "सुन्नपन", "झुनझुनी", "सांस फूलना", "सांस लेने में तकलीफ",
+        "नाक बंद", "छींक", "कब्ज", "सीने में जलन", "एसिडिटी", "अपच", "पेट फूलना", "गैस",
+        "वजन कम होना", "खून बहना", "रक्तस्राव", "नील", "छाला", "गांठ", "धड़कन", "दौरा",
+        "मिर्गी", "अनिद्रा", "अवसाद", "डिप्रेशन", "धुंधला दिखना", "सुनने में कमी",
+        "कान में घंटी बजना", "बाल झड़ना", "हड्डी खिसकना", "मांसपेशियों में खिंचाव",
+        "ब्रोंकाइटिस", "तपेदिक", "टीबी", "साइनस", "टॉन्सिल", "आंख आना", "मोतियाबिंद",
+        "काला मोतिया", "एक्जिमा", "सोरायसिस", "मुंहासे", "पित्ती", "दाद", "चिकनपॉक्स",
+        "छोटी माता", "खसरा", "त्वचा कैंसर", "स्तन कैंसर", "फेफड़ों का कैंसर", "ल्यूकेमिया",
+        "दिल का दौरा", "हार्ट अटैक", "हृदय गति रुकना", "लकवा", "स्ट्रोक", "खून का थक्का",
+        "खून की कमी", "एनीमिया", "कोलेस्ट्रॉल", "मोटापा", "थायराइड", "गुर्दे की पथरी", "पथरी",
+        "पित्त की पथरी", "मूत्र संक्रमण", "अपेंडिसाइटिस", "बवासीर", "हर्निया", "हेपेटाइटिस",
+        "पीलिया", "फैटी लिवर", "गठिया रोग", "ऑस्टियोपोरोसिस", "साइटिका", "स्लिप डिस्क",
+        "डिमेंशिया", "पार्किंसन", "पानी की कमी", "डिहाइड्रेशन", "सिर", "गर्दन", "रीढ़",
+        "रीढ़ की हड्डी", "हाथ", "कोहनी", "उंगली", "पैर", "जांघ", "एड़ी", "आंख", "आंखें", "कान",
+        "नाक", "मुंह", "गला", "दांत", "मसूड़े", "जबड़ा", "जिगर", "लीवर", "गुर्दा", "किडनी",
+        "मूत्राशय", "आंत", "अग्न्याशय", "प्रोस्टेट", "गर्भाशय", "अंडाशय", "स्तन", "मांसपेशी",
+        "हड्डी", "नस", "धमनी", "खून", "रक्त", "खून की जांच", "ब्लड टेस्ट", "पेशाब की जांच",
+        "बायोप्सी", "एंडोस्कोपी", "ईसीजी", "ऑपरेशन", "सर्जरी", "टीका", "वैक्सीन", "इंजेक्शन",
+        "एंटीबायोटिक", "दवा", "दवाई", "फिजियोथेरेपी", "कीमोथेरेपी", "डायलिसिस", "पैरासिटामोल",
+        "इंसुलिन", "ब्लड प्रेशर", "रक्तचाप", "निम्न रक्तचाप", "शुगर", "ब्लड शुगर", "सर्दी",
+        "जुकाम", "कोविड", "कोरोना", "डेंगू", "मलेरिया", "टाइफाइड", "पीरियड्स का दर्द",
+        "गर्भपात", "प्रसव", "सिजेरियन", "ऐंठन", "कंपन", "सनबर्न", "कीड़े का काटना",
+        "कुत्ते का काटना",
+    ],
+    "Japanese": [
+        "痛み", "胸痛", "胸の痛み", "頭痛", "腰痛", "背中の痛み", "腹痛", "喉の痛み", "発熱",
+        "咳", "空咳", "発疹", "湿疹", "腫れ", "骨折", "怪我", "けが", "傷", "火傷",
+        "やけど", "感染", "感染症", "レントゲン", "X線", "MRI", "CT", "超音波", "エコー",
+        "心臓", "肺", "脳", "膝", "肩", "背中", "腹部", "お腹", "胸", "足首", "手首", "股関節",
+        "皮膚", "糖尿病", "高血圧", "喘息", "肺炎", "腫瘍", "がん", "癌", "嚢胞", "めまい",
+        "吐き気", "嘔吐", "下痢", "疲労", "倦怠感", "かゆみ", "アレルギー", "片頭痛", "捻挫",
+        "関節炎", "不安", "妊娠", "インフルエンザ",
+        "歯痛", "耳の痛み", "胃痛", "筋肉痛", "関節痛", "膝の痛み", "首の痛み", "肩こり", "肩の痛み", "悪寒", "寝汗", "脱力感",
+        "失神", "しびれ", "息切れ", "呼吸困難", "喘鳴", "鼻づまり", "くしゃみ", "便秘", "胸やけ", "消化不良", "腹部膨満", "体重減少",
+        "出血", "あざ", "打撲", "水ぶくれ", "しこり", "動悸", "発作", "けいれん", "不眠", "不眠症", "うつ病", "かすみ目", "難聴",
+        "耳鳴り", "脱毛", "脱臼", "肉離れ", "脳震盪", "気管支炎", "結核", "副鼻腔炎", "扁桃炎", "咽頭炎", "中耳炎", "結膜炎",
+        "白内障", "緑内障", "アトピー性皮膚炎", "乾癬", "にきび", "皮膚炎", "じんましん", "蕁麻疹", "ヘルペス", "帯状疱疹", "水ぼうそう",
+        "麻疹", "はしか", "皮膚がん", "乳がん", "肺がん", "胃がん", "大腸がん", "前立腺がん", "白血病", "リンパ腫", "転移", "ポリープ",
+        "心筋梗塞", "心不全", "不整脈", "狭心症", "心房細動", "脳卒中", "脳梗塞", "脳出血", "血栓", "血栓症", "貧血", "高コレステロール",
+        "脂質異常症", "肥満", "甲状腺", "甲状腺機能低下症", "甲状腺機能亢進症", "腎臓結石", "尿路結石", "胆石", "尿路感染症", "膀胱炎",
+        "虫垂炎", "盲腸", "胃炎", "逆流性食道炎", "胃潰瘍", "痔", "ヘルニア", "椎間板ヘルニア", "肝炎", "肝硬変", "脂肪肝", "膵炎",
+        "変形性関節症", "関節リウマチ", "痛風", "骨粗しょう症", "側弯症", "坐骨神経痛", "腱鞘炎", "てんかん", "認知症", "アルツハイマー",
+        "パーキンソン病", "多発性硬化症", "脱水", "脱水症状", "熱中症", "敗血症", "むくみ", "浮腫", "背骨", "太もも", "かかと", "歯ぐき",
+        "肝臓", "腎臓", "膀胱", "大腸", "膵臓", "前立腺", "子宮", "卵巣", "乳房", "筋肉", "靭帯", "関節", "神経", "動脈",
+        "静脈", "血液", "血液検査", "尿検査", "生検", "内視鏡", "胃カメラ", "大腸内視鏡", "マンモグラフィ", "心電図", "手術", "ワクチン",
+        "予防接種", "注射", "抗生物質", "処方箋", "リハビリ", "理学療法", "抗がん剤", "化学療法", "放射線治療", "透析", "移植", "解熱剤",
+        "鎮痛剤", "アセトアミノフェン", "イブプロフェン", "インスリン", "血圧", "低血圧", "血糖値", "風邪", "コロナ", "新型コロナ", "生理痛",
+        "流産", "出産", "帝王切開", "骨盤痛", "こむら返り", "震え", "日焼け", "虫刺され", "咳嗽",
+    ],
+    "Chinese": [
+        "疼痛", "胸痛", "头痛", "頭痛", "背痛", "腰痛", "腹痛", "喉咙痛", "咽喉痛", "发烧",
+        "發燒", "发热", "咳嗽", "干咳", "皮疹", "湿疹", "肿胀", "骨折", "受伤", "损伤", "伤口",
+        "烧伤", "感染", "X光", "X光片", "核磁共振", "CT扫描", "超声波", "B超", "心脏", "肺",
+        "肺部", "大脑", "脑", "膝盖", "肩膀", "背部", "腹部", "胸部", "脚踝", "手腕", "髋关节",
+        "皮肤", "糖尿病", "高血压", "哮喘", "肺炎", "肿瘤", "癌症", "囊肿", "头晕", "眩晕",
+        "恶心", "呕吐", "腹泻", "疲劳", "乏力", "瘙痒", "过敏", "偏头痛", "扭伤", "关节炎",
+        "焦虑", "怀孕", "流感",
+        "牙痛", "耳痛", "胃痛", "肌肉痛", "关节痛", "膝盖痛", "颈部疼痛", "脖子痛", "肩痛", "发冷", "寒战", "盗汗", "虚弱",
+        "晕厥", "麻木", "刺痛", "气短", "呼吸困难", "喘息", "鼻塞", "打喷嚏", "便秘", "烧心", "胃灼热", "消化不良", "腹胀",
+        "体重下降", "出血", "淤青", "瘀伤", "水泡", "肿块", "心悸", "抽搐", "癫痫", "失眠", "抑郁", "抑郁症", "视力模糊",
+        "听力下降", "耳鸣", "脱发", "脱臼", "拉伤", "脑震荡", "支气管炎", "结核", "肺结核", "鼻窦炎", "扁桃体炎", "咽炎", "中耳炎",
+        "结膜炎", "白内障", "青光眼", "皮炎", "银屑病", "牛皮癣", "痤疮", "青春痘", "荨麻疹", "疱疹", "带状疱疹", "水痘", "麻疹",
+        "皮肤癌", "乳腺癌", "肺癌", "胃癌", "肝癌", "结肠癌", "直肠癌", "前列腺癌", "白血病", "淋巴瘤", "转移", "息肉", "心肌梗死",
+        "心脏病", "心力衰竭", "心律失常", "心绞痛", "房颤", "中风", "脑卒中", "脑梗", "脑出血", "血栓", "贫血", "高血脂", "胆固醇",
+        "肥胖", "甲状腺", "甲减", "甲亢", "肾结石", "胆结石", "尿路感染", "膀胱炎", "阑尾炎", "胃炎", "胃溃疡", "胃食管反流", "反流",
+        "结肠炎", "痔疮", "疝气", "肝炎", "乙肝", "肝硬化", "脂肪肝", "胰腺炎", "骨关节炎", "类风湿关节炎", "痛风", "骨质疏松",
+        "脊柱侧弯", "椎间盘突出", "坐骨神经痛", "肌腱炎", "痴呆", "阿尔茨海默病", "帕金森病", "多发性硬化", "脱水", "中暑", "败血症",
+        "水肿", "肺气肿", "头部", "颈部", "脊柱", "手臂", "手肘", "手指", "大腿", "脚跟", "眼睛", "耳朵", "鼻子", "嘴巴",
+        "喉咙", "牙齿", "牙龈", "下巴", "肝脏", "肾脏", "膀胱", "胃部", "肠道", "结肠", "胰腺", "前列腺", "子宫", "卵巢",
+        "乳房", "肌肉", "骨头", "肌腱", "韧带", "关节", "神经", "动脉", "静脉", "血液", "验血", "血常规", "尿检", "尿常规",
+        "活检", "内窥镜", "胃镜", "肠镜", "乳腺钼靶", "心电图", "手术", "疫苗", "接种", "打针", "注射", "抗生素", "药物", "处方",
+        "物理治疗", "康复", "化疗", "放疗", "透析", "移植", "退烧药", "止痛药", "布洛芬", "对乙酰氨基酚", "阿司匹林", "胰岛素",
+        "血压", "低血压", "血糖", "感冒", "新冠", "新冠肺炎", "痛经", "流产", "分娩", "剖腹产", "盆腔痛", "抽筋", "颤抖", "晒伤",
+        "虫咬", "核磁", "CT检查", "彩超",
+    ],
+    "Arabic": [
+        "ألم", "ألم في الصدر", "ألم الصدر", "صداع", "الصداع", "ألم الظهر", "ألم في الظهر",
+        "ألم في البطن", "التهاب الحلق", "حمى", "الحمى", "سعال", "السعال", "سعال جاف", "طفح",
+        "طفح جلدي", "تورم", "كسر", "إصابة", "جرح", "حرق", "عدوى", "التهاب", "أشعة سينية",
+        "الأشعة السينية", "رنين مغناطيسي", "الرنين المغناطيسي", "أشعة مقطعية", "موجات فوق صوتية",
+        "القلب", "رئة", "الرئة", "دماغ", "الدماغ", "ركبة", "الركبة", "كتف", "الكتف",
+        "بطن", "البطن", "الصدر", "كاحل", "معصم", "ورك", "جلد", "الجلد",
+        "سكري", "السكري", "ضغط الدم", "ارتفاع ضغط الدم", "ربو", "الربو", "التهاب رئوي", "ورم",
+        "سرطان", "السرطان", "دوخة", "دوار", "غثيان", "قيء", "إسهال", "تعب", "إرهاق",
+        "حكة", "حساسية", "الصداع النصفي", "التواء", "التهاب المفاصل", "قلق", "الحمل", "إنفلونزا",
+        "ألم الأسنان", "ألم الأذن", "ألم المعدة", "ألم العضلات", "آلام العضلات", "ألم المفاصل",
+        "ألم الركبة", "ألم أسفل الظهر", "ألم الرقبة", "ألم الكتف", "قشعريرة", "تعرق ليلي",
+        "ضعف", "إغماء", "خدر", "تنميل", "ضيق التنفس", "صعوبة التنفس", "أزيز", "انسداد الأنف",
+        "عطس", "إمساك", "حرقة المعدة", "عسر الهضم", "انتفاخ", "فقدان الوزن", "نزيف", "كدمة",
+        "بثور", "كتلة", "خفقان", "تشنجات", "صرع", "الصرع", "أرق", "اكتئاب", "الاكتئاب",
+        "تشوش الرؤية", "ضعف السمع", "طنين", "تساقط الشعر", "خلع", "شد عضلي", "ارتجاج",
+        "التهاب الشعب الهوائية", "سل", "السل", "التهاب الجيوب الأنفية", "التهاب اللوزتين",
+        "التهاب البلعوم", "التهاب الأذن", "التهاب الملتحمة", "إعتام عدسة العين",
+        "المياه البيضاء", "المياه الزرقاء", "إكزيما", "الأكزيما", "صدفية", "الصدفية",
+        "حب الشباب", "التهاب الجلد", "شرى", "هربس", "الهربس النطاقي", "جدري الماء", "الحصبة",
+        "سرطان الجلد", "سرطان الثدي", "سرطان الرئة", "سرطان البروستاتا", "سرطان القولون",
+        "اللوكيميا", "سرطان الدم", "ورم لمفاوي", "سليلة", "نوبة قلبية", "جلطة قلبية",
+        "فشل القلب", "عدم انتظام ضربات القلب", "ذبحة صدرية", "سكتة دماغية", "جلطة دماغية",
+        "جلطة", "تجلط الدم", "فقر الدم", "أنيميا", "الكوليسترول", "سمنة", "السمنة",
+        "الغدة الدرقية", "قصور الغدة الدرقية", "فرط نشاط الغدة الدرقية", "حصوات الكلى",
+        "حصى الكلى", "حصوات المرارة", "التهاب المسالك البولية", "التهاب المثانة",
+        "التهاب الزائدة الدودية", "التهاب المعدة", "ارتجاع المريء", "قرحة المعدة", "البواسير",
+        "فتق", "التهاب الكبد", "تليف الكبد", "الكبد الدهني", "التهاب البنكرياس",
+        "خشونة المفاصل", "النقرس", "هشاشة العظام", "الجنف", "الانزلاق الغضروفي", "عرق النسا",
+        "التهاب الأوتار", "الخرف", "الزهايمر", "باركنسون", "التصلب المتعدد", "جفاف", "الجفاف",
+        "ضربة شمس", "تسمم الدم", "وذمة", "رأس", "الرأس", "رقبة", "الرقبة", "العمود الفقري",
+        "ذراع", "الذراع", "كوع", "يد", "اليد", "إصبع", "ساق", "الساق", "فخذ", "قدم", "القدم",
+        "كعب", "عين", "العين", "أذن", "الأذن", "أنف", "الأنف", "فم", "الفم", "حلق", "الحلق",
+        "أسنان", "الأسنان", "لثة", "اللثة", "فك", "كبد", "الكبد", "كلية", "الكلى", "مثانة",
+        "المثانة", "معدة", "المعدة", "أمعاء", "الأمعاء", "القولون", "البنكرياس", "البروستاتا",
+        "رحم", "الرحم", "مبيض", "ثدي", "الثدي", "عضلة", "عضلات", "عظم", "عظام", "وتر", "رباط",
+        "مفصل", "المفاصل", "عصب", "شريان", "وريد", "دم", "الدم", "تحليل دم", "تحليل الدم",
+        "فحص الدم", "تحليل البول", "خزعة", "منظار", "تنظير القولون", "تصوير الثدي",
+        "تخطيط القلب", "عملية جراحية", "جراحة", "لقاح", "تطعيم", "حقنة", "مضاد حيوي",
+        "مضادات حيوية", "دواء", "أدوية", "وصفة طبية", "علاج طبيعي", "علاج كيميائي",
+        "علاج إشعاعي", "غسيل الكلى", "باراسيتامول", "إيبوبروفين", "أسبرين", "أنسولين",
+        "ضغط منخفض", "سكر الدم", "نزلة برد", "زكام", "كورونا", "كوفيد", "آلام الدورة", "إجهاض",
+        "ولادة", "ولادة قيصرية", "ألم الحوض", "تقلص", "رعشة", "حروق الشمس", "لدغة حشرة",
+    ],
+    "Russian": [
+        "Боль", "Боль в груди", "Головная боль", "Боль в спине", "Боль в животе",
+        "Боль в горле", "Температура", "Лихорадка", "Кашель", "Сухой кашель", "Сыпь", "Отёк",
+        "Отек", "Припухлость", "Перелом", "Травма", "Рана", "Ожог", "Инфекция", "Воспаление",
+        "Рентген", "Рентгеновский снимок", "МРТ", "КТ", "УЗИ", "Сердце", "Лёгкие", "Легкие",
+        "Лёгкое", "Мозг", "Колено", "Плечо", "Спина", "Живот", "Грудь", "Лодыжка", "Запястье",
+        "Бедро", "Кожа", "Диабет", "Гипертония", "Давление", "Астма", "Пневмония", "Опухоль",
+        "Рак", "Киста", "Головокружение", "Тошнота", "Рвота", "Диарея", "Понос", "Усталость",
+        "Слабость", "Зуд", "Аллергия", "Мигрень", "Растяжение", "Артрит", "Тревога",
+        "Беременность", "Грипп",
+        "Зубная боль", "Боль в ухе", "Боль в желудке", "Мышечная боль", "Боль в суставах",
+        "Боль в колене", "Боль в пояснице", "Боль в шее", "Боль в плече", "Озноб",
+        "Ночная потливость", "Обморок", "Онемение", "Покалывание", "Одышка",
+        "Затруднённое дыхание", "Хрипы", "Заложенность носа", "Насморк", "Чихание", "Запор",
+        "Изжога", "Несварение", "Вздутие живота", "Потеря веса", "Кровотечение", "Синяк",
+        "Ушиб", "Волдырь", "Шишка", "Уплотнение", "Сердцебиение", "Судороги", "Эпилепсия",
+        "Бессонница", "Депрессия", "Нечёткое зрение", "Потеря слуха", "Шум в ушах",
+        "Выпадение волос", "Вывих", "Растяжение связок", "Сотрясение мозга", "Бронхит",
+        "Туберкулёз", "Туберкулез", "Синусит", "Гайморит", "Тонзиллит", "Ангина", "Фарингит",
+        "Отит", "Конъюнктивит", "Катаракта", "Глаукома", "Экзема", "Псориаз", "Акне",
+        "Дерматит", "Крапивница", "Герпес", "Опоясывающий лишай", "Ветрянка", "Ветряная оспа",
+        "Корь", "Меланома", "Рак кожи", "Рак груди", "Рак молочной железы", "Рак лёгких",
+        "Рак простаты", "Рак желудка", "Лейкемия", "Лейкоз", "Лимфома", "Метастазы", "Полип",
+        "Инфаркт", "Сердечная недостаточность", "Аритмия", "Стенокардия",
+        "Мерцательная аритмия", "Инсульт", "Тромбоз", "Тромб", "Эмболия", "Анемия",
+        "Малокровие", "Холестерин", "Ожирение", "Щитовидная железа", "Гипотиреоз",
+        "Гипертиреоз", "Камни в почках", "Камни в желчном пузыре",
+        "Инфекция мочевыводящих путей", "Цистит", "Аппендицит", "Гастрит", "Рефлюкс",
+        "Язва желудка", "Колит", "Геморрой", "Грыжа", "Гепатит", "Цирроз", "Жировой гепатоз",
+        "Панкреатит", "Артроз", "Подагра", "Остеопороз", "Сколиоз", "Грыжа диска",
+        "Межпозвоночная грыжа", "Радикулит", "Ишиас", "Тендинит", "Деменция",
+        "Болезнь Альцгеймера", "Болезнь Паркинсона", "Рассеянный склероз", "Обезвоживание",
+        "Тепловой удар", "Сепсис", "Эмфизема", "Голова", "Шея", "Позвоночник", "Рука", "Локоть",
+        "Кисть", "Палец", "Нога", "Стопа", "Пятка", "Глаз", "Глаза", "Ухо", "Нос", "Рот",
+        "Горло", "Зуб", "Зубы", "Десна", "Челюсть", "Печень", "Почка", "Почки",
+        "Мочевой пузырь", "Желудок", "Кишечник", "Толстая кишка", "Поджелудочная железа",
+        "Простата", "Матка", "Яичник", "Молочная железа", "Мышца", "Кость", "Кости",
+        "Сухожилие", "Связка", "Сустав", "Нерв", "Артерия", "Вена", "Кровь", "Анализ крови",
+        "Общий анализ крови", "Анализ мочи", "Биопсия", "Эндоскопия", "Гастроскопия",
+        "Колоноскопия", "Маммография", "ЭКГ", "Операция", "Вакцина", "Прививка", "Укол",
+        "Инъекция", "Антибиотик", "Лекарство", "Рецепт", "Физиотерапия", "Химиотерапия",
+        "Лучевая терапия", "Диализ", "Пересадка", "Трансплантация", "Парацетамол", "Ибупрофен",
+        "Аспирин", "Инсулин", "Низкое давление", "Высокое давление", "Сахар в крови",
+        "Простуда", "ОРВИ", "Ковид", "Коронавирус", "Болезненные месячные", "Выкидыш", "Роды",
+        "Кесарево сечение", "Боль внизу живота", "Спазм", "Дрожь", "Солнечный ожог",
+        "Укус насекомого", "Компьютерная томография", "Флюорография",
+    ],
+    "Korean": [
+        "통증", "흉통", "가슴 통증", "두통", "요통", "허리 통증", "복통", "인후통", "목 통증",
+        "발열", "기침", "마른기침", "발진", "습진", "부기", "붓기", "골절", "부상", "상처",
+        "화상", "감염", "엑스레이", "X선", "MRI", "CT", "초음파", "심장", "폐", "뇌", "무릎",
+        "어깨", "허리", "복부", "가슴", "발목", "손목", "고관절", "피부", "당뇨",
+        "당뇨병", "고혈압", "천식", "폐렴", "종양", "낭종", "어지럼증", "현기증", "메스꺼움",
+        "구토", "설사", "피로", "가려움", "알레르기", "편두통", "염좌", "관절염", "불안", "임신",
+        "독감",
+        "치통", "귀 통증", "위통", "근육통", "관절통", "무릎 통증", "어깨 통증", "오한", "식은땀", "쇠약", "실신", "저림", "마비",
+        "숨가쁨", "호흡곤란", "쌕쌕거림", "코막힘", "재채기", "변비", "속쓰림", "소화불량", "복부 팽만", "체중 감소", "출혈", "타박상",
+        "물집", "두근거림", "심계항진", "경련", "발작", "간질", "뇌전증", "불면증", "우울증", "시야 흐림", "난청", "청력 저하",
+        "이명", "탈모", "탈구", "근육 파열", "뇌진탕", "기관지염", "결핵", "부비동염", "축농증", "편도염", "인두염", "중이염",
+        "결막염", "백내장", "녹내장", "아토피", "아토피 피부염", "건선", "여드름", "피부염", "두드러기", "헤르페스", "대상포진", "수두",
+        "홍역", "피부암", "유방암", "폐암", "위암", "대장암", "간암", "전립선암", "백혈병", "림프종", "전이", "용종", "심근경색",
+        "심장마비", "심부전", "부정맥", "협심증", "심방세동", "뇌졸중", "뇌경색", "뇌출혈", "혈전", "혈전증", "빈혈", "고지혈증",
+        "콜레스테롤", "비만", "갑상선", "갑상선 기능 저하증", "갑상선 기능 항진증", "신장 결석", "요로결석", "담석", "요로감염", "방광염",
+        "맹장염", "충수염", "위염", "역류성 식도염", "위궤양", "대장염", "치질", "탈장", "디스크", "허리 디스크", "간염", "간경변",
+        "지방간", "췌장염", "골관절염", "류마티스 관절염", "통풍", "골다공증", "척추측만증", "좌골신경통", "건염", "치매", "알츠하이머",
+        "파킨슨병", "다발성 경화증", "탈수", "열사병", "패혈증", "부종", "폐기종", "머리", "척추", "팔꿈치", "손가락", "다리",
+        "허벅지", "발뒤꿈치", "목구멍", "치아", "잇몸", "신장", "콩팥", "방광", "위장", "대장", "췌장", "전립선", "자궁", "난소",
+        "유방", "근육", "힘줄", "인대", "관절", "신경", "동맥", "정맥", "혈액", "혈액검사", "피검사", "소변검사", "조직검사",
+        "내시경", "위내시경", "대장내시경", "유방촬영", "심전도", "수술", "백신", "예방접종", "주사", "항생제", "처방전", "물리치료",
+        "재활", "항암치료", "화학요법", "방사선 치료", "투석", "이식", "해열제", "진통제", "타이레놀", "이부프로펜", "아스피린",
+        "인슐린", "혈압", "저혈압", "혈당", "감기", "코로나", "생리통", "유산", "출산", "제왕절개", "골반 통증", "떨림",
+        "햇볕 화상", "벌레 물림",
+    ],
+}
@@ -22,6 +22,15 @@ def get_system_prompt(language: str = "English") -> str:
     Disclaimer: This is an AI-generated analysis for informational purposes only. Always consult a licensed medical professional.
     """
 
+def get_translation_prompt(language: str) -> str:
+    """Instruction for translating a section of an analysis into another language"""
+    return f"""
+    Translate the following section of a medical analysis into {language}.
+    Keep the Markdown structure, headings, bold markers, lists and numbers exactly as they are.
+    Translate medical terms accurately and keep drug names unchanged.
+    Output only the translation, with no preface or commentary.
+    """
+
 # Prompt Style Templates
 PROMPT_STYLES = {
     "Professional & Detailed": {
@@ -14,30 +14,45 @@ AVAILABLE_MODELS = {
         "name": "gemini-2.5-pro",
         "provider": "google",
         "max_tokens": 8192,
+        "max_image_pixels": 3072 * 3072,
+        "rpm": 5,  # Free-tier requests per minute
+        "tpm": 250_000,  # Free-tier tokens per minute
         "description": "🧠 Advanced thinking, complex reasoning"
     },
     "Gemini 2.5 Flash": {
         "name": "gemini-2.5-flash",
         "provider": "google",
         "max_tokens": 8192,
+        "max_image_pixels": 2048 * 2048,
+        "rpm": 10,  # Free-tier requests per minute
+        "tpm": 250_000,  # Free-tier tokens per minute
         "description": "⚡ Best balance of speed & quality"
     },
     "Gemini 2.5 Flash-Lite": {
         "name": "gemini-2.5-flash-lite",
         "provider": "google",
         "max_tokens": 8192,
+        "max_image_pixels": 1536 * 1536,
+        "rpm": 15,  # Free-tier requests per minute
+        "tpm": 250_000,  # Free-tier tokens per minute
         "description": "🚀 Ultra fast, most cost-efficient"
     },
     "Gemini 2.0 Flash": {
         "name": "gemini-2.0-flash",
         "provider": "google",
         "max_tokens": 8192,
+        "max_image_pixels": 2048 * 2048,
+        "rpm": 15,  # Free-tier requests per minute
+        "tpm": 1_000_000,  # Free-tier tokens per minute
         "description": "💪 Workhorse with 1M context"
     },
     "Gemini 2.0 Flash-Lite": {
         "name": "gemini-2.0-flash-lite",
         "provider": "google",
         "max_tokens": 8192,
+        "max_image_pixels": 1536 * 1536,
+        "rpm": 30,  # Free-tier requests per minute
+        "tpm": 1_000_000,  # Free-tier tokens per minute
         "description": "⚙️ Small & efficient, 1M context"
     }
 }
@@ -84,10 +99,14 @@ SUPPORTED_IMAGE_FORMATS = ['png', 'jpg', 'jpeg']
 
 # Session Configuration
 MAX_HISTORY_ITEMS = 10
+API_KEY_CACHE_TTL_SECONDS = 15 * 60  # How long a session keeps its decrypted API key in memory
 SESSION_TOKEN_KEY = "total_tokens"
 SESSION_COST_KEY = "total_cost"
 SESSION_HISTORY_KEY = "conversation_history"
 SESSION_FEEDBACK_KEY = "feedback_stats"
+SESSION_REGENERATION_KEY = "regeneration_savings"
+SESSION_CRYPTO_KEY = "crypto_context"
+SESSION_HEAP_KEY = "session_heap"
 
 # Cost Configuration (per 1M tokens) - FREE TIER
 TOKEN_COST = {
@@ -110,3 +129,114 @@ THEME_COLORS = {
     "error": "#e74c3c",
     "warning": "#f39c12"
 }
+
+# Response Cache Configuration
+RESPONSE_CACHE_ENABLED = True
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # In-process LRU budget
+RESPONSE_CACHE_TTL_SECONDS = 24 * 60 * 60
+RESPONSE_CACHE_DB_PATH = ".cache/response_cache.sqlite3"  # None disables the disk tier
+RESPONSE_CACHE_REPLAY_CHUNK_CHARS = 80
+
+# Similar Image Reuse (perceptual hashes of analyzed images, answered from the response cache)
+SIMILAR_IMAGE_ENABLED = True
+SIMILAR_IMAGE_HASH = "phash"  # "phash" (DCT, robust to re-photographing) or "dhash" (gradients, cheaper)
+SIMILAR_IMAGE_MAX_DISTANCE = 6  # Differing bits out of 64 still treated as the same image
+SIMILAR_IMAGE_INDEX_MAX_ENTRIES = 100_000
+
+# Semantic Cache (near-duplicate text-only queries, answered from the response cache)
+SEMANTIC_CACHE_ENABLED = True
+SEMANTIC_CACHE_THRESHOLD = 0.95  # Cosine similarity needed, on top of identical content words
+SEMANTIC_CACHE_FEATURES = 2 ** 11
+SEMANTIC_CACHE_MAX_ENTRIES = 2000  # Dense float32 rows: about 8 KB each
+
+# Model Client Pool Configuration
+CLIENT_POOL_MAX_MODELS = 64  # Pooled (API key, model, config) entries
+CLIENT_POOL_IDLE_TTL_SECONDS = 15 * 60
+
+# Image Preprocessing Configuration
+IMAGE_PREPROCESS_ENABLED = True
+IMAGE_DEFAULT_MAX_PIXELS = 2048 * 2048  # Used when a model has no "max_image_pixels"
+IMAGE_JPEG_QUALITY = 88
+IMAGE_PREPROCESS_WORKERS = 2
+
+# Image Blob Store Configuration (uploaded images held across reruns, shared by all sessions)
+IMAGE_BLOB_MEMORY_BYTES = 256 * 1024 * 1024
+IMAGE_BLOB_SPILL_DIR = ".cache/image_blobs"  # Referenced images spill to <dir>/<pid> over budget; None keeps them in memory
+IMAGE_BLOB_DISK_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Session Memory Budget (approximate size of session state, summed over all sessions)
+SESSION_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+SESSION_OFFLOAD_DIR = ".cache/sessions"  # Cold sessions' history and results move to <dir>/<pid> over budget
+SESSION_OFFLOAD_IDLE_SECONDS = 300  # Sessions active more recently are never offloaded
+
+# History Storage Configuration
+HISTORY_BACKEND = "sqlite"  # "sqlite" (persistent) or "session" (in-memory, MAX_HISTORY_ITEMS)
+HISTORY_DB_PATH = "data/history.sqlite3"
+HISTORY_PAGE_SIZE = 20
+HISTORY_WRITE_BATCH_SIZE = 32
+HISTORY_FLUSH_INTERVAL_SECONDS = 2.0
+
+# Chat Title Configuration (built-in terms are in config/medical_terms.py)
+CHAT_TITLE_LEXICON_PATH = None  # Optional UTF-8 file of extra terms, one per line
+CHAT_TITLE_MAX_TERMS = 2  # Terms combined into an "... Assessment" title
+
+# Batch Analysis Configuration
+BATCH_DEFAULT_CONCURRENCY = 4
+BATCH_MAX_CONCURRENCY = 16
+BATCH_OUTPUT_FORMATS = ["JSONL", "CSV", "ZIP"]
+
+# Async Generation Configuration
+ASYNC_REQUEST_TIMEOUT_SECONDS = 120  # Whole request, including streaming
+ASYNC_CHUNK_TIMEOUT_SECONDS = 60  # Max gap between streamed chunks
+
+# Rate Limiting Configuration (limits per model are in AVAILABLE_MODELS)
+RATE_LIMIT_ENABLED = True
+RATE_LIMIT_DB_PATH = ".cache/rate_limits.sqlite3"  # Shared across worker processes; None keeps state in-process
+RATE_LIMIT_MAX_WAIT_SECONDS = 120  # Longer queues fail fast with an estimate instead
+RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE = 1024  # Output tokens reserved per request before usage is known
+
+# Resilience Configuration
+RETRY_MAX_ATTEMPTS = 3  # Attempts per model before falling back
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 16.0
+HEDGE_ENABLED = False  # Fire a request to the next fallback model if the first byte is slow
+HEDGE_LATENCY_BUDGET_SECONDS = 8.0
+
+# Fallback order when a model is overloaded or failing (fastest last)
+MODEL_FALLBACK_CHAINS = {
+    "Gemini 2.5 Pro": ["Gemini 2.5 Flash", "Gemini 2.0 Flash-Lite"],
+    "Gemini 2.5 Flash": ["Gemini 2.0 Flash", "Gemini 2.0 Flash-Lite"],
+    "Gemini 2.5 Flash-Lite": ["Gemini 2.0 Flash-Lite"],
+    "Gemini 2.0 Flash": ["Gemini 2.0 Flash-Lite"],
+    "Gemini 2.0 Flash-Lite": []
+}
+
+# Multi-language Fan-out Configuration
+MULTI_LANGUAGE_MAX = 4  # Languages per analysis
+MULTI_LANGUAGE_PIVOT = "English"  # Analyzed directly when selected; others are derived from it
+TRANSLATION_MODEL = "Gemini 2.0 Flash-Lite"
+TRANSLATION_SEGMENT_CHARS = 6000  # Pivot text is translated in a few blocks of about this size (one request each)
+MULTI_LANGUAGE_STRATEGIES = {
+    "Translate": "Analyze once, translate on a lite model while it streams",
+    "Parallel": "Run a full analysis per language at the same time"
+}
+
+# Incremental Regeneration Configuration
+REGENERATION_REUSE_UPLOADS = True  # Upload the image once via the File API and refer to it on regenerate
+UPLOAD_HANDLE_TTL_SECONDS = 47 * 60 * 60  # Uploaded files expire after 48 hours
+UPLOAD_WAIT_SECONDS = 30  # How long a regeneration waits for a pending upload before sending inline
+
+# Headless API Configuration
+API_HOST = "127.0.0.1"
+API_PORT = 8000
+API_WORKERS = 1  # Server processes
+API_MAX_CONCURRENT_ANALYSES = 8  # In-flight generations per process; more requests wait
+API_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+API_ANALYSIS_TTL_SECONDS = 60 * 60  # How long an analysis can be regenerated
+API_MAX_STORED_ANALYSES = 1000
+
+# Metrics Configuration
+METRICS_ENABLED = False  # Span timing on the hot path; a no-op when off
+METRICS_DEBUG_PANEL = True  # Per-request timing breakdown under each analysis (when enabled)
+METRICS_DUMP_PATH = ".cache/metrics.prom"  # Prometheus text rewritten after each request, per process as .cache/metrics.<pid>.prom (series labelled pid); None disables
+METRICS_HISTOGRAM_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
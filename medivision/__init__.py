@@ -0,0 +1,3 @@
+"""
+Command-line entry points for MediVision AI
+"""
@@ -0,0 +1,125 @@
+"""
+Offline batch analysis: python -m medivision INPUT --output DIR [options]
+
+INPUT is a directory of images and/or .txt files (an image and a .txt with
+the same name form one case, identified by the image's relative path) or a
+CSV/JSONL manifest with unique case_id values and text and image columns. Each successful case is written to DIR/reports/<case>.md and
+every attempt is appended to DIR/summary.jsonl with timings and token
+counts. Re-running with the same DIR skips cases that already succeeded.
+"""
+
+import argparse
+import os
+import sys
+import time
+from config.settings import (
+    AVAILABLE_MODELS,
+    DEFAULT_MODEL,
+    GENERATION_CONFIG,
+    SAFETY_SETTINGS,
+    SUPPORTED_LANGUAGES,
+    BATCH_DEFAULT_CONCURRENCY,
+    BATCH_MAX_CONCURRENCY
+)
+from config.prompts import PROMPT_STYLES
+from utils.batch_runner import (
+    DirectoryResultWriter,
+    completed_case_ids,
+    load_cases_from_directory,
+    load_cases_from_manifest,
+    run_batch
+)
+from utils.client_pool import get_client_pool
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m medivision",
+        description="Run MediVision AI analyses over a directory or manifest of cases"
+    )
+    parser.add_argument("input", help="Directory of images/.txt files, or a .csv/.jsonl manifest")
+    parser.add_argument("-o", "--output", required=True, help="Output directory (reused to resume)")
+    parser.add_argument("-m", "--model", default=DEFAULT_MODEL, choices=list(AVAILABLE_MODELS))
+    parser.add_argument("-l", "--language", default="English", choices=SUPPORTED_LANGUAGES)
+    parser.add_argument("-s", "--style", choices=list(PROMPT_STYLES), help="Prompt style")
+    parser.add_argument(
+        "-j", "--concurrency",
+        type=int,
+        default=BATCH_DEFAULT_CONCURRENCY,
+        help=f"Worker threads (1-{BATCH_MAX_CONCURRENCY})"
+    )
+    parser.add_argument("--api-key", help="Google API key (default: $GOOGLE_API_KEY)")
+    parser.add_argument("--limit", type=int, help="Process at most this many pending cases")
+    return parser.parse_args(argv)
+
+
+def load_cases(path: str):
+    if os.path.isdir(path):
+        return load_cases_from_directory(path)
+    return load_cases_from_manifest(path)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    api_key = args.api_key or os.environ.get("GOOGLE_API_KEY")
+    if not api_key:
+        print("error: pass --api-key or set GOOGLE_API_KEY", file=sys.stderr)
+        return 2
+    if not os.path.exists(args.input):
+        print(f"error: {args.input} does not exist", file=sys.stderr)
+        return 2
+
+    try:
+        cases = load_cases(args.input)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    done = completed_case_ids(args.output)
+    pending = [case for case in cases if case.case_id not in done]
+    skipped = len(cases) - len(pending)
+    if args.limit is not None:
+        pending = pending[:args.limit]
+    print(f"{len(cases)} cases, {skipped} already done, {len(pending)} to run", file=sys.stderr)
+    if not pending:
+        return 0
+
+    model = get_client_pool().get_model(
+        api_key=api_key,
+        model_id=AVAILABLE_MODELS[args.model]["name"],
+        generation_config=GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS
+    )
+    prompt_style = PROMPT_STYLES[args.style]["suffix"] if args.style else None
+    concurrency = min(max(1, args.concurrency), BATCH_MAX_CONCURRENCY)
+
+    os.makedirs(args.output, exist_ok=True)
+    failed = 0
+    start = time.perf_counter()
+    with DirectoryResultWriter(args.output, model_name=args.model, language=args.language) as writer:
+        results = run_batch(pending, model, args.model, args.language, prompt_style, concurrency, api_key=api_key)
+        try:
+            for index, result in enumerate(results, start=1):
+                writer.write(result)
+                if result.status != "ok":
+                    failed += 1
+                detail = result.error if result.status != "ok" else f"{result.input_tokens + result.output_tokens} tokens"
+                print(
+                    f"[{index}/{len(pending)}] {result.case_id}: {result.status} "
+                    f"in {result.elapsed_seconds:.1f}s ({detail})",
+                    file=sys.stderr
+                )
+        except KeyboardInterrupt:
+            results.close()
+            print("Interrupted; re-run the same command to resume", file=sys.stderr)
+            return 130
+
+    print(
+        f"Finished {len(pending)} cases in {time.perf_counter() - start:.0f}s: "
+        f"{len(pending) - failed} ok, {failed} failed",
+        file=sys.stderr
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
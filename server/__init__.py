@@ -0,0 +1,3 @@
+"""
+Headless HTTP API package for MediVision AI
+"""
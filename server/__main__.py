@@ -0,0 +1,24 @@
+"""
+Run the headless API: python -m server [--host HOST] [--port PORT] [--workers N]
+
+In-flight generations per worker process are capped by
+API_MAX_CONCURRENT_ANALYSES in config/settings.py.
+"""
+
+import argparse
+import uvicorn
+from config.settings import API_HOST, API_PORT, API_WORKERS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MediVision AI headless API")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=API_WORKERS, help="Server processes")
+    args = parser.parse_args()
+
+    uvicorn.run("server.app:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+"""
+Headless HTTP API for MediVision AI
+
+Serves analysis, regeneration and history over HTTP with server-sent-event
+streaming, for PACS integration and load testing. Prompts, response cache,
+rate limits and history are shared with the Streamlit app; Streamlit itself
+is never imported.
+
+Run with `python -m server` or `uvicorn server.app:app`.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from config.settings import (
+    AVAILABLE_MODELS,
+    DEFAULT_MODEL,
+    SUPPORTED_LANGUAGES,
+    HISTORY_PAGE_SIZE,
+    API_MAX_CONCURRENT_ANALYSES,
+    API_MAX_UPLOAD_BYTES,
+    API_ANALYSIS_TTL_SECONDS,
+    API_MAX_STORED_ANALYSES
+)
+from config.prompts import get_system_prompt, PROMPT_STYLES, REGENERATION_OPTIONS
+from utils.model_handler import prepare_prompt
+from utils.async_model_handler import async_initialize_model, async_generate_response, async_stream_response
+from utils.client_pool import api_key_fingerprint
+from utils.history_store import InMemoryHistoryStore, build_history_item, get_history_store
+from utils.image_processor import preprocess_image, get_max_image_pixels
+from utils.metrics import is_metrics_enabled, observe, render_prometheus
+from utils.rate_limiter import RateLimitExceeded, get_rate_limiter, is_rate_limit_error
+from utils.regeneration import build_followup_contents, get_upload_cache
+from utils.response_cache import build_cache_key, get_response_cache, replay_response
+from utils.token_counter import OutputTokenCounter, estimate_prompt_tokens, resolve_token_usage
+
+
+class APIError(Exception):
+    """An error returned to the client as a JSON body"""
+
+    def __init__(self, status_code: int, message: str, headers: dict = None):
+        self.status_code = status_code
+        self.message = message
+        self.headers = headers
+        super().__init__(message)
+
+
+@dataclass
+class StoredAnalysis:
+    """What a later regeneration of an analysis needs"""
+    owner: str
+    model_name: str
+    language: str
+    input_mode: str
+    query: str
+    prompt_parts: list
+    response: str
+    created_at: float = field(default_factory=time.time)
+
+
+class AnalysisRegistry:
+    """Recent analyses per process, bounded by count and age"""
+
+    def __init__(self, max_items: int = API_MAX_STORED_ANALYSES, ttl_seconds: float = API_ANALYSIS_TTL_SECONDS):
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, analysis_id: str, analysis: StoredAnalysis):
+        with self._lock:
+            self._items[analysis_id] = analysis
+            self._items.move_to_end(analysis_id)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def get(self, owner: str, analysis_id: str) -> Optional[StoredAnalysis]:
+        with self._lock:
+            analysis = self._items.get(analysis_id)
+            if analysis is None or analysis.owner != owner:
+                return None
+            if time.time() - analysis.created_at > self.ttl_seconds:
+                del self._items[analysis_id]
+                return None
+            return analysis
+
+
+@dataclass
+class Generation:
+    """One analyze or regenerate request, ready to run"""
+    analysis_id: str
+    api_key: str
+    owner: str
+    model_name: str
+    language: str
+    input_mode: str
+    query: str
+    prompt_parts: list  # Logical request, used for the cache key and for regeneration
+    request_parts: list  # What is sent (may refer to uploaded files)
+    instruction: Optional[str] = None
+    previous: Optional[StoredAnalysis] = None
+    cache_key: Optional[str] = None
+    cached_response: Optional[str] = None
+    reservation: object = None
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _get_api_key(request: Request) -> str:
+    api_key = request.headers.get("x-goog-api-key", "")
+    authorization = request.headers.get("authorization", "")
+    if not api_key and authorization.lower().startswith("bearer "):
+        api_key = authorization[7:]
+    api_key = api_key.strip()
+    if not api_key:
+        raise APIError(401, "Provide a Google API key in the X-Goog-Api-Key header")
+    return api_key
+
+
+def _history_store(app):
+    store = get_history_store()
+    return store if store is not None else app.state.local_history
+
+
+def _wants_stream(request: Request, fields: dict) -> bool:
+    value = request.query_params.get("stream", fields.get("stream", "true"))
+    return str(value).lower() not in ("0", "false", "no")
+
+
+async def _read_fields(request: Request) -> Tuple[dict, Optional[bytes]]:
+    """Form fields and optional image bytes from multipart or JSON bodies"""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form(max_files=1)
+        fields = {key: value for key, value in form.items() if isinstance(value, str)}
+        upload = form.get("image")
+        image_data = None
+        if upload is not None and not isinstance(upload, str):
+            image_data = await upload.read(API_MAX_UPLOAD_BYTES + 1)
+            if len(image_data) > API_MAX_UPLOAD_BYTES:
+                raise APIError(413, f"Image exceeds {API_MAX_UPLOAD_BYTES // (1024 * 1024)} MB")
+        return fields, image_data or None
+
+    if content_type.startswith("application/json"):
+        try:
+            fields = await request.json()
+        except ValueError:
+            raise APIError(400, "Request body is not valid JSON")
+        if not isinstance(fields, dict):
+            raise APIError(400, "Request body must be a JSON object")
+        return fields, None
+
+    raise APIError(415, "Send multipart/form-data (with an optional image) or application/json")
+
+
+def _prepare(generation: Generation) -> Generation:
+    """Look up the cache and reserve quota before the response starts"""
+    response_cache = get_response_cache()
+    if response_cache is not None:
+        generation.cache_key = build_cache_key(
+            model_name=generation.model_name,
+            prompt_parts=generation.prompt_parts,
+            language=generation.language,
+            instruction=generation.instruction
+        )
+        generation.cached_response = response_cache.get(generation.cache_key)
+
+    rate_limiter = get_rate_limiter()
+    if rate_limiter is not None and generation.cached_response is None:
+        try:
+            generation.reservation = rate_limiter.reserve(
+                generation.api_key,
+                generation.model_name,
+                estimate_prompt_tokens(generation.request_parts)
+            )
+        except RateLimitExceeded as e:
+            raise APIError(429, str(e), headers={"Retry-After": str(int(e.wait_seconds) + 1)})
+    return generation
+
+
+async def _run(app, generation: Generation) -> AsyncIterator[Tuple[str, dict]]:
+    """Generate and record an analysis, yielding (event, data) pairs"""
+    yield "meta", {
+        "analysis_id": generation.analysis_id,
+        "model": generation.model_name,
+        "language": generation.language,
+        "from_cache": generation.cached_response is not None
+    }
+
+    chunks = []
+    try:
+        if generation.cached_response is not None:
+            for chunk in replay_response(generation.cached_response):
+                chunks.append(chunk.text)
+                yield "token", {"text": chunk.text}
+            input_tokens = output_tokens = 0
+        else:
+            # Wait for quota before taking a slot, so idle waiters do not hold one
+            if generation.reservation is not None:
+                await asyncio.sleep(generation.reservation.remaining())
+            async with app.state.generation_slots:
+                started = time.perf_counter()
+                model = await async_initialize_model(generation.api_key, generation.model_name)
+                response = await async_generate_response(model, generation.request_parts, stream=True)
+                output_counter = OutputTokenCounter()
+                async for text in async_stream_response(response):
+                    if not chunks:
+                        observe("api.first_token", time.perf_counter() - started, started)
+                    chunks.append(text)
+                    output_counter.add(text)
+                    yield "token", {"text": text}
+                observe("api.generation", time.perf_counter() - started, started)
+
+            usage = resolve_token_usage(response, generation.request_parts, output_counter)
+            input_tokens, output_tokens = usage.input_tokens, usage.output_tokens
+            if generation.reservation is not None:
+                get_rate_limiter().settle(generation.reservation, usage.total_tokens)
+                generation.reservation = None
+            # An empty stream (e.g. a safety block) is not an answer worth caching
+            if generation.cache_key and chunks:
+                await asyncio.to_thread(get_response_cache().set, generation.cache_key, "".join(chunks))
+    except Exception as e:
+        if generation.reservation is not None and not chunks:
+            # Nothing was generated; refund the estimate
+            get_rate_limiter().settle(generation.reservation, 0)
+            generation.reservation = None
+        yield "error", {
+            "analysis_id": generation.analysis_id,
+            "error": f"{type(e).__name__}: {e}",
+            "rate_limited": is_rate_limit_error(e)
+        }
+        return
+
+    full_response = "".join(chunks)
+    await asyncio.to_thread(_history_store(app).add, generation.owner, build_history_item(
+        query=generation.query or "Image Analysis",
+        response=full_response,
+        input_mode=generation.input_mode,
+        language=generation.language,
+        model=generation.model_name,
+        tokens=input_tokens + output_tokens
+    ))
+
+    if generation.previous is not None:
+        # Further refinements build on this answer
+        generation.previous.response = full_response
+    else:
+        app.state.analyses.put(generation.analysis_id, StoredAnalysis(
+            owner=generation.owner,
+            model_name=generation.model_name,
+            language=generation.language,
+            input_mode=generation.input_mode,
+            query=generation.query,
+            prompt_parts=generation.prompt_parts,
+            response=full_response
+        ))
+
+    yield "done", {
+        "analysis_id": generation.analysis_id,
+        "model": generation.model_name,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "from_cache": generation.cached_response is not None
+    }
+
+
+async def _respond(request: Request, generation: Generation, stream: bool):
+    """SSE stream of the generation, or one JSON body when stream is off"""
+    # Cache lookups and quota reservations hit SQLite (with a busy timeout); keep them off the event loop
+    await asyncio.to_thread(_prepare, generation)
+
+    if stream:
+        async def _events():
+            async for event, data in _run(request.app, generation):
+                yield _sse(event, data)
+
+        return StreamingResponse(
+            _events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    body = {"analysis_id": generation.analysis_id, "response": ""}
+    async for event, data in _run(request.app, generation):
+        if event == "token":
+            body["response"] += data["text"]
+        elif event == "error":
+            return JSONResponse(data, status_code=429 if data["rate_limited"] else 502)
+        else:
+            body.update(data)
+    return JSONResponse(body)
+
+
+async def analyze(request: Request):
+    """POST /v1/analyze: text and/or an image field; streams SSE unless stream=false"""
+    api_key = _get_api_key(request)
+    fields, image_data = await _read_fields(request)
+
+    user_text = str(fields.get("text", "")).strip()
+    model_name = fields.get("model", DEFAULT_MODEL)
+    language = fields.get("language", "English")
+    style_name = fields.get("prompt_style")
+
+    if model_name not in AVAILABLE_MODELS:
+        raise APIError(400, f"Unknown model {model_name!r}; choose one of {list(AVAILABLE_MODELS)}")
+    if language not in SUPPORTED_LANGUAGES:
+        raise APIError(400, f"Unsupported language {language!r}")
+    if style_name and style_name not in PROMPT_STYLES:
+        raise APIError(400, f"Unknown prompt_style {style_name!r}; choose one of {list(PROMPT_STYLES)}")
+    if not (user_text or image_data):
+        raise APIError(400, "Provide text, an image, or both")
+
+    image = None
+    if image_data:
+        try:
+            processed = await asyncio.to_thread(preprocess_image, image_data, get_max_image_pixels(model_name))
+        except Exception as e:
+            raise APIError(400, f"Could not read image: {e}")
+        image = (processed.data, processed.mime_type)
+
+    prompt_style = PROMPT_STYLES[style_name]["suffix"] if style_name else None
+    prompt_parts = prepare_prompt(
+        system_prompt=get_system_prompt(language),
+        user_text=user_text,
+        image_data=image[0] if image else None,
+        prompt_style=prompt_style,
+        image_mime_type=image[1] if image else None
+    )
+    if image and user_text:
+        input_mode = "Text + Image"
+    else:
+        input_mode = "Image Only" if image else "Text Only"
+
+    generation = Generation(
+        analysis_id=uuid.uuid4().hex,
+        api_key=api_key,
+        owner=api_key_fingerprint(api_key),
+        model_name=model_name,
+        language=language,
+        input_mode=input_mode,
+        query=user_text,
+        prompt_parts=prompt_parts,
+        request_parts=prompt_parts,
+        instruction=prompt_style
+    )
+    return await _respond(request, generation, _wants_stream(request, fields))
+
+
+async def regenerate(request: Request):
+    """POST /v1/analyses/{analysis_id}/regenerate: refine with an option or instruction"""
+    api_key = _get_api_key(request)
+    fields, _ = await _read_fields(request)
+    owner = api_key_fingerprint(api_key)
+
+    previous = request.app.state.analyses.get(owner, request.path_params["analysis_id"])
+    if previous is None:
+        raise APIError(404, "Analysis not found or expired; run /v1/analyze again")
+
+    option = fields.get("option")
+    instruction = fields.get("instruction")
+    if option:
+        if option not in REGENERATION_OPTIONS:
+            raise APIError(400, f"Unknown option {option!r}; choose one of {list(REGENERATION_OPTIONS)}")
+        instruction = REGENERATION_OPTIONS[option]["instruction"]
+    if not instruction:
+        raise APIError(400, "Provide an option or an instruction")
+
+    prompt_parts = build_followup_contents(previous.prompt_parts, previous.response, instruction)
+    request_parts = prompt_parts
+    upload_cache = get_upload_cache()
+    image_part = next((p for p in previous.prompt_parts if isinstance(p, dict) and "data" in p), None)
+    if image_part and upload_cache is not None:
+        handle = await asyncio.to_thread(upload_cache.get, api_key, image_part["data"], image_part["mime_type"])
+        if handle:
+            request_parts = build_followup_contents(previous.prompt_parts, previous.response, instruction, handle.part)
+
+    generation = Generation(
+        analysis_id=request.path_params["analysis_id"],
+        api_key=api_key,
+        owner=owner,
+        model_name=previous.model_name,
+        language=previous.language,
+        input_mode=previous.input_mode,
+        query=previous.query,
+        prompt_parts=prompt_parts,
+        request_parts=request_parts,
+        instruction=instruction,
+        previous=previous
+    )
+    return await _respond(request, generation, _wants_stream(request, fields))
+
+
+async def list_history(request: Request):
+    """GET /v1/history?offset=&limit=: most recent first"""
+    owner = api_key_fingerprint(_get_api_key(request))
+    try:
+        offset = max(0, int(request.query_params.get("offset", 0)))
+        limit = min(100, max(1, int(request.query_params.get("limit", HISTORY_PAGE_SIZE))))
+    except ValueError:
+        raise APIError(400, "offset and limit must be integers")
+
+    store = _history_store(request.app)
+    items = await asyncio.to_thread(store.list, owner, offset=offset, limit=limit)
+    stats = await asyncio.to_thread(store.stats, owner)
+    return JSONResponse({
+        "items": items,
+        "offset": offset,
+        "limit": limit,
+        "stats": stats
+    })
+
+
+async def get_history_entry(request: Request):
+    """GET /v1/history/{item_id}"""
+    owner = api_key_fingerprint(_get_api_key(request))
+    item = await asyncio.to_thread(_history_store(request.app).get, owner, request.path_params["item_id"])
+    if item is None:
+        raise APIError(404, "History item not found")
+    return JSONResponse(item)
+
+
+async def health(request: Request):
+    return JSONResponse({"status": "ok"})
+
+
+async def metrics(request: Request):
+    """GET /metrics: span latency histograms in Prometheus text format"""
+    if not is_metrics_enabled():
+        raise APIError(404, "Metrics are disabled (METRICS_ENABLED)")
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+async def _handle_api_error(request: Request, exc: APIError):
+    return JSONResponse({"error": exc.message}, status_code=exc.status_code, headers=exc.headers)
+
+
+def create_app(max_concurrent_analyses: int = API_MAX_CONCURRENT_ANALYSES) -> Starlette:
+    """Build the ASGI application"""
+    app = Starlette(
+        routes=[
+            Route("/healthz", health),
+            Route("/metrics", metrics),
+            Route("/v1/analyze", analyze, methods=["POST"]),
+            Route("/v1/analyses/{analysis_id}/regenerate", regenerate, methods=["POST"]),
+            Route("/v1/history", list_history),
+            Route("/v1/history/{item_id:int}", get_history_entry)
+        ],
+        exception_handlers={APIError: _handle_api_error}
+    )
+    app.state.generation_slots = asyncio.Semaphore(max(1, max_concurrent_analyses))
+    app.state.analyses = AnalysisRegistry()
+    # Used only when history is kept per session (HISTORY_BACKEND = "session")
+    app.state.local_history = InMemoryHistoryStore()
+    return app
+
+
+app = create_app()
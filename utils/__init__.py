@@ -1,96 +1,197 @@
 """
 __init__.py for utils package
+
+Submodules are imported on first attribute access, so importing one helper
+does not load Streamlit, the Gemini SDK or Pillow unless it needs them.
 """
 
-from .theme import apply_custom_theme, create_gradient_header, create_glass_card
-from .session_manager import (
-    initialize_session_state,
-    add_to_history,
-    get_history,
-    clear_history,
-    update_token_stats,
-    get_token_stats,
-    add_feedback,
-    get_feedback_stats,
-    reset_session
-)
-from .token_counter import (
-    estimate_tokens,
-    calculate_cost,
-    format_token_count,
-    format_cost,
-    get_token_stats_display
-)
-from .security import (
-    encrypt_api_key,
-    decrypt_api_key,
-    validate_api_key,
-    store_api_key,
-    get_api_key,
-    clear_api_key
-)
-from .model_handler import (
-    initialize_model,
-    generate_response,
-    stream_response,
-    validate_response,
-    get_response_text,
-    prepare_prompt,
-    check_safety_block
-)
-from .export_handler import (
-    format_markdown_export,
-    get_export_filename,
-    create_download_button_config
-)
-from .response_renderer import (
-    render_response_with_syntax,
-    format_medical_response,
-    create_collapsible_section
-)
+import importlib
 
-__all__ = [
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Theme
-    'apply_custom_theme',
-    'create_gradient_header',
-    'create_glass_card',
+    'apply_custom_theme': 'theme',
+    'create_gradient_header': 'theme',
+    'create_glass_card': 'theme',
     # Session Management
-    'initialize_session_state',
-    'add_to_history',
-    'get_history',
-    'clear_history',
-    'update_token_stats',
-    'get_token_stats',
-    'add_feedback',
-    'get_feedback_stats',
-    'reset_session',
+    'initialize_session_state': 'session_manager',
+    'add_to_history': 'session_manager',
+    'get_history': 'session_manager',
+    'get_history_item': 'session_manager',
+    'count_history': 'session_manager',
+    'get_history_stats': 'session_manager',
+    'clear_history': 'session_manager',
+    'set_history_owner': 'session_manager',
+    'get_history_owner': 'session_manager',
+    'update_token_stats': 'session_manager',
+    'get_token_stats': 'session_manager',
+    'record_regeneration_savings': 'session_manager',
+    'get_regeneration_savings': 'session_manager',
+    'add_feedback': 'session_manager',
+    'get_feedback_stats': 'session_manager',
+    'reset_session': 'session_manager',
+    'get_session_value': 'session_manager',
+    'set_session_value': 'session_manager',
+    'account_session_memory': 'session_manager',
+    # Session Memory
+    'SessionHeap': 'session_memory',
+    'SessionMemoryLedger': 'session_memory',
+    'get_session_ledger': 'session_memory',
+    'estimate_size': 'session_memory',
     # Token Counter
-    'estimate_tokens',
-    'calculate_cost',
-    'format_token_count',
-    'format_cost',
-    'get_token_stats_display',
+    'estimate_tokens': 'token_counter',
+    'estimate_image_tokens': 'token_counter',
+    'estimate_prompt_tokens': 'token_counter',
+    'OutputTokenCounter': 'token_counter',
+    'TokenUsage': 'token_counter',
+    'get_reported_usage': 'token_counter',
+    'resolve_token_usage': 'token_counter',
+    'calculate_cost': 'token_counter',
+    'format_token_count': 'token_counter',
+    'format_cost': 'token_counter',
+    'get_token_stats_display': 'token_counter',
     # Security
-    'encrypt_api_key',
-    'decrypt_api_key',
-    'validate_api_key',
-    'store_api_key',
-    'get_api_key',
-    'clear_api_key',
+    'encrypt_api_key': 'security',
+    'decrypt_api_key': 'security',
+    'validate_api_key': 'security',
+    'store_api_key': 'security',
+    'get_api_key': 'security',
+    'clear_api_key': 'security',
+    'get_crypto_context': 'security',
+    'SessionCryptoContext': 'security',
     # Model Handler
-    'initialize_model',
-    'generate_response',
-    'stream_response',
-    'validate_response',
-    'get_response_text',
-    'prepare_prompt',
-    'check_safety_block',
+    'initialize_model': 'model_handler',
+    'generate_response': 'model_handler',
+    'stream_response': 'model_handler',
+    'validate_response': 'model_handler',
+    'get_response_text': 'model_handler',
+    'prepare_prompt': 'model_handler',
+    'check_safety_block': 'model_handler',
+    'STREAM_ERROR_PREFIX': 'model_handler',
     # Export
-    'format_markdown_export',
-    'get_export_filename',
-    'create_download_button_config',
+    'format_markdown_export': 'export_handler',
+    'get_export_filename': 'export_handler',
+    'create_download_button_config': 'export_handler',
     # Response Renderer
-    'render_response_with_syntax',
-    'format_medical_response',
-    'create_collapsible_section'
-]
+    'render_response_with_syntax': 'response_renderer',
+    'format_medical_response': 'response_renderer',
+    'IncrementalMedicalFormatter': 'response_renderer',
+    'StreamingMarkdownRenderer': 'response_renderer',
+    'create_collapsible_section': 'response_renderer',
+    # History Store
+    'HistoryStore': 'history_store',
+    'InMemoryHistoryStore': 'history_store',
+    'SQLiteHistoryStore': 'history_store',
+    'get_history_store': 'history_store',
+    'build_history_item': 'history_store',
+    # Chat Titles
+    'generate_chat_title': 'chat_titles',
+    'generate_chat_titles': 'chat_titles',
+    'TermMatcher': 'chat_titles',
+    'get_term_matcher': 'chat_titles',
+    # Client Pool
+    'api_key_fingerprint': 'client_pool',
+    'get_client_pool': 'client_pool',
+    'ModelClientPool': 'client_pool',
+    # Image Processing
+    'detect_image_mime': 'image_processor',
+    'format_byte_size': 'image_processor',
+    'preprocess_image': 'image_processor',
+    'preprocess_image_async': 'image_processor',
+    'ProcessedImage': 'image_processor',
+    # Image Blob Store
+    'ImageBlobStore': 'blob_store',
+    'ImageRef': 'blob_store',
+    'get_image_blob_store': 'blob_store',
+    'compact_prompt_parts': 'blob_store',
+    'expand_prompt_parts': 'blob_store',
+    # Perceptual Hashing
+    'dhash': 'perceptual_hash',
+    'phash': 'perceptual_hash',
+    'image_hash': 'perceptual_hash',
+    'hamming_distance': 'perceptual_hash',
+    'HammingIndex': 'perceptual_hash',
+    'SimilarMatch': 'perceptual_hash',
+    'get_similar_image_index': 'perceptual_hash',
+    # Semantic Cache
+    'SemanticCache': 'semantic_cache',
+    'SemanticMatch': 'semantic_cache',
+    'HashedTfidfVectorizer': 'semantic_cache',
+    'get_semantic_cache': 'semantic_cache',
+    # Async Model Handler
+    'async_initialize_model': 'async_model_handler',
+    'async_generate_response': 'async_model_handler',
+    'async_stream_response': 'async_model_handler',
+    'async_generate_text': 'async_model_handler',
+    # Batch Runner
+    'BatchCase': 'batch_runner',
+    'BatchResult': 'batch_runner',
+    'analyze_case': 'batch_runner',
+    'analyze_case_async': 'batch_runner',
+    'run_batch': 'batch_runner',
+    'run_batch_async': 'batch_runner',
+    'open_result_writer': 'batch_runner',
+    'load_cases_from_csv': 'batch_runner',
+    'load_cases_from_directory': 'batch_runner',
+    'load_cases_from_manifest': 'batch_runner',
+    'DirectoryResultWriter': 'batch_runner',
+    'completed_case_ids': 'batch_runner',
+    'check_unique_case_ids': 'batch_runner',
+    # Rate Limiter
+    'RateLimiter': 'rate_limiter',
+    'RateLimitExceeded': 'rate_limiter',
+    'Reservation': 'rate_limiter',
+    'get_rate_limiter': 'rate_limiter',
+    'is_rate_limit_error': 'rate_limiter',
+    # Response Cache
+    'build_cache_key': 'response_cache',
+    'get_response_cache': 'response_cache',
+    'replay_response': 'response_cache',
+    'ResponseCache': 'response_cache',
+    # Resilience
+    'call_with_retry': 'resilience',
+    'generate_with_fallback': 'resilience',
+    'get_fallback_chain': 'resilience',
+    'is_transient_error': 'resilience',
+    'ResilientStream': 'resilience',
+    # Language Fan-out
+    'choose_pivot_language': 'language_fanout',
+    'fan_out_languages': 'language_fanout',
+    'FanoutEvent': 'language_fanout',
+    'TranslationSegmenter': 'language_fanout',
+    # Regeneration
+    'build_followup_contents': 'regeneration',
+    'estimate_request_bytes': 'regeneration',
+    'get_upload_cache': 'regeneration',
+    'RegenerationSavings': 'regeneration',
+    'UploadCache': 'regeneration',
+    'UploadHandle': 'regeneration',
+    # Metrics
+    'span': 'metrics',
+    'timed': 'metrics',
+    'traced_iter': 'metrics',
+    'observe': 'metrics',
+    'register_gauge': 'metrics',
+    'request_trace': 'metrics',
+    'RequestTrace': 'metrics',
+    'is_metrics_enabled': 'metrics',
+    'set_metrics_enabled': 'metrics',
+    'get_metrics_registry': 'metrics',
+    'render_prometheus': 'metrics',
+    'dump_metrics': 'metrics'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
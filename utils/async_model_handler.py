@@ -0,0 +1,98 @@
+"""
+Asyncio counterparts of the model handler for batch jobs and headless use
+
+Unlike the Streamlit-facing functions in model_handler, these raise on
+failure instead of calling st.error. Cancelling the awaiting task cancels
+the in-flight request.
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+from config.settings import (
+    AVAILABLE_MODELS,
+    GENERATION_CONFIG,
+    SAFETY_SETTINGS,
+    ASYNC_REQUEST_TIMEOUT_SECONDS,
+    ASYNC_CHUNK_TIMEOUT_SECONDS
+)
+from .client_pool import get_client_pool
+
+
+async def async_initialize_model(api_key: str, model_name: str):
+    """Get a pooled model bound to an async client for the running loop"""
+    model_config = AVAILABLE_MODELS.get(model_name)
+    if not model_config:
+        raise ValueError(f"Model {model_name} not found")
+
+    return get_client_pool().get_async_model(
+        api_key=api_key,
+        model_id=model_config["name"],
+        generation_config=GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS
+    )
+
+
+async def async_generate_response(
+    model,
+    prompt_parts: list,
+    stream: bool = True,
+    timeout: Optional[float] = ASYNC_REQUEST_TIMEOUT_SECONDS
+):
+    """
+    Start generation. For streams this returns once the first chunk has
+    arrived, so the timeout bounds time-to-first-token.
+    """
+    return await asyncio.wait_for(
+        model.generate_content_async(prompt_parts, stream=stream),
+        timeout=timeout
+    )
+
+
+def _chunk_texts(chunk):
+    """Text pieces of a streamed chunk, mirroring stream_response"""
+    if hasattr(chunk, 'parts') and chunk.parts:
+        for part in chunk.parts:
+            if hasattr(part, 'text') and part.text:
+                yield part.text
+    elif hasattr(chunk, 'text') and chunk.text:
+        yield chunk.text
+
+
+async def async_stream_response(
+    response,
+    chunk_timeout: Optional[float] = ASYNC_CHUNK_TIMEOUT_SECONDS,
+    deadline: Optional[float] = None
+) -> AsyncIterator[str]:
+    """
+    Stream response text.
+
+    chunk_timeout bounds the gap between chunks; deadline (a time.monotonic()
+    value) bounds the whole stream. Both raise asyncio.TimeoutError.
+    """
+    iterator = response.__aiter__()
+    while True:
+        wait = chunk_timeout
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError("Response stream exceeded its deadline")
+            wait = remaining if wait is None else min(wait, remaining)
+
+        try:
+            chunk = await asyncio.wait_for(iterator.__anext__(), timeout=wait)
+        except StopAsyncIteration:
+            return
+
+        for text in _chunk_texts(chunk):
+            yield text
+
+
+async def async_generate_text(
+    model,
+    prompt_parts: list,
+    timeout: Optional[float] = ASYNC_REQUEST_TIMEOUT_SECONDS
+) -> str:
+    """Generate a complete (non-streamed) response text"""
+    response = await async_generate_response(model, prompt_parts, stream=False, timeout=timeout)
+    return response.text
@@ -0,0 +1,554 @@
+"""
+Batch analysis of many images or symptom texts with bounded concurrency
+"""
+
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Iterator, List, Optional, Set
+from config.settings import BATCH_DEFAULT_CONCURRENCY, ASYNC_REQUEST_TIMEOUT_SECONDS, SUPPORTED_IMAGE_FORMATS
+from config.prompts import get_system_prompt
+from .model_handler import generate_response, prepare_prompt
+from .async_model_handler import async_generate_response
+from .image_processor import preprocess_image, get_max_image_pixels
+from .token_counter import OutputTokenCounter, estimate_prompt_tokens, resolve_token_usage
+from .rate_limiter import get_rate_limiter
+from .resilience import call_with_retry
+from .response_cache import build_cache_key, get_response_cache, replay_response
+from .export_handler import format_markdown_export
+
+SUMMARY_FILENAME = "summary.jsonl"
+
+
+@dataclass
+class BatchCase:
+    """
+    One unit of work: text, an image, or both. An image is given either as
+    bytes or as a path read only when the case runs.
+    """
+    case_id: str
+    user_text: str = ""
+    image_data: Optional[bytes] = None
+    image_name: Optional[str] = None
+    image_path: Optional[str] = None
+
+    @property
+    def has_image(self) -> bool:
+        return bool(self.image_data or self.image_path)
+
+    @property
+    def input_mode(self) -> str:
+        if self.has_image and self.user_text:
+            return "Text + Image"
+        return "Image Only" if self.has_image else "Text Only"
+
+    def read_image(self) -> Optional[bytes]:
+        if self.image_data is None and self.image_path:
+            with open(self.image_path, "rb") as f:
+                return f.read()
+        return self.image_data
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single case; failures carry the error instead of raising"""
+    case_id: str
+    status: str  # "ok" or "error"
+    response: str = ""
+    error: str = ""
+    input_mode: str = ""
+    image_name: Optional[str] = None
+    user_text: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    elapsed_seconds: float = 0.0
+    from_cache: bool = False
+
+    def to_record(self) -> dict:
+        """Flat dict for CSV/JSONL output"""
+        return asdict(self)
+
+
+def _new_result(case: BatchCase) -> BatchResult:
+    return BatchResult(
+        case_id=case.case_id,
+        status="ok",
+        input_mode=case.input_mode,
+        image_name=case.image_name,
+        user_text=case.user_text
+    )
+
+
+def _prepare_case_prompt(case: BatchCase, model_name: str, language: str, prompt_style: str = None) -> list:
+    image_data = None
+    image_mime_type = None
+    if case.has_image:
+        processed = preprocess_image(case.read_image(), get_max_image_pixels(model_name))
+        image_data = processed.data
+        image_mime_type = processed.mime_type
+
+    return prepare_prompt(
+        system_prompt=get_system_prompt(language),
+        user_text=case.user_text,
+        image_data=image_data,
+        prompt_style=prompt_style,
+        image_mime_type=image_mime_type
+    )
+
+
+def _lookup_cached(prompt_parts: list, model_name: str, language: str, prompt_style: str = None):
+    """Return (cache_key, cached replay or None)"""
+    response_cache = get_response_cache()
+    if response_cache is None:
+        return None, None
+    cache_key = build_cache_key(model_name, prompt_parts, language, prompt_style)
+    cached = response_cache.get(cache_key)
+    return cache_key, replay_response(cached) if cached is not None else None
+
+
+def _complete_result(result: BatchResult, response, prompt_parts: list, cache_key: str = None):
+    """Fill text and token usage from a finished response"""
+    result.response = response.text
+    result.from_cache = getattr(response, "from_cache", False)
+    if cache_key and not result.from_cache:
+        get_response_cache().set(cache_key, result.response)
+
+    output_counter = OutputTokenCounter()
+    output_counter.add(result.response)
+    usage = resolve_token_usage(response, prompt_parts, output_counter)
+    result.input_tokens = usage.input_tokens
+    result.output_tokens = usage.output_tokens
+
+
+def _reserve_slot(api_key: str, model_name: str, prompt_parts: list):
+    """Reserve a rate-limit slot; batch workers queue however long it takes"""
+    rate_limiter = get_rate_limiter()
+    if not api_key or rate_limiter is None:
+        return None
+    return rate_limiter.reserve(
+        api_key,
+        model_name,
+        estimate_prompt_tokens(prompt_parts),
+        max_wait_seconds=float("inf")
+    )
+
+
+def _settle_slot(reservation, used_tokens: int):
+    if reservation is not None:
+        get_rate_limiter().settle(reservation, used_tokens)
+
+
+def analyze_case(
+    model,
+    case: BatchCase,
+    model_name: str,
+    language: str,
+    prompt_style: str = None,
+    api_key: str = None
+) -> BatchResult:
+    """Run a single case; never raises. With api_key, waits for rate-limit slots."""
+    start = time.perf_counter()
+    result = _new_result(case)
+    reservation = None
+
+    try:
+        prompt_parts = _prepare_case_prompt(case, model_name, language, prompt_style)
+        cache_key, response = _lookup_cached(prompt_parts, model_name, language, prompt_style)
+        if response is None:
+            reservation = _reserve_slot(api_key, model_name, prompt_parts)
+            if reservation:
+                get_rate_limiter().wait(reservation)
+            response = call_with_retry(
+                lambda: generate_response(model, prompt_parts, stream=False, raise_errors=True)
+            )
+        _complete_result(result, response, prompt_parts, cache_key)
+        if not result.from_cache:
+            _settle_slot(reservation, result.input_tokens + result.output_tokens)
+            reservation = None
+    except Exception as e:
+        result.status = "error"
+        result.error = f"{type(e).__name__}: {e}"
+        # A failed case used no tokens; refund its reservation
+        _settle_slot(reservation, 0)
+
+    result.elapsed_seconds = round(time.perf_counter() - start, 3)
+    return result
+
+
+async def analyze_case_async(
+    model,
+    case: BatchCase,
+    model_name: str,
+    language: str,
+    prompt_style: str = None,
+    timeout: float = ASYNC_REQUEST_TIMEOUT_SECONDS,
+    api_key: str = None
+) -> BatchResult:
+    """Async variant of analyze_case; model must come from async_initialize_model"""
+    start = time.perf_counter()
+    result = _new_result(case)
+    reservation = None
+
+    try:
+        # Image decoding is CPU-bound; keep it off the event loop
+        prompt_parts = await asyncio.to_thread(_prepare_case_prompt, case, model_name, language, prompt_style)
+        # So do cache lookups and quota reservations, which hit SQLite
+        cache_key, response = await asyncio.to_thread(_lookup_cached, prompt_parts, model_name, language, prompt_style)
+        if response is None:
+            reservation = await asyncio.to_thread(_reserve_slot, api_key, model_name, prompt_parts)
+            if reservation:
+                await asyncio.sleep(reservation.remaining())
+            response = await async_generate_response(model, prompt_parts, stream=False, timeout=timeout)
+        await asyncio.to_thread(_complete_result, result, response, prompt_parts, cache_key)
+        if not result.from_cache:
+            await asyncio.to_thread(_settle_slot, reservation, result.input_tokens + result.output_tokens)
+            reservation = None
+    except asyncio.TimeoutError:
+        result.status = "error"
+        result.error = f"TimeoutError: no response within {timeout}s"
+    except Exception as e:
+        result.status = "error"
+        result.error = f"{type(e).__name__}: {e}"
+    if result.status == "error":
+        # A failed case used no tokens; refund its reservation
+        await asyncio.to_thread(_settle_slot, reservation, 0)
+
+    result.elapsed_seconds = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run_batch(
+    cases: List[BatchCase],
+    model,
+    model_name: str,
+    language: str,
+    prompt_style: str = None,
+    max_concurrency: int = BATCH_DEFAULT_CONCURRENCY,
+    api_key: str = None
+) -> Iterator[BatchResult]:
+    """
+    Analyze cases on a pool of at most max_concurrency workers.
+
+    Results are yielded in completion order as soon as each finishes, so the
+    caller can update progress and write output incrementally. A failing case
+    produces an "error" result and does not stop the batch.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="batch") as executor:
+        futures = [
+            executor.submit(analyze_case, model, case, model_name, language, prompt_style, api_key)
+            for case in cases
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Stop queued cases if the consumer goes away (e.g. a rerun)
+            for future in futures:
+                future.cancel()
+
+
+async def run_batch_async(
+    cases: List[BatchCase],
+    model,
+    model_name: str,
+    language: str,
+    prompt_style: str = None,
+    max_concurrency: int = BATCH_DEFAULT_CONCURRENCY,
+    timeout: float = ASYNC_REQUEST_TIMEOUT_SECONDS,
+    api_key: str = None
+) -> AsyncIterator[BatchResult]:
+    """Asyncio variant of run_batch bounded by a semaphore"""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _bounded(case: BatchCase) -> BatchResult:
+        async with semaphore:
+            return await analyze_case_async(model, case, model_name, language, prompt_style, timeout, api_key)
+
+    tasks = [asyncio.create_task(_bounded(case)) for case in cases]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class BatchResultWriter(ABC):
+    """Incremental result sink; each result is persisted as it arrives"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.written = 0
+
+    @abstractmethod
+    def write(self, result: BatchResult):
+        ...
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JSONLResultWriter(BatchResultWriter):
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, result: BatchResult):
+        self._file.write(json.dumps(result.to_record(), ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class CSVResultWriter(BatchResultWriter):
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        fields = list(BatchResult.__dataclass_fields__)
+        self._writer = csv.DictWriter(self._file, fieldnames=fields)
+        self._writer.writeheader()
+
+    def write(self, result: BatchResult):
+        self._writer.writerow(result.to_record())
+        self._file.flush()
+        self.written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class ZipResultWriter(BatchResultWriter):
+    """One markdown report per case plus a summary.jsonl"""
+
+    def __init__(self, path: str, model_name: str = "", language: str = ""):
+        super().__init__(path)
+        self.model_name = model_name
+        self.language = language
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._summary = io.StringIO()
+        self._members = set()
+
+    def write(self, result: BatchResult):
+        if result.status == "ok":
+            member = f"reports/{safe_case_filename(result.case_id)}.md"
+            if member in self._members:
+                raise ValueError(f"Case id {result.case_id!r} was already written to this archive")
+            self._members.add(member)
+            report = format_markdown_export(
+                query=result.user_text or "Image Analysis",
+                response=result.response,
+                input_mode=result.input_mode,
+                language=self.language,
+                model=self.model_name
+            )
+            self._zip.writestr(member, report)
+        record = result.to_record()
+        record.pop("response")
+        self._summary.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.written += 1
+
+    def close(self):
+        self._zip.writestr(SUMMARY_FILENAME, self._summary.getvalue())
+        self._zip.close()
+
+
+class DirectoryResultWriter(BatchResultWriter):
+    """
+    reports/<case>.md per successful case plus an appended summary.jsonl,
+    written so an interrupted run can be resumed (see completed_case_ids)
+    """
+
+    def __init__(self, path: str, model_name: str = "", language: str = ""):
+        super().__init__(path)
+        self.model_name = model_name
+        self.language = language
+        self.reports_dir = os.path.join(path, "reports")
+        os.makedirs(self.reports_dir, exist_ok=True)
+        self._summary = open(os.path.join(path, SUMMARY_FILENAME), "a", encoding="utf-8")
+
+    def write(self, result: BatchResult):
+        if result.status == "ok":
+            report = format_markdown_export(
+                query=result.user_text or "Image Analysis",
+                response=result.response,
+                input_mode=result.input_mode,
+                language=self.language,
+                model=self.model_name
+            )
+            report_path = os.path.join(self.reports_dir, f"{safe_case_filename(result.case_id)}.md")
+            # Write then rename so a crash never leaves a truncated report
+            with open(report_path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(report)
+            os.replace(report_path + ".tmp", report_path)
+
+        record = result.to_record()
+        record.pop("response")
+        self._summary.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._summary.flush()
+        self.written += 1
+
+    def close(self):
+        self._summary.close()
+
+
+def completed_case_ids(output_dir: str) -> Set[str]:
+    """Case ids whose latest summary record in output_dir succeeded"""
+    summary_path = os.path.join(output_dir, SUMMARY_FILENAME)
+    if not os.path.exists(summary_path):
+        return set()
+
+    latest = {}
+    with open(summary_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # A line cut short by an interrupted run
+            latest[record["case_id"]] = record["status"]
+    return {case_id for case_id, status in latest.items() if status == "ok"}
+
+
+def safe_case_filename(case_id: str) -> str:
+    """
+    Case id reduced to characters safe in file and archive names. Ids that
+    had to change get a short hash of the original, so "a/b" and "a_b" do
+    not share a report.
+    """
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", case_id).strip("._") or "case"
+    if safe != case_id:
+        safe += "-" + hashlib.sha256(case_id.encode("utf-8")).hexdigest()[:8]
+    return safe
+
+
+def check_unique_case_ids(cases: List[BatchCase]) -> List[BatchCase]:
+    """Return cases, or raise ValueError if ids repeat (reports and resume state are keyed by id)"""
+    seen = set()
+    repeated = []
+    for case in cases:
+        if case.case_id in seen and case.case_id not in repeated:
+            repeated.append(case.case_id)
+        seen.add(case.case_id)
+    if repeated:
+        more = f" and {len(repeated) - 5} more" if len(repeated) > 5 else ""
+        raise ValueError(f"Duplicate case ids: {', '.join(repeated[:5])}{more}")
+    return cases
+
+
+def open_result_writer(path: str, output_format: str, model_name: str = "", language: str = "") -> BatchResultWriter:
+    """Create a writer for "JSONL", "CSV" or "ZIP" output"""
+    output_format = output_format.upper()
+    if output_format == "JSONL":
+        return JSONLResultWriter(path)
+    if output_format == "CSV":
+        return CSVResultWriter(path)
+    if output_format == "ZIP":
+        return ZipResultWriter(path, model_name=model_name, language=language)
+    raise ValueError(f"Unsupported batch output format: {output_format}")
+
+
+def load_cases_from_directory(directory: str) -> List[BatchCase]:
+    """
+    One case per image or .txt file under directory, identified by its
+    relative path, extension included. A .txt with the same relative name
+    as an image is that image's text, forming a single Text + Image case;
+    it is an error for it to match several images (scan.png and scan.jpg).
+    """
+    image_extensions = {f".{ext}" for ext in SUPPORTED_IMAGE_FORMATS}
+    images = {}  # relative path without extension -> [(relative path, path, filename)]
+    texts = {}  # relative path without extension -> (relative path, path)
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            stem, extension = os.path.splitext(filename)
+            extension = extension.lower()
+            if extension not in image_extensions and extension != ".txt":
+                continue
+            path = os.path.join(root, filename)
+            relative = os.path.relpath(path, directory).replace(os.sep, "/")
+            key = os.path.relpath(os.path.join(root, stem), directory).replace(os.sep, "/")
+            if extension == ".txt":
+                texts[key] = (relative, path)
+            else:
+                images.setdefault(key, []).append((relative, path, filename))
+
+    cases = []
+    for key in sorted(set(images) | set(texts)):
+        key_images = images.get(key, [])
+        user_text = ""
+        if key in texts:
+            text_relative, text_path = texts[key]
+            if len(key_images) > 1:
+                names = ", ".join(relative for relative, _, _ in key_images)
+                raise ValueError(f"{text_relative} could belong to any of {names}; rename all but one")
+            with open(text_path, encoding="utf-8") as f:
+                user_text = f.read().strip()
+            if not key_images and user_text:
+                cases.append(BatchCase(case_id=text_relative, user_text=user_text))
+        for relative, path, filename in key_images:
+            cases.append(BatchCase(case_id=relative, user_text=user_text, image_path=path, image_name=filename))
+    return cases
+
+
+def load_cases_from_manifest(
+    manifest_path: str,
+    text_column: str = "text",
+    id_column: str = "case_id",
+    image_column: str = "image"
+) -> List[BatchCase]:
+    """
+    Cases from a CSV or JSONL manifest with text and/or image columns.
+    Image paths are relative to the manifest's directory.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, encoding="utf-8", newline="") as f:
+        if manifest_path.lower().endswith((".jsonl", ".ndjson")):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    cases = []
+    for row_number, row in enumerate(rows, start=1):
+        text = str(row.get(text_column) or "").strip()
+        image = str(row.get(image_column) or "").strip()
+        if not (text or image):
+            continue
+        case_id = str(row.get(id_column) or "").strip() or f"case_{row_number:05d}"
+        case = BatchCase(case_id=case_id, user_text=text)
+        if image:
+            case.image_path = os.path.join(base_dir, image)
+            case.image_name = os.path.basename(image)
+        cases.append(case)
+    return check_unique_case_ids(cases)
+
+
+def load_cases_from_csv(content: str, text_column: str = "text", id_column: str = "case_id") -> List[BatchCase]:
+    """Build text cases from CSV content with a symptom text column"""
+    reader = csv.DictReader(io.StringIO(content))
+    if not reader.fieldnames or text_column not in reader.fieldnames:
+        raise ValueError(f"CSV must have a '{text_column}' column")
+
+    cases = []
+    for row_number, row in enumerate(reader, start=1):
+        text = (row.get(text_column) or "").strip()
+        if not text:
+            continue
+        case_id = (row.get(id_column) or "").strip() or f"case_{row_number:05d}"
+        cases.append(BatchCase(case_id=case_id, user_text=text))
+    return check_unique_case_ids(cases)
@@ -0,0 +1,248 @@
+"""
+Process-wide, content-addressed store for image bytes
+
+Sessions keep an ImageRef (a SHA-256 digest) instead of the uploaded file or
+its bytes, so an image uploaded by many sessions is held once. Blobs are
+reference counted: each ImageRef holds one reference, released when the ref
+is garbage collected (for instance with its session). Under the memory
+budget, unreferenced blobs are dropped least recently used first, then
+referenced blobs are spilled to disk.
+"""
+
+import atexit
+import hashlib
+import os
+import shutil
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import Dict, Optional
+from config.settings import (
+    IMAGE_BLOB_MEMORY_BYTES,
+    IMAGE_BLOB_SPILL_DIR,
+    IMAGE_BLOB_DISK_MAX_BYTES
+)
+from .metrics import register_gauge
+
+
+class ImageRef:
+    """A counted reference to a stored image; keep this, not the bytes"""
+    __slots__ = ("digest", "size", "mime_type", "__weakref__")
+
+    def __init__(self, digest: str, size: int, mime_type: str = None):
+        self.digest = digest
+        self.size = size
+        self.mime_type = mime_type
+
+    def __repr__(self):
+        return f"ImageRef({self.digest[:12]}, {self.size} bytes)"
+
+
+class _Blob:
+    __slots__ = ("data", "size", "refs", "on_disk")
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.size = len(data)
+        self.refs = 0
+        self.on_disk = False
+
+
+class ImageBlobStore:
+    """
+    Deduplicated image bytes with reference counting and LRU eviction
+    under a byte budget, spilling to a per-process subdirectory of
+    spill_dir when memory is full.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = IMAGE_BLOB_MEMORY_BYTES,
+        spill_dir: Optional[str] = IMAGE_BLOB_SPILL_DIR,
+        max_disk_bytes: int = IMAGE_BLOB_DISK_MAX_BYTES
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._blobs: "OrderedDict[str, _Blob]" = OrderedDict()  # least recently used first
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        # Finalizers can run mid-operation on any thread; releases are applied under the lock later
+        self._pending_releases = deque()
+        self.hits = 0
+        self.deduplicated = 0
+
+        if spill_dir:
+            # Worker processes share spill_dir, so each one only touches its own subdirectory
+            self.spill_dir = os.path.join(spill_dir, str(os.getpid()))
+            os.makedirs(self.spill_dir, exist_ok=True)
+            # Left by an earlier process with the same pid; nothing references those blobs
+            for name in os.listdir(self.spill_dir):
+                os.remove(os.path.join(self.spill_dir, name))
+            atexit.register(shutil.rmtree, self.spill_dir, True)
+
+    def put(self, data: bytes, mime_type: str = None) -> ImageRef:
+        """Store data (or find the identical stored copy) and return a new reference to it"""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._apply_releases()
+            blob = self._blobs.get(digest)
+            if blob is None:
+                blob = _Blob(data)
+                self._blobs[digest] = blob
+                self._memory_bytes += blob.size
+            else:
+                self.deduplicated += 1
+                self._blobs.move_to_end(digest)
+            blob.refs += 1
+            self._enforce_budget(keep=digest)
+
+        ref = ImageRef(digest, blob.size, mime_type)
+        weakref.finalize(ref, self._pending_releases.append, digest)
+        return ref
+
+    def get(self, ref) -> Optional[bytes]:
+        """Bytes for an ImageRef or digest; None if the blob is gone"""
+        digest = ref.digest if isinstance(ref, ImageRef) else ref
+        with self._lock:
+            self._apply_releases()
+            blob = self._blobs.get(digest)
+            if blob is None:
+                return None
+            self._blobs.move_to_end(digest)
+            self.hits += 1
+            if blob.data is not None:
+                return blob.data
+
+            with open(self._path(digest), "rb") as f:
+                data = f.read()
+            # Promote back to memory; something colder may spill instead
+            blob.data = data
+            self._memory_bytes += blob.size
+            self._enforce_budget(keep=digest)
+            return data
+
+    def spill(self, ref) -> bool:
+        """Move a blob's bytes to disk now (e.g. its session went cold); False if it stays in memory"""
+        digest = ref.digest if isinstance(ref, ImageRef) else ref
+        with self._lock:
+            self._apply_releases()
+            blob = self._blobs.get(digest)
+            if blob is None or blob.data is None or not self.spill_dir:
+                return False
+            if not blob.on_disk and self._disk_bytes + blob.size > self.max_disk_bytes:
+                return False
+            self._spill(digest, blob)
+            return True
+
+    def _apply_releases(self):
+        released = False
+        while self._pending_releases:
+            blob = self._blobs.get(self._pending_releases.popleft())
+            if blob is not None:
+                blob.refs -= 1
+                released = True
+        if released:
+            self._enforce_budget()
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.spill_dir, digest)
+
+    def _enforce_budget(self, keep: str = None):
+        if self._memory_bytes > self.max_memory_bytes:
+            # Unreferenced blobs are only a dedup cache: drop those first
+            for digest, blob in list(self._blobs.items()):
+                if self._memory_bytes <= self.max_memory_bytes:
+                    break
+                if blob.refs <= 0 and blob.data is not None and digest != keep:
+                    self._drop(digest)
+
+            # Then spill referenced blobs; with the disk full they stay in memory
+            for digest, blob in list(self._blobs.items()):
+                if self._memory_bytes <= self.max_memory_bytes or not self.spill_dir:
+                    break
+                if blob.data is not None and digest != keep and self._disk_bytes + blob.size <= self.max_disk_bytes:
+                    self._spill(digest, blob)
+
+        # Spilled blobs nobody refers to are never read again
+        for digest, blob in list(self._blobs.items()):
+            if blob.refs <= 0 and blob.data is None:
+                self._drop(digest)
+
+    def _spill(self, digest: str, blob: _Blob):
+        if not blob.on_disk:
+            temp_path = f"{self._path(digest)}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(blob.data)
+            os.replace(temp_path, self._path(digest))
+            blob.on_disk = True
+            self._disk_bytes += blob.size
+        blob.data = None
+        self._memory_bytes -= blob.size
+
+    def _drop(self, digest: str):
+        blob = self._blobs.pop(digest)
+        if blob.data is not None:
+            self._memory_bytes -= blob.size
+        if blob.on_disk:
+            try:
+                os.remove(self._path(digest))
+            except OSError:
+                pass
+            self._disk_bytes -= blob.size
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._apply_releases()
+            return {
+                "blobs": len(self._blobs),
+                "referenced": sum(1 for blob in self._blobs.values() if blob.refs > 0),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "hits": self.hits,
+                "deduplicated": self.deduplicated
+            }
+
+
+def compact_prompt_parts(prompt_parts: list, store: "ImageBlobStore" = None) -> list:
+    """Prompt parts with inline image bytes replaced by blob references, for keeping across reruns"""
+    store = store or get_image_blob_store()
+    return [
+        {"mime_type": part["mime_type"], "blob": store.put(part["data"], part["mime_type"])}
+        if isinstance(part, dict) and "data" in part else part
+        for part in prompt_parts
+    ]
+
+
+def expand_prompt_parts(prompt_parts: list, store: "ImageBlobStore" = None) -> list:
+    """Inverse of compact_prompt_parts; images that are no longer stored are left out"""
+    store = store or get_image_blob_store()
+    expanded = []
+    for part in prompt_parts:
+        if isinstance(part, dict) and "blob" in part:
+            data = store.get(part["blob"])
+            if data is None:
+                continue
+            part = {"mime_type": part["mime_type"], "data": data}
+        expanded.append(part)
+    return expanded
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_image_blob_store() -> ImageBlobStore:
+    """Get the process-wide image blob store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = ImageBlobStore()
+                register_gauge("image_blob_memory_bytes", "Image bytes held in memory by the blob store",
+                               lambda: store.stats()["memory_bytes"])
+                register_gauge("image_blob_disk_bytes", "Image bytes spilled to disk by the blob store",
+                               lambda: store.stats()["disk_bytes"])
+                _store = store
+    return _store
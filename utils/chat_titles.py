@@ -0,0 +1,202 @@
+"""
+Chat title generation for history entries
+
+Medical terms are found with an Aho-Corasick automaton compiled once from
+config/medical_terms.py (plus CHAT_TITLE_LEXICON_PATH), so a query is
+scanned in a single pass however large the lexicon is. Matches must sit on
+word boundaries, and the longest term wins where terms overlap ("lower back
+pain" over "back" and "pain").
+"""
+
+import threading
+import unicodedata
+from collections import deque
+from typing import Any, Dict, Iterable, List, Tuple
+from config.settings import CHAT_TITLE_LEXICON_PATH, CHAT_TITLE_MAX_TERMS
+
+_PLURAL_SUFFIXES = ("s", "es")
+
+
+def _is_word_char(char: str) -> bool:
+    return char == "_" or unicodedata.category(char)[0] in "LMN"
+
+
+def _is_unspaced(char: str) -> bool:
+    """Kana and CJK ideographs: words are not separated by spaces"""
+    return "\u3040" <= char <= "\u30ff" or "\u3400" <= char <= "\u9fff" or "\uf900" <= char <= "\ufaff"
+
+
+def _is_hangul(char: str) -> bool:
+    return "\uac00" <= char <= "\ud7af" or "\u1100" <= char <= "\u11ff" or "\u3130" <= char <= "\u318f"
+
+
+def load_lexicon(path: str) -> List[str]:
+    """Terms from a UTF-8 file with one term per line; blank lines and # comments are skipped"""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+class TermMatcher:
+    """Aho-Corasick automaton reporting leftmost-longest, whole-word term matches"""
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = []  # As written, for display
+        self._lengths: List[int] = []  # Of the lowercased term
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[int, ...]] = [()]  # Term ids ending at each node, via fail links too
+
+        seen = set()
+        for term in terms:
+            term = term.strip()
+            key = term.lower()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            node = 0
+            for char in key:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = self._goto[node][char] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                node = child
+            self._outputs[node] = (len(self.terms),)
+            self.terms.append(term)
+            self._lengths.append(len(key))
+
+        # Breadth first, so a node's failure target is always complete before it
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """(start, end, term) for each match, leftmost first; overlaps resolve to the longest term"""
+        lowered = (text or "").lower()
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        candidates = []
+        node = 0
+        for end, char in enumerate(lowered, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for term_id in outputs[node]:
+                start = end - lengths[term_id]
+                stop = self._word_end(lowered, start, end)
+                if stop:
+                    candidates.append((start, -stop, term_id))
+
+        matches = []
+        position = 0
+        for start, negative_stop, term_id in sorted(candidates):
+            if start >= position:
+                matches.append((start, -negative_stop, self.terms[term_id]))
+                position = -negative_stop
+        return matches
+
+    @staticmethod
+    def _word_end(text: str, start: int, end: int) -> int:
+        """End of the match including a plural suffix, or 0 if it is part of a longer word"""
+        if start > 0 and not _is_unspaced(text[start]):
+            before = text[start - 1]
+            if _is_word_char(before) and not _is_unspaced(before):
+                return 0
+
+        last = text[end - 1]
+        if _is_unspaced(last) or _is_hangul(last):
+            return end  # No boundary to find; Korean particles attach to the end of a word
+        for suffix in ("",) + _PLURAL_SUFFIXES:
+            stop = end + len(suffix)
+            if suffix and not text.startswith(suffix, end):
+                continue
+            if stop == len(text):
+                return stop
+            after = text[stop]
+            if not _is_word_char(after) or _is_unspaced(after) or _is_hangul(after):
+                return stop
+        return 0
+
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def get_term_matcher() -> TermMatcher:
+    """Get the process-wide matcher over the medical lexicon, compiled on first use"""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                from config.medical_terms import MEDICAL_TERMS
+
+                terms = [term for language_terms in MEDICAL_TERMS.values() for term in language_terms]
+                if CHAT_TITLE_LEXICON_PATH:
+                    terms.extend(load_lexicon(CHAT_TITLE_LEXICON_PATH))
+                _matcher = TermMatcher(terms)
+    return _matcher
+
+
+def _display(term: str) -> str:
+    # All-lowercase terms are title-cased; acronyms and other languages keep their spelling
+    return term if any(char.isupper() for char in term) else term.title()
+
+
+def generate_chat_title(query: str, input_mode: str, language: str, max_length: int = 60) -> str:
+    """Generate a richer, user-friendly chat title.
+
+    Logic:
+    - Image only: return 'Image Analysis' with language.
+    - If medical terms found: combine the first two in the query and append 'Assessment'.
+    - Else: Use first 8 words of the query as summary.
+    - Always truncate gracefully and title-case first word.
+    """
+    # Image-only case with no text
+    if (not query or query.strip() == "") and ("Image" in input_mode):
+        return f"Image Analysis ({language[:2].upper()})"
+
+    if not query:
+        return f"Medical Analysis ({language[:2].upper()})"
+
+    found = []
+    for _, _, term in get_term_matcher().find_all(query):
+        display = _display(term)
+        if display not in found:
+            found.append(display)
+            if len(found) == CHAT_TITLE_MAX_TERMS:
+                break
+
+    if found:
+        title = " & ".join(found) + " Assessment"
+    else:
+        words = query.strip().split()
+        snippet = " ".join(words[:8])
+        if len(words) > 8:
+            snippet += "..."
+        title = snippet[:max_length]
+
+    # Append language code for clarity
+    return f"{title} ({language[:2].upper()})"
+
+
+def generate_chat_titles(items: Iterable[Dict[str, Any]], max_length: int = 60) -> List[str]:
+    """Titles for many history items at once (e.g. re-titling imported history); repeats are titled once"""
+    titles = {}
+    result = []
+    for item in items:
+        key = (item.get("query") or "", item.get("input_mode") or "", item.get("language") or "English")
+        title = titles.get(key)
+        if title is None:
+            title = titles[key] = generate_chat_title(key[0], key[1], key[2], max_length)
+        result.append(title)
+    return result
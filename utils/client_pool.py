@@ -0,0 +1,214 @@
+"""
+Pooled Gemini model clients shared across reruns and sessions
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any
+from config.settings import CLIENT_POOL_MAX_MODELS, CLIENT_POOL_IDLE_TTL_SECONDS
+
+if TYPE_CHECKING:
+    from google.generativeai.client import FileServiceClient
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible identifier for an API key"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _config_fingerprint(*configs) -> str:
+    """Hashable digest of generation/safety configuration"""
+    payload = json.dumps(configs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class ModelClientPool:
+    """
+    Reuse GenerativeModel instances and their transports.
+
+    genai.configure() replaces the SDK's process-wide default client, so two
+    sessions with different API keys racing through it can send requests with
+    each other's key, and every call drops the cached gRPC channel. The pool
+    instead binds each model to a service client created for its own key:
+    one client (and connection) per key fingerprint, one model per
+    (key fingerprint, model id, generation config).
+    """
+
+    def __init__(self, max_models: int = CLIENT_POOL_MAX_MODELS, idle_ttl_seconds: float = CLIENT_POOL_IDLE_TTL_SECONDS):
+        self.max_models = max_models
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clients = {}  # key fingerprint -> service client
+        self._file_clients = {}  # key fingerprint -> File API client
+        self._models = OrderedDict()  # (key fp, model id, config fp) -> [model, last_used]
+        # grpc.aio channels belong to the event loop that created them and
+        # reference it back, so entries are dropped once their loop closes
+        self._async_models = {}  # loop -> OrderedDict(pool key -> model)
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get_model(
+        self,
+        api_key: str,
+        model_id: str,
+        generation_config: Dict[str, Any] = None,
+        safety_settings: list = None
+    ):
+        """Return a pooled model bound to a client for this API key"""
+        # The SDK (with gRPC, protobuf and Pillow) loads on first use, not at app start
+        import google.generativeai as genai
+        from google.ai import generativelanguage as glm
+
+        key_fp = api_key_fingerprint(api_key)
+        pool_key = (key_fp, model_id, _config_fingerprint(generation_config, safety_settings))
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_idle(now)
+
+            entry = self._models.get(pool_key)
+            if entry is not None:
+                entry[1] = now
+                self._models.move_to_end(pool_key)
+                self.reused += 1
+                return entry[0]
+
+            client = self._clients.get(key_fp)
+            if client is None:
+                client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+                self._clients[key_fp] = client
+
+            model = genai.GenerativeModel(
+                model_name=model_id,
+                generation_config=generation_config,
+                safety_settings=safety_settings
+            )
+            # Bind the model to this key's client instead of the SDK global
+            model._client = client
+
+            self._models[pool_key] = [model, now]
+            self.created += 1
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+            self._release_unused_clients()
+            return model
+
+    def get_async_model(
+        self,
+        api_key: str,
+        model_id: str,
+        generation_config: Dict[str, Any] = None,
+        safety_settings: list = None
+    ):
+        """
+        Return a model bound to an async client for this API key, reused
+        within the running event loop. Must be called from a coroutine.
+        """
+        import google.generativeai as genai
+        from google.ai import generativelanguage as glm
+
+        loop = asyncio.get_running_loop()
+        key_fp = api_key_fingerprint(api_key)
+        pool_key = (key_fp, model_id, _config_fingerprint(generation_config, safety_settings))
+
+        with self._lock:
+            self._evict_closed_loops()
+            loop_models = self._async_models.setdefault(loop, OrderedDict())
+            model = loop_models.get(pool_key)
+            if model is not None:
+                loop_models.move_to_end(pool_key)
+                self.reused += 1
+                return model
+
+            async_client = next(
+                (m._async_client for (fp, _, _), m in loop_models.items() if fp == key_fp),
+                None
+            )
+            if async_client is None:
+                async_client = glm.GenerativeServiceAsyncClient(client_options={"api_key": api_key})
+
+            model = genai.GenerativeModel(
+                model_name=model_id,
+                generation_config=generation_config,
+                safety_settings=safety_settings
+            )
+            model._async_client = async_client
+            loop_models[pool_key] = model
+            self.created += 1
+            while len(loop_models) > self.max_models:
+                loop_models.popitem(last=False)
+            return model
+
+    def get_file_client(self, api_key: str) -> "FileServiceClient":
+        """Return a File API client for this API key"""
+        from google.generativeai.client import FileServiceClient
+
+        key_fp = api_key_fingerprint(api_key)
+        with self._lock:
+            client = self._file_clients.get(key_fp)
+            if client is None:
+                client = FileServiceClient(client_options={"api_key": api_key})
+                self._file_clients[key_fp] = client
+            return client
+
+    def evict_idle(self):
+        """Drop models idle for longer than the TTL and release orphaned clients"""
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            self._evict_closed_loops()
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            self._async_models.clear()
+            self._release_unused_clients()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "models": len(self._models),
+                "clients": len(self._clients),
+                "async_loops": len(self._async_models),
+                "created": self.created,
+                "reused": self.reused
+            }
+
+    def _evict_idle(self, now: float):
+        expired = [k for k, (_, last_used) in self._models.items() if now - last_used > self.idle_ttl_seconds]
+        for pool_key in expired:
+            del self._models[pool_key]
+        if expired:
+            self._release_unused_clients()
+
+    def _evict_closed_loops(self):
+        # A closed loop cannot await the channel's close(); dropping the last
+        # references lets the client, channel and loop be collected together
+        for loop in [loop for loop in self._async_models if loop.is_closed()]:
+            del self._async_models[loop]
+
+    def _release_unused_clients(self):
+        # Only drop the reference: a stream still iterating on an evicted
+        # model keeps its client alive, and the channel closes once collected
+        in_use = {pool_key[0] for pool_key in self._models}
+        for key_fp in [fp for fp in self._clients if fp not in in_use]:
+            del self._clients[key_fp]
+        for key_fp in [fp for fp in self._file_clients if fp not in in_use]:
+            del self._file_clients[key_fp]
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ModelClientPool:
+    """Get the process-wide model client pool"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ModelClientPool()
+    return _pool
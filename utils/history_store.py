@@ -0,0 +1,414 @@
+"""
+Pluggable analysis history storage backends
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from config.settings import (
+    HISTORY_BACKEND,
+    HISTORY_DB_PATH,
+    HISTORY_WRITE_BATCH_SIZE,
+    HISTORY_FLUSH_INTERVAL_SECONDS,
+    MAX_HISTORY_ITEMS
+)
+from .chat_titles import generate_chat_title
+from .metrics import timed
+
+HISTORY_FIELDS = [
+    "timestamp",
+    "chat_name",
+    "query",
+    "response",
+    "input_mode",
+    "language",
+    "model",
+    "tokens"
+]
+
+
+def build_history_item(query: str, response: str, input_mode: str, language: str, model: str, tokens: int) -> Dict[str, Any]:
+    """History entry with a generated title and the current timestamp"""
+    return {
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "chat_name": generate_chat_title(query=query, input_mode=input_mode, language=language),
+        "query": query,
+        "response": response,
+        "input_mode": input_mode,
+        "language": language,
+        "model": model,
+        "tokens": tokens
+    }
+
+
+class HistoryStore(ABC):
+    """Interface for history backends; items are dicts with HISTORY_FIELDS"""
+
+    def add(self, owner: str, item: Dict[str, Any]):
+        self.add_many(owner, [item])
+
+    @abstractmethod
+    def add_many(self, owner: str, items: List[Dict[str, Any]]):
+        ...
+
+    @abstractmethod
+    def list(self, owner: str, offset: int = 0, limit: int = None) -> List[Dict[str, Any]]:
+        """Most recent first"""
+
+    @abstractmethod
+    def get(self, owner: str, item_id: int) -> Optional[Dict[str, Any]]:
+        ...
+
+    def count(self, owner: str) -> int:
+        return self.stats(owner)["count"]
+
+    @abstractmethod
+    def stats(self, owner: str) -> Dict[str, Any]:
+        """
+        Aggregate counters maintained on write:
+        {"count", "total_tokens", "languages": {name: n}, "models": {name: n}}
+        """
+
+    @abstractmethod
+    def clear(self, owner: str):
+        ...
+
+    def flush(self):
+        """Persist any buffered writes"""
+
+
+class InMemoryHistoryStore(HistoryStore):
+    """Bounded in-process history, the original per-session behaviour"""
+
+    def __init__(self, max_items: int = MAX_HISTORY_ITEMS):
+        self.max_items = max_items
+        self._items = {}  # owner -> list, most recent first
+        self._stats = {}  # owner -> counters
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Picklable so a cold session's history can be offloaded to disk
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add_many(self, owner: str, items: List[Dict[str, Any]]):
+        with self._lock:
+            owner_items = self._items.setdefault(owner, [])
+            stats = self._stats.setdefault(owner, _empty_stats())
+            for item in items:
+                owner_items.insert(0, dict(item, id=self._next_id))
+                self._next_id += 1
+                _apply_to_stats(stats, item, 1)
+            for dropped in owner_items[self.max_items:]:
+                _apply_to_stats(stats, dropped, -1)
+            del owner_items[self.max_items:]
+
+    def list(self, owner: str, offset: int = 0, limit: int = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            owner_items = self._items.get(owner, [])
+            end = None if limit is None else offset + limit
+            return list(owner_items[offset:end])
+
+    def get(self, owner: str, item_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for item in self._items.get(owner, []):
+                if item["id"] == item_id:
+                    return dict(item)
+            return None
+
+    def stats(self, owner: str) -> Dict[str, Any]:
+        with self._lock:
+            stats = self._stats.get(owner, _empty_stats())
+            return {
+                "count": stats["count"],
+                "total_tokens": stats["total_tokens"],
+                "languages": dict(stats["languages"]),
+                "models": dict(stats["models"])
+            }
+
+    def clear(self, owner: str):
+        with self._lock:
+            self._items.pop(owner, None)
+            self._stats.pop(owner, None)
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {"count": 0, "total_tokens": 0, "languages": {}, "models": {}}
+
+
+def _apply_to_stats(stats: Dict[str, Any], item: Dict[str, Any], sign: int):
+    """Add (sign=1) or remove (sign=-1) one item from aggregate counters"""
+    stats["count"] += sign
+    stats["total_tokens"] += sign * (item.get("tokens") or 0)
+    for facet, field in (("languages", "language"), ("models", "model")):
+        value = item.get(field) or "Unknown"
+        remaining = stats[facet].get(value, 0) + sign
+        if remaining > 0:
+            stats[facet][value] = remaining
+        else:
+            stats[facet].pop(value, None)
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """
+    Durable history in a SQLite database (WAL mode).
+
+    Writes are buffered and inserted in batches, flushed when the batch is
+    full, every HISTORY_FLUSH_INTERVAL_SECONDS by a single long-lived writer
+    thread, before any read and at exit. Reads are paginated so a session
+    never holds more than one page.
+    """
+
+    def __init__(
+        self,
+        db_path: str = HISTORY_DB_PATH,
+        batch_size: int = HISTORY_WRITE_BATCH_SIZE,
+        flush_interval: float = HISTORY_FLUSH_INTERVAL_SECONDS
+    ):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._pending = []  # (owner, item, created_at)
+        self._pending_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._writer = None  # Started with the first buffered write
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS analyses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    owner TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    chat_name TEXT,
+                    query TEXT,
+                    response TEXT,
+                    input_mode TEXT,
+                    language TEXT,
+                    model TEXT,
+                    tokens INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analyses_owner_time ON analyses (owner, created_at DESC, id DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analyses_owner_model ON analyses (owner, model)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analyses_owner_language ON analyses (owner, language)")
+            # Aggregates maintained alongside inserts so stats never scan history
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history_stats (
+                    owner TEXT PRIMARY KEY,
+                    total_count INTEGER NOT NULL DEFAULT 0,
+                    total_tokens INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history_facets (
+                    owner TEXT NOT NULL,
+                    facet TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (owner, facet, value)
+                )
+                """
+            )
+            if conn.execute("SELECT 1 FROM history_stats LIMIT 1").fetchone() is None:
+                self._rebuild_stats(conn)
+
+        atexit.register(self.close)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @timed("history_store.add_many")
+    def add_many(self, owner: str, items: List[Dict[str, Any]]):
+        now = time.time()
+        with self._pending_lock:
+            self._pending.extend((owner, item, now) for item in items)
+            full = len(self._pending) >= self.batch_size
+            if self._writer is None and not self._closed.is_set():
+                self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+                self._writer.start()
+        if full:
+            self.flush()
+
+    def _write_loop(self):
+        # One thread and one connection for the store's lifetime, not one per flush
+        try:
+            while not self._closed.wait(self.flush_interval):
+                try:
+                    self.flush()
+                except sqlite3.Error:
+                    pass  # The batch stays buffered for the next attempt
+        finally:
+            self._close_connection()
+
+    def close(self):
+        """Stop the writer thread and persist any buffered writes"""
+        self._closed.set()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+        self._close_connection()
+
+    def _close_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @timed("history_store.flush")
+    def flush(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        rows = [
+            (owner, created_at) + tuple(item.get(field) for field in HISTORY_FIELDS)
+            for owner, item, created_at in pending
+        ]
+        # Fold the batch into counter deltas before touching the database
+        stats = {}
+        for owner, item, _ in pending:
+            _apply_to_stats(stats.setdefault(owner, _empty_stats()), item, 1)
+
+        try:
+            self._write(rows, stats)
+        except sqlite3.Error:
+            with self._pending_lock:
+                self._pending[:0] = pending
+            raise
+
+    def _write(self, rows: list, stats: Dict[str, Dict[str, Any]]):
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT INTO analyses (owner, created_at, {', '.join(HISTORY_FIELDS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(HISTORY_FIELDS))})",
+                rows
+            )
+            conn.executemany(
+                "INSERT INTO history_stats (owner, total_count, total_tokens) VALUES (?, ?, ?) "
+                "ON CONFLICT(owner) DO UPDATE SET "
+                "total_count = total_count + excluded.total_count, "
+                "total_tokens = total_tokens + excluded.total_tokens",
+                [(owner, delta["count"], delta["total_tokens"]) for owner, delta in stats.items()]
+            )
+            conn.executemany(
+                "INSERT INTO history_facets (owner, facet, value, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(owner, facet, value) DO UPDATE SET count = count + excluded.count",
+                [
+                    (owner, facet, value, count)
+                    for owner, delta in stats.items()
+                    for facet in ("languages", "models")
+                    for value, count in delta[facet].items()
+                ]
+            )
+
+    def _rebuild_stats(self, conn: sqlite3.Connection):
+        """Recompute aggregates from the analyses table (schema upgrades)"""
+        conn.execute("DELETE FROM history_stats")
+        conn.execute("DELETE FROM history_facets")
+        conn.execute(
+            "INSERT INTO history_stats (owner, total_count, total_tokens) "
+            "SELECT owner, COUNT(*), COALESCE(SUM(tokens), 0) FROM analyses GROUP BY owner"
+        )
+        for facet, field in (("languages", "language"), ("models", "model")):
+            conn.execute(
+                f"INSERT INTO history_facets (owner, facet, value, count) "
+                f"SELECT owner, '{facet}', COALESCE({field}, 'Unknown'), COUNT(*) "
+                f"FROM analyses GROUP BY owner, COALESCE({field}, 'Unknown')"
+            )
+
+    @timed("history_store.list")
+    def list(self, owner: str, offset: int = 0, limit: int = None) -> List[Dict[str, Any]]:
+        self.flush()
+        rows = self._connection().execute(
+            f"SELECT id, {', '.join(HISTORY_FIELDS)} FROM analyses WHERE owner = ? "
+            "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+            (owner, -1 if limit is None else limit, offset)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    @timed("history_store.get")
+    def get(self, owner: str, item_id: int) -> Optional[Dict[str, Any]]:
+        self.flush()
+        row = self._connection().execute(
+            f"SELECT id, {', '.join(HISTORY_FIELDS)} FROM analyses WHERE owner = ? AND id = ?",
+            (owner, item_id)
+        ).fetchone()
+        return dict(row) if row else None
+
+    @timed("history_store.stats")
+    def stats(self, owner: str) -> Dict[str, Any]:
+        self.flush()
+        conn = self._connection()
+        stats = _empty_stats()
+        row = conn.execute(
+            "SELECT total_count, total_tokens FROM history_stats WHERE owner = ?", (owner,)
+        ).fetchone()
+        if row:
+            stats["count"], stats["total_tokens"] = row[0], row[1]
+        for facet, value, count in conn.execute(
+            "SELECT facet, value, count FROM history_facets WHERE owner = ? AND count > 0", (owner,)
+        ):
+            stats[facet][value] = count
+        return stats
+
+    @timed("history_store.clear")
+    def clear(self, owner: str):
+        self.flush()
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM analyses WHERE owner = ?", (owner,))
+            conn.execute("DELETE FROM history_stats WHERE owner = ?", (owner,))
+            conn.execute("DELETE FROM history_facets WHERE owner = ?", (owner,))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """
+    Get the process-wide durable history store, or None when history is kept
+    per session (HISTORY_BACKEND = "session")
+    """
+    global _store
+    if HISTORY_BACKEND != "sqlite":
+        return None
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SQLiteHistoryStore()
+    return _store
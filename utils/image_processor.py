@@ -0,0 +1,175 @@
+"""
+Image preprocessing before upload to the model
+"""
+
+import io
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+from PIL import Image, ImageOps
+from config.settings import (
+    AVAILABLE_MODELS,
+    IMAGE_PREPROCESS_ENABLED,
+    IMAGE_DEFAULT_MAX_PIXELS,
+    IMAGE_JPEG_QUALITY,
+    IMAGE_PREPROCESS_WORKERS
+)
+
+# Leading bytes of the formats we may be handed, mapped to MIME types
+_IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+]
+
+_executor = ThreadPoolExecutor(
+    max_workers=IMAGE_PREPROCESS_WORKERS,
+    thread_name_prefix="image-preprocess"
+)
+
+
+def detect_image_mime(data: bytes, default: str = "image/jpeg") -> str:
+    """Detect image MIME type from its magic bytes"""
+    if not data:
+        return default
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    return default
+
+
+def format_byte_size(num_bytes: int) -> str:
+    """Format a byte count with KB/MB suffix"""
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.1f} MB"
+    elif num_bytes >= 1024:
+        return f"{num_bytes / 1024:.0f} KB"
+    else:
+        return f"{num_bytes} B"
+
+
+@dataclass
+class ProcessedImage:
+    """Result of preprocessing a single image"""
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    original_bytes: int
+    elapsed_ms: float
+    resized: bool = False
+    perceptual_hash: Optional[int] = None  # Set when requested and the image could be decoded
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.original_bytes - len(self.data))
+
+    def summary(self) -> str:
+        """One-line report for the UI"""
+        return (
+            f"🖼️ Image optimized: {format_byte_size(self.original_bytes)} → "
+            f"{format_byte_size(len(self.data))} ({format_byte_size(self.bytes_saved)} saved, "
+            f"{self.width}×{self.height}) in {self.elapsed_ms:.0f} ms"
+        )
+
+
+def get_max_image_pixels(model_name: str) -> int:
+    """Pixel budget for images sent to the given model"""
+    model_config = AVAILABLE_MODELS.get(model_name, {})
+    return model_config.get("max_image_pixels", IMAGE_DEFAULT_MAX_PIXELS)
+
+
+def preprocess_image(
+    data: bytes,
+    max_pixels: int = IMAGE_DEFAULT_MAX_PIXELS,
+    quality: int = IMAGE_JPEG_QUALITY,
+    with_hash: bool = False
+) -> ProcessedImage:
+    """
+    Detect the real format, strip EXIF, downsample to the pixel budget and
+    re-encode. PNG and images with transparency stay lossless PNG; everything
+    else becomes JPEG at the configured quality. If the image cannot be
+    decoded, the original bytes are returned with their detected MIME type.
+    With with_hash, the decoded image's perceptual hash is computed as well.
+    """
+    start = time.perf_counter()
+
+    def _elapsed_ms() -> float:
+        return (time.perf_counter() - start) * 1000
+
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            source_format = source.format
+            had_metadata = bool(source.getexif()) or "icc_profile" in source.info
+            # Apply the EXIF orientation before the tag is dropped
+            image = ImageOps.exif_transpose(source)
+
+        width, height = image.size
+        resized = width * height > max_pixels
+        if resized:
+            scale = (max_pixels / (width * height)) ** 0.5
+            width, height = max(1, int(width * scale)), max(1, int(height * scale))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+        perceptual_hash = None
+        if with_hash:
+            from .perceptual_hash import image_hash
+            perceptual_hash = image_hash(image)
+
+        keep_lossless = source_format == "PNG" or image.mode in ("RGBA", "LA", "P")
+        output = io.BytesIO()
+        if keep_lossless:
+            image.save(output, format="PNG", optimize=True)
+            mime_type = "image/png"
+        else:
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            image.save(output, format="JPEG", quality=quality, optimize=True)
+            mime_type = "image/jpeg"
+        encoded = output.getvalue()
+    except Exception:
+        return ProcessedImage(
+            data=data,
+            mime_type=detect_image_mime(data),
+            width=0,
+            height=0,
+            original_bytes=len(data),
+            elapsed_ms=_elapsed_ms()
+        )
+
+    # Re-encoding a small, clean image can grow it; keep the original then
+    if len(encoded) >= len(data) and not resized and not had_metadata:
+        encoded = data
+        mime_type = detect_image_mime(data)
+
+    return ProcessedImage(
+        data=encoded,
+        mime_type=mime_type,
+        width=width,
+        height=height,
+        original_bytes=len(data),
+        elapsed_ms=_elapsed_ms(),
+        resized=resized,
+        perceptual_hash=perceptual_hash
+    )
+
+
+def preprocess_image_async(data: bytes, model_name: str, with_hash: bool = False) -> Future:
+    """Preprocess an image for a model on the shared worker pool"""
+    if not IMAGE_PREPROCESS_ENABLED:
+        future = Future()
+        future.set_result(ProcessedImage(
+            data=data,
+            mime_type=detect_image_mime(data),
+            width=0,
+            height=0,
+            original_bytes=len(data),
+            elapsed_ms=0.0
+        ))
+        return future
+    return _executor.submit(preprocess_image, data, get_max_image_pixels(model_name), with_hash=with_hash)
@@ -0,0 +1,234 @@
+"""
+Concurrent multi-language output for a single analysis
+
+Worker threads never touch Streamlit; they publish FanoutEvents on a queue
+that the script thread drains and renders, one tab per language.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+from config.settings import (
+    MULTI_LANGUAGE_PIVOT,
+    TRANSLATION_MODEL,
+    TRANSLATION_SEGMENT_CHARS
+)
+from config.prompts import get_translation_prompt
+from .model_handler import stream_response, STREAM_ERROR_PREFIX
+from .resilience import generate_with_fallback
+from .rate_limiter import get_rate_limiter
+from .token_counter import OutputTokenCounter, estimate_prompt_tokens, resolve_token_usage
+
+_PIVOT_FAILED = object()  # Sent to translators instead of the end marker when the pivot fails
+
+
+@dataclass
+class FanoutEvent:
+    """A text delta for one language, or that language finishing"""
+    language: str
+    text: str = ""
+    done: bool = False
+    error: Optional[str] = None
+    model_name: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+def choose_pivot_language(languages: List[str]) -> str:
+    """The language analyzed directly; the others are derived from it"""
+    return MULTI_LANGUAGE_PIVOT if MULTI_LANGUAGE_PIVOT in languages else languages[0]
+
+
+class TranslationSegmenter:
+    """
+    Cuts streamed text into translation units at paragraph boundaries
+    outside code fences, so each unit translates on its own.
+    """
+
+    def __init__(self, segment_chars: int = TRANSLATION_SEGMENT_CHARS):
+        self.segment_chars = segment_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        self._buffer += text
+        if len(self._buffer) < self.segment_chars:
+            return []
+        cut = self._last_boundary(self._buffer)
+        if cut <= 0:
+            return []
+        segment, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        return [segment]
+
+    def flush(self) -> List[str]:
+        segment, self._buffer = self._buffer, ""
+        return [segment] if segment.strip() else []
+
+    @staticmethod
+    def _last_boundary(text: str) -> int:
+        position = text.rfind("\n\n")
+        while position > 0:
+            if text.count("```", 0, position) % 2 == 0:
+                return position + 2
+            position = text.rfind("\n\n", 0, position)
+        return -1
+
+
+class _UsageTracker:
+    """Token usage summed over the requests made for one language"""
+
+    def __init__(self):
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.model_name = None
+
+
+def _stream_generation(
+    api_key: str,
+    model_name: str,
+    prompt_parts: list,
+    usage: _UsageTracker
+) -> Iterator[str]:
+    """Stream one generation, queueing for quota and recording token usage"""
+    rate_limiter = get_rate_limiter()
+    reservation = None
+    if rate_limiter is not None:
+        reservation = rate_limiter.acquire(api_key, model_name, estimate_prompt_tokens(prompt_parts))
+
+    try:
+        response = generate_with_fallback(api_key, model_name, prompt_parts)
+        usage.model_name = response.model_name
+        output_counter = OutputTokenCounter()
+        for text in stream_response(response):
+            output_counter.add(text)
+            yield text
+
+        resolved = resolve_token_usage(response, prompt_parts, output_counter)
+        usage.input_tokens += resolved.input_tokens
+        usage.output_tokens += resolved.output_tokens
+    except Exception:
+        # Nothing usable came back; give the reserved quota back
+        if reservation is not None:
+            rate_limiter.settle(reservation, 0)
+        raise
+    if reservation is not None:
+        rate_limiter.settle(reservation, resolved.total_tokens if response.model_name == model_name else 0)
+
+
+def _finish(events: queue.Queue, language: str, usage: _UsageTracker, error: Exception = None):
+    events.put(FanoutEvent(
+        language=language,
+        done=True,
+        error=f"{type(error).__name__}: {error}" if error else None,
+        model_name=usage.model_name,
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens
+    ))
+
+
+def fan_out_languages(
+    api_key: str,
+    model_name: str,
+    languages: List[str],
+    build_prompt: Callable[[str], list],
+    strategy: str = "Translate",
+    translation_model: str = TRANSLATION_MODEL
+) -> Iterator[FanoutEvent]:
+    """
+    Produce an analysis in several languages at once.
+
+    "Parallel" runs one full analysis per language concurrently.
+    "Translate" analyzes once in the pivot language and translates it into
+    every other language on a lite model in a few large blocks as it
+    streams; pivot text that arrives while a block is being translated is
+    sent together in the next request, keeping the request count low under
+    free-tier quotas. If the pivot fails, the translations stop with it.
+
+    build_prompt(language) returns the prompt parts for an analysis in
+    that language. Events arrive in real time; every language ends with
+    exactly one done event.
+    """
+    events = queue.Queue()
+    threads = []
+
+    def _spawn(target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True, name="fanout")
+        thread.start()
+        threads.append(thread)
+
+    def _analyze(language: str, segment_queues: dict):
+        usage = _UsageTracker()
+        segmenter = TranslationSegmenter()
+        end_marker = _PIVOT_FAILED
+        stream_error = None
+        try:
+            for text in _stream_generation(api_key, model_name, build_prompt(language), usage):
+                events.put(FanoutEvent(language=language, text=text))
+                if STREAM_ERROR_PREFIX in text:
+                    stream_error = text.replace(STREAM_ERROR_PREFIX, "").strip()
+                if stream_error is None:
+                    for segment in segmenter.feed(text):
+                        for segments in segment_queues.values():
+                            segments.put(segment)
+            if stream_error is not None:
+                # The stream broke off; the error text is never translated
+                raise RuntimeError(stream_error)
+            for segment in segmenter.flush():
+                for segments in segment_queues.values():
+                    segments.put(segment)
+            end_marker = None
+        except Exception as e:
+            _finish(events, language, usage, e)
+            return
+        finally:
+            for segments in segment_queues.values():
+                segments.put(end_marker)
+        _finish(events, language, usage)
+
+    def _translate(language: str, segments: queue.Queue, pivot: str):
+        usage = _UsageTracker()
+        try:
+            finished = False
+            while not finished:
+                # Everything queued while the previous block was translating goes in one request
+                block = [segments.get()]
+                while block[-1] is not None and block[-1] is not _PIVOT_FAILED and not segments.empty():
+                    block.append(segments.get())
+                if block[-1] is _PIVOT_FAILED:
+                    raise RuntimeError(f"stopped because the {pivot} analysis failed")
+                if block[-1] is None:
+                    finished = True
+                    block.pop()
+                if not block:
+                    continue
+                prompt_parts = [get_translation_prompt(language), "".join(block)]
+                stream_error = None
+                for text in _stream_generation(api_key, translation_model, prompt_parts, usage):
+                    events.put(FanoutEvent(language=language, text=text))
+                    if STREAM_ERROR_PREFIX in text:
+                        stream_error = text.replace(STREAM_ERROR_PREFIX, "").strip()
+                if stream_error is not None:
+                    # The translation broke off; later blocks would leave a gap in it
+                    raise RuntimeError(stream_error)
+                events.put(FanoutEvent(language=language, text="\n\n"))
+        except Exception as e:
+            _finish(events, language, usage, e)
+            return
+        _finish(events, language, usage)
+
+    if strategy == "Parallel":
+        for language in languages:
+            _spawn(_analyze, language, {})
+    else:
+        pivot = choose_pivot_language(languages)
+        segment_queues = {language: queue.Queue() for language in languages if language != pivot}
+        for language, segments in segment_queues.items():
+            _spawn(_translate, language, segments, pivot)
+        _spawn(_analyze, pivot, segment_queues)
+
+    remaining = len(languages)
+    while remaining:
+        event = events.get()
+        if event.done:
+            remaining -= 1
+        yield event
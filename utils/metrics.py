@@ -0,0 +1,331 @@
+"""
+Lightweight span timing for the hot path
+
+Spans feed process-wide latency histograms (exported as Prometheus text) and,
+inside a request_trace, a per-request breakdown for the debug panel. When
+metrics are disabled span() returns a shared no-op context manager and
+timed()/traced_iter() fall straight through, so instrumentation costs a
+global lookup per call.
+"""
+
+import atexit
+import bisect
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+from config.settings import (
+    METRICS_ENABLED,
+    METRICS_DUMP_PATH,
+    METRICS_HISTOGRAM_BUCKETS
+)
+
+METRIC_PREFIX = "medivision"
+METRIC_NAME = f"{METRIC_PREFIX}_span_duration_seconds"
+QUANTILES = (0.5, 0.95, 0.99)
+
+_enabled = METRICS_ENABLED
+logger = logging.getLogger(__name__)
+_NOOP_SPAN = contextlib.nullcontext()
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar("request_trace", default=None)
+
+
+def is_metrics_enabled() -> bool:
+    return _enabled
+
+
+def set_metrics_enabled(enabled: bool):
+    """Turn instrumentation on or off for this process"""
+    global _enabled
+    _enabled = enabled
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus layout)"""
+
+    def __init__(self, buckets=METRICS_HISTOGRAM_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating within its bucket, like histogram_quantile()"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+
+class MetricsRegistry:
+    """Histograms per span name, shared by every session and thread"""
+
+    def __init__(self, buckets=METRICS_HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, Histogram] = {}
+        self._gauges: Dict[str, tuple] = {}  # name -> (help text, callable returning the value)
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def register_gauge(self, name: str, help_text: str, read: Callable[[], float]):
+        """Export read() as a gauge, evaluated on every render"""
+        with self._lock:
+            self._gauges[name] = (help_text, read)
+
+    def summary(self) -> List[Dict[str, float]]:
+        """Count, mean and p50/p95/p99 (ms) per span, slowest total first"""
+        with self._lock:
+            rows = [
+                {
+                    "span": name,
+                    "count": h.count,
+                    "mean_ms": h.sum / h.count * 1000,
+                    **{f"p{int(q * 100)}_ms": h.quantile(q) * 1000 for q in QUANTILES}
+                }
+                for name, h in self._histograms.items()
+            ]
+        return sorted(rows, key=lambda row: row["mean_ms"] * row["count"], reverse=True)
+
+    def render_prometheus(self, labels: Dict[str, str] = None) -> str:
+        """Prometheus text exposition format (version 0.0.4); labels are added to every series"""
+        extra = "".join(f'{key}="{value}",' for key, value in (labels or {}).items())
+        gauge_labels = f"{{{extra[:-1]}}}" if extra else ""
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent in instrumented spans",
+            f"# TYPE {METRIC_NAME} histogram"
+        ]
+        quantile_lines = [
+            f"# HELP {METRIC_NAME}_quantile Span latency quantiles estimated from the histogram",
+            f"# TYPE {METRIC_NAME}_quantile gauge"
+        ]
+        with self._lock:
+            for name in sorted(self._histograms):
+                h = self._histograms[name]
+                cumulative = 0
+                for bound, bucket_count in zip(h.buckets + ("+Inf",), h.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{METRIC_NAME}_bucket{{{extra}span="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_NAME}_sum{{{extra}span="{name}"}} {h.sum:.6f}')
+                lines.append(f'{METRIC_NAME}_count{{{extra}span="{name}"}} {h.count}')
+                for q in QUANTILES:
+                    quantile_lines.append(f'{METRIC_NAME}_quantile{{{extra}span="{name}",quantile="{q}"}} {h.quantile(q):.6f}')
+            gauges = sorted(self._gauges.items())
+
+        # Gauges read other components' state; do that outside our lock
+        gauge_lines = []
+        for name, (help_text, read) in gauges:
+            gauge_lines += [
+                f"# HELP {METRIC_PREFIX}_{name} {help_text}",
+                f"# TYPE {METRIC_PREFIX}_{name} gauge",
+                f"{METRIC_PREFIX}_{name}{gauge_labels} {read()}"
+            ]
+        return "\n".join(lines + quantile_lines + gauge_lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
+
+
+@dataclass
+class RequestTrace:
+    """Spans recorded while handling one request"""
+    name: str
+    started_at: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    spans: List[tuple] = field(default_factory=list)  # (name, offset, duration)
+
+    def breakdown(self) -> List[Dict[str, float]]:
+        """One row per span name: calls, first start offset and total time (ms)"""
+        rows = {}
+        for name, offset, duration in self.spans:
+            row = rows.setdefault(name, {"span": name, "calls": 0, "start_ms": offset * 1000, "total_ms": 0.0})
+            row["calls"] += 1
+            row["total_ms"] += duration * 1000
+        return sorted(rows.values(), key=lambda row: row["start_ms"])
+
+
+def _record(name: str, started: float, duration: float):
+    _registry.observe(name, duration)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.spans.append((name, started - trace.started_at, duration))
+
+
+def register_gauge(name: str, help_text: str, read: Callable[[], float]):
+    """Export a point-in-time value (e.g. memory in use) alongside the span histograms"""
+    _registry.register_gauge(name, help_text, read)
+
+
+def observe(name: str, seconds: float, started: float = None):
+    """Record an externally measured duration"""
+    if _enabled:
+        _record(name, started if started is not None else time.perf_counter() - seconds, seconds)
+
+
+class _Span:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        _record(self.name, self.started, time.perf_counter() - self.started)
+        return False
+
+
+def span(name: str):
+    """Context manager timing its block under name"""
+    return _Span(name) if _enabled else _NOOP_SPAN
+
+
+def timed(name: str = None):
+    """Decorator timing every call of the function"""
+    def decorator(fn):
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(span_name, started, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def traced_iter(name: str, iterable: Iterable) -> Iterable:
+    """
+    Time a stream: "<name>.first_chunk" until the first item and "<name>"
+    for the total time spent waiting on the producer (not the consumer)
+    """
+    if not _enabled:
+        return iterable
+    return _traced_iter(name, iterable)
+
+
+def _traced_iter(name: str, iterable: Iterable):
+    iterator = iter(iterable)
+    started = time.perf_counter()
+    waited = 0.0
+    first = True
+    try:
+        while True:
+            before = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                waited += time.perf_counter() - before
+                break
+            now = time.perf_counter()
+            waited += now - before
+            if first:
+                _record(f"{name}.first_chunk", started, now - started)
+                first = False
+            yield item
+    finally:
+        _record(name, started, waited)
+
+
+@contextlib.contextmanager
+def request_trace(name: str):
+    """Collect the spans of one request; yields the RequestTrace, or None when disabled"""
+    if not _enabled:
+        yield None
+        return
+
+    trace = RequestTrace(name)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.duration = time.perf_counter() - trace.started_at
+        _registry.observe(name, trace.duration)
+        if METRICS_DUMP_PATH:
+            # A full disk or unwritable path must not fail the request being timed
+            try:
+                dump_metrics()
+            except OSError as e:
+                logger.warning("Could not write metrics to %s: %s", _process_dump_path(), e)
+
+
+def render_prometheus(labels: Dict[str, str] = None) -> str:
+    return _registry.render_prometheus(labels)
+
+
+def _process_dump_path(path: str = METRICS_DUMP_PATH) -> Optional[str]:
+    """path with this process's pid before the extension: .cache/metrics.prom -> .cache/metrics.1234.prom"""
+    if not path:
+        return None
+    root, ext = os.path.splitext(path)
+    return f"{root}.{os.getpid()}{ext}"
+
+
+def dump_metrics(path: str = None):
+    """
+    Write this process's Prometheus text atomically (for node_exporter's
+    textfile collector).
+
+    Each worker process keeps its own histograms, so by default every process
+    writes METRICS_DUMP_PATH with its pid before the extension and labels its
+    series with that pid; the collector then exports them all side by side
+    instead of whichever process wrote last.
+    """
+    path = path or _process_dump_path()
+    if not path:
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus({"pid": str(os.getpid())}))
+    os.replace(temp_path, path)
+
+
+@atexit.register
+def _dump_at_exit():
+    if _enabled and METRICS_DUMP_PATH:
+        try:
+            dump_metrics()
+        except OSError:
+            pass
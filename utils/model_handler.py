@@ -2,36 +2,50 @@
 AI model handler and streaming utilities
 """
 
-import streamlit as st
-import google.generativeai as genai
 from typing import Generator, Optional
 from config.settings import AVAILABLE_MODELS, GENERATION_CONFIG, SAFETY_SETTINGS
+from .client_pool import get_client_pool
+from .image_processor import detect_image_mime
+from .metrics import timed, traced_iter
+from .rate_limiter import is_rate_limit_error
 
+# Prefix of the text yielded by stream_response when the stream breaks
+STREAM_ERROR_PREFIX = "\n\n⚠️ Error during streaming:"
 
+
+def _show_error(message: str):
+    # Imported here so headless callers never load Streamlit
+    import streamlit as st
+    st.error(message)
+
+
+@timed("initialize_model")
 def initialize_model(api_key: str, model_name: str):
-    """Initialize Google Generative AI model"""
+    """Get a pooled Google Generative AI model bound to this API key"""
     try:
-        genai.configure(api_key=api_key)
-        
         model_config = AVAILABLE_MODELS.get(model_name)
         if not model_config:
-            st.error(f"Model {model_name} not found")
+            _show_error(f"Model {model_name} not found")
             return None
         
-        model = genai.GenerativeModel(
-            model_name=model_config["name"],
+        return get_client_pool().get_model(
+            api_key=api_key,
+            model_id=model_config["name"],
             generation_config=GENERATION_CONFIG,
             safety_settings=SAFETY_SETTINGS
         )
-        
-        return model
     except Exception as e:
-        st.error(f"Model initialization error: {e}")
+        _show_error(f"Model initialization error: {e}")
         return None
 
 
-def generate_response(model, prompt_parts: list, stream: bool = True):
-    """Generate response from model"""
+@timed("generate_response")
+def generate_response(model, prompt_parts: list, stream: bool = True, raise_errors: bool = False):
+    """
+    Generate response from model
+    With raise_errors=True exceptions propagate instead of being shown with
+    st.error (for worker threads and non-UI callers).
+    """
     try:
         if stream:
             response = model.generate_content(prompt_parts, stream=True)
@@ -40,14 +54,19 @@ def generate_response(model, prompt_parts: list, stream: bool = True):
             response = model.generate_content(prompt_parts)
             return response
     except Exception as e:
-        st.error(f"Generation error: {e}")
+        if raise_errors:
+            raise
+        if is_rate_limit_error(e):
+            _show_error("⏳ The model's free-tier quota is exhausted right now. Please wait a minute or choose another model.")
+        else:
+            _show_error(f"Generation error: {e}")
         return None
 
 
 def stream_response(response_stream) -> Generator[str, None, None]:
     """Stream response text"""
     try:
-        for chunk in response_stream:
+        for chunk in traced_iter("stream_response", response_stream):
             # Check if chunk has valid parts
             if hasattr(chunk, 'parts') and chunk.parts:
                 # Extract text from parts
@@ -57,7 +76,7 @@ def stream_response(response_stream) -> Generator[str, None, None]:
             elif hasattr(chunk, 'text') and chunk.text:
                 yield chunk.text
     except Exception as e:
-        yield f"\n\n⚠️ Error during streaming: {e}"
+        yield f"{STREAM_ERROR_PREFIX} {e}"
 
 
 def validate_response(response) -> bool:
@@ -88,7 +107,7 @@ def get_response_text(response) -> Optional[str]:
             return response.text
         return None
     except Exception as e:
-        st.error(f"Error extracting response text: {e}")
+        _show_error(f"Error extracting response text: {e}")
         return None
 
 
@@ -97,14 +116,16 @@ def prepare_prompt(
     user_text: str = None,
     image_data: bytes = None,
     prompt_style: str = None,
-    regenerate_instruction: str = None
+    regenerate_instruction: str = None,
+    image_mime_type: str = None
 ) -> list:
     """Prepare prompt parts for model"""
     prompt_parts = []
     
-    # Add image if provided
+    # Add image if provided, labelled with its real format
     if image_data:
-        image_parts = [{"mime_type": "image/jpeg", "data": image_data}]
+        mime_type = image_mime_type or detect_image_mime(image_data)
+        image_parts = [{"mime_type": mime_type, "data": image_data}]
         prompt_parts.append(image_parts[0])
     
     # Add user text if provided
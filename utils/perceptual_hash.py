@@ -0,0 +1,208 @@
+"""
+Perceptual image hashes and a near-duplicate index
+
+dHash and pHash reduce an image to 64 bits that barely change when it is
+re-photographed, re-encoded, resized or lightly cropped, so two photos of the
+same film hash a few bits apart. HammingIndex finds stored hashes within r
+bits using multi-index hashing: each hash is split into four 16-bit chunks,
+and any match within r bits is within r // 4 bits of the query on at least
+one chunk (pigeonhole), so a lookup probes a few small buckets per chunk
+instead of scanning every entry.
+"""
+
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Set
+from PIL import Image
+from config.settings import (
+    SIMILAR_IMAGE_ENABLED,
+    SIMILAR_IMAGE_HASH,
+    SIMILAR_IMAGE_MAX_DISTANCE,
+    SIMILAR_IMAGE_INDEX_MAX_ENTRIES
+)
+
+HASH_BITS = 64
+CHUNKS = 4
+CHUNK_BITS = HASH_BITS // CHUNKS
+_CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+def _pack_bits(bits) -> int:
+    import numpy as np
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def dhash(image: Image.Image, hash_size: int = 8) -> int:
+    """Difference hash: whether each pixel is brighter than its left neighbour on a 9x8 thumbnail"""
+    import numpy as np
+
+    thumbnail = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+    pixels = np.asarray(thumbnail, dtype=np.int16)
+    return _pack_bits(pixels[:, 1:] > pixels[:, :-1])
+
+
+@functools.lru_cache(maxsize=4)
+def _dct_matrix(size: int):
+    import numpy as np
+
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    return np.cos(np.pi * (2 * n + 1) * k / (2 * size))
+
+
+def phash(image: Image.Image, hash_size: int = 8, highfreq_factor: int = 4) -> int:
+    """DCT hash: the lowest 8x8 frequencies of a 32x32 thumbnail compared with their median"""
+    import numpy as np
+
+    size = hash_size * highfreq_factor
+    thumbnail = image.convert("L").resize((size, size), Image.Resampling.BOX)
+    dct = _dct_matrix(size)
+    coefficients = (dct @ np.asarray(thumbnail, dtype=np.float64) @ dct.T)[:hash_size, :hash_size]
+    # The DC term is overall brightness; leaving it out of the median keeps exposure changes from flipping bits
+    return _pack_bits(coefficients > np.median(coefficients.ravel()[1:]))
+
+
+_HASHES = {"phash": phash, "dhash": dhash}
+
+
+def image_hash(image: Image.Image, algorithm: str = SIMILAR_IMAGE_HASH) -> int:
+    """64-bit perceptual hash of image with the configured algorithm"""
+    return _HASHES[algorithm](image)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")  # int.bit_count() needs Python 3.10
+
+
+@functools.lru_cache(maxsize=8)
+def _flip_masks(radius: int) -> List[int]:
+    """Every CHUNK_BITS-bit mask with at most radius bits set"""
+    masks = []
+    for flipped in range(radius + 1):
+        for positions in itertools.combinations(range(CHUNK_BITS), flipped):
+            masks.append(sum(1 << position for position in positions))
+    return masks
+
+
+@dataclass
+class SimilarMatch:
+    """Closest stored hash within the distance limit"""
+    value: Any
+    distance: int
+    image_hash: int
+
+
+class HammingIndex:
+    """
+    Multi-index hash table over 64-bit hashes, partitioned by context (e.g.
+    model, language and style) and bounded to max_entries, oldest out first.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = SIMILAR_IMAGE_MAX_DISTANCE,
+        max_entries: int = SIMILAR_IMAGE_INDEX_MAX_ENTRIES
+    ):
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        # context -> one table per chunk: chunk value -> entry ids
+        self._tables: Dict[Hashable, List[Dict[int, Set[int]]]] = {}
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # id -> (context, hash, value); oldest first
+        self._hashes: Dict[int, int] = {}  # id -> hash, for verifying candidates
+        self._ids: Dict[tuple, int] = {}  # (context, hash) -> id
+        self._next_id = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _chunks(image_hash: int):
+        return [(image_hash >> (CHUNK_BITS * index)) & _CHUNK_MASK for index in range(CHUNKS)]
+
+    def add(self, image_hash: int, value: Any, context: Hashable = None):
+        """Store value under image_hash; an identical hash in the same context is replaced"""
+        with self._lock:
+            existing = self._ids.get((context, image_hash))
+            if existing is not None:
+                self._remove(existing)
+
+            entry_id = next(self._next_id)
+            self._entries[entry_id] = (context, image_hash, value)
+            self._hashes[entry_id] = image_hash
+            self._ids[(context, image_hash)] = entry_id
+            tables = self._tables.get(context)
+            if tables is None:
+                tables = self._tables[context] = [{} for _ in range(CHUNKS)]
+            for table, chunk in zip(tables, self._chunks(image_hash)):
+                table.setdefault(chunk, set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def find(self, image_hash: int, context: Hashable = None, max_distance: int = None) -> Optional[SimilarMatch]:
+        """Nearest stored hash in context within max_distance bits, or None"""
+        max_distance = self.max_distance if max_distance is None else max_distance
+        masks = _flip_masks(min(max_distance // CHUNKS, CHUNK_BITS))
+        with self._lock:
+            tables = self._tables.get(context)
+            if tables is None:
+                return None
+
+            candidates = set()
+            for table, chunk in zip(tables, self._chunks(image_hash)):
+                for mask in masks:
+                    bucket = table.get(chunk ^ mask)
+                    if bucket:
+                        candidates.update(bucket)
+
+            best_id, best_distance = None, max_distance + 1
+            hashes = self._hashes
+            for entry_id in candidates:
+                distance = bin(image_hash ^ hashes[entry_id]).count("1")
+                if distance < best_distance:
+                    best_id, best_distance = entry_id, distance
+            if best_id is None:
+                return None
+            _, stored_hash, value = self._entries[best_id]
+        return SimilarMatch(value, best_distance, stored_hash)
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+            self._entries.clear()
+            self._hashes.clear()
+            self._ids.clear()
+
+    def _remove(self, entry_id: int):
+        context, image_hash, _ = self._entries.pop(entry_id)
+        del self._hashes[entry_id]
+        del self._ids[(context, image_hash)]
+        tables = self._tables[context]
+        for table, chunk in zip(tables, self._chunks(image_hash)):
+            bucket = table[chunk]
+            bucket.discard(entry_id)
+            if not bucket:
+                del table[chunk]
+        if not tables[0]:
+            del self._tables[context]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_similar_image_index() -> Optional[HammingIndex]:
+    """Get the process-wide index of analyzed images, or None when reuse is disabled"""
+    global _index
+    if not SIMILAR_IMAGE_ENABLED:
+        return None
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = HammingIndex()
+    return _index
@@ -0,0 +1,286 @@
+"""
+Quota-aware token-bucket rate limiting per API key and model
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+from config.settings import (
+    AVAILABLE_MODELS,
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_DB_PATH,
+    RATE_LIMIT_MAX_WAIT_SECONDS,
+    RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE
+)
+from .client_pool import api_key_fingerprint
+
+# (bucket key, capacity, refill per second, cost)
+BucketSpec = Tuple[str, float, float, float]
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to queue longer than allowed"""
+
+    def __init__(self, model_name: str, wait_seconds: float):
+        self.model_name = model_name
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"{model_name} is at its free-tier limit; the next slot is in ~{wait_seconds:.0f}s"
+        )
+
+
+@dataclass
+class Reservation:
+    """A granted slot; the caller may start once wait_seconds have elapsed"""
+    model_name: str
+    wait_seconds: float
+    ready_at: float
+    reserved_tokens: int
+    token_bucket: Optional[str] = None
+
+    def remaining(self) -> float:
+        return max(0.0, self.ready_at - time.time())
+
+
+def _take(tokens: float, updated_at: float, capacity: float, rate: float, cost: float, now: float):
+    """Refill a bucket to now and take cost; returns (new balance, wait seconds)"""
+    tokens = min(capacity, tokens + (now - updated_at) * rate)
+    tokens -= cost
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class MemoryBucketBackend:
+    """Bucket state for a single process"""
+
+    def __init__(self):
+        self._buckets = {}  # bucket key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def reserve(self, specs: List[BucketSpec], max_wait: float, now: float) -> Tuple[float, bool]:
+        """Take from all buckets atomically; returns (wait, granted)"""
+        with self._lock:
+            updates = {}
+            wait = 0.0
+            for key, capacity, rate, cost in specs:
+                tokens, updated_at = self._buckets.get(key, (capacity, now))
+                updates[key], bucket_wait = _take(tokens, updated_at, capacity, rate, cost, now)
+                wait = max(wait, bucket_wait)
+            if wait > max_wait:
+                return wait, False
+            for key, tokens in updates.items():
+                self._buckets[key] = (tokens, now)
+            return wait, True
+
+    def adjust(self, key: str, capacity: float, rate: float, delta: float, now: float):
+        """Refund (delta > 0) or charge (delta < 0) a bucket after the fact"""
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens, _ = _take(tokens, updated_at, capacity, rate, -delta, now)
+            self._buckets[key] = (min(capacity, tokens), now)
+
+
+class SQLiteBucketBackend:
+    """Bucket state in SQLite so every worker process shares one quota"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS buckets (
+                bucket_key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly below
+            conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _read(self, conn, key: str, capacity: float, now: float):
+        row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE bucket_key = ?", (key,)).fetchone()
+        return row if row else (capacity, now)
+
+    def _write(self, conn, key: str, tokens: float, now: float):
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (bucket_key, tokens, updated_at) VALUES (?, ?, ?)",
+            (key, tokens, now)
+        )
+
+    def reserve(self, specs: List[BucketSpec], max_wait: float, now: float) -> Tuple[float, bool]:
+        conn = self._connection()
+        # IMMEDIATE takes the write lock up front so read-modify-write is atomic across processes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            updates = {}
+            wait = 0.0
+            for key, capacity, rate, cost in specs:
+                tokens, updated_at = self._read(conn, key, capacity, now)
+                updates[key], bucket_wait = _take(tokens, updated_at, capacity, rate, cost, now)
+                wait = max(wait, bucket_wait)
+            granted = wait <= max_wait
+            if granted:
+                for key, tokens in updates.items():
+                    self._write(conn, key, tokens, now)
+            conn.execute("COMMIT")
+            return wait, granted
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def adjust(self, key: str, capacity: float, rate: float, delta: float, now: float):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            tokens, updated_at = self._read(conn, key, capacity, now)
+            tokens, _ = _take(tokens, updated_at, capacity, rate, -delta, now)
+            self._write(conn, key, min(capacity, tokens), now)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class RateLimiter:
+    """
+    Token buckets for requests-per-minute and tokens-per-minute, keyed by
+    API-key fingerprint and model.
+
+    A reservation may drive a bucket negative: that debt is the queue, and
+    the caller waits until it has refilled. Requests are therefore served
+    in arrival order with a known wait instead of failing with a 429.
+    """
+
+    def __init__(self, backend=None, max_wait_seconds: float = RATE_LIMIT_MAX_WAIT_SECONDS):
+        self.backend = backend or MemoryBucketBackend()
+        self.max_wait_seconds = max_wait_seconds
+
+    @staticmethod
+    def _limits(model_name: str) -> Tuple[Optional[int], Optional[int]]:
+        model_config = AVAILABLE_MODELS.get(model_name, {})
+        return model_config.get("rpm"), model_config.get("tpm")
+
+    def reserve(
+        self,
+        api_key: str,
+        model_name: str,
+        estimated_tokens: int = 0,
+        max_wait_seconds: float = None
+    ) -> Reservation:
+        """Reserve a slot or raise RateLimitExceeded if the queue is too long"""
+        if max_wait_seconds is None:
+            max_wait_seconds = self.max_wait_seconds
+        rpm, tpm = self._limits(model_name)
+        now = time.time()
+        prefix = f"{api_key_fingerprint(api_key)}:{model_name}"
+        specs = []
+        token_bucket = None
+        if rpm:
+            specs.append((f"{prefix}:rpm", rpm, rpm / 60.0, 1))
+        if tpm:
+            tokens = estimated_tokens + RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE
+            token_bucket = f"{prefix}:tpm"
+            specs.append((token_bucket, tpm, tpm / 60.0, min(tokens, tpm)))
+
+        if not specs:
+            return Reservation(model_name, 0.0, now, 0)
+
+        wait, granted = self.backend.reserve(specs, max_wait_seconds, now)
+        if not granted:
+            raise RateLimitExceeded(model_name, wait)
+        reserved = int(specs[-1][3]) if token_bucket else 0
+        return Reservation(model_name, wait, now + wait, reserved, token_bucket)
+
+    def settle(self, reservation: Reservation, actual_tokens: int):
+        """Correct the token bucket once real usage is known"""
+        if not reservation.token_bucket:
+            return
+        _, tpm = self._limits(reservation.model_name)
+        delta = reservation.reserved_tokens - actual_tokens
+        if delta:
+            self.backend.adjust(reservation.token_bucket, tpm, tpm / 60.0, delta, time.time())
+
+    def wait(self, reservation: Reservation, on_tick: Callable[[float], None] = None, tick: float = 1.0):
+        """Block until the reservation is ready, reporting remaining seconds"""
+        while True:
+            remaining = reservation.remaining()
+            if remaining <= 0:
+                return
+            if on_tick:
+                on_tick(remaining)
+            time.sleep(min(tick, remaining))
+
+    def acquire(
+        self,
+        api_key: str,
+        model_name: str,
+        estimated_tokens: int = 0,
+        max_wait_seconds: float = None
+    ) -> Reservation:
+        """Reserve and block until the slot is ready"""
+        reservation = self.reserve(api_key, model_name, estimated_tokens, max_wait_seconds)
+        self.wait(reservation)
+        return reservation
+
+    async def acquire_async(
+        self,
+        api_key: str,
+        model_name: str,
+        estimated_tokens: int = 0,
+        max_wait_seconds: float = None
+    ) -> Reservation:
+        """Reserve and sleep on the event loop until the slot is ready"""
+        reservation = self.reserve(api_key, model_name, estimated_tokens, max_wait_seconds)
+        remaining = reservation.remaining()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return reservation
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for the API's quota errors (HTTP 429 / RESOURCE_EXHAUSTED)"""
+    return (
+        type(error).__name__ in ("ResourceExhausted", "TooManyRequests")
+        or getattr(error, "code", None) == 429
+    )
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the process-wide rate limiter, or None when rate limiting is disabled"""
+    global _limiter
+    if not RATE_LIMIT_ENABLED:
+        return None
+
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                backend = None
+                if RATE_LIMIT_DB_PATH:
+                    try:
+                        backend = SQLiteBucketBackend(RATE_LIMIT_DB_PATH)
+                    except (sqlite3.Error, OSError):
+                        backend = None
+                _limiter = RateLimiter(backend)
+    return _limiter
@@ -0,0 +1,186 @@
+"""
+Incremental regeneration: refine the previous answer as a follow-up turn
+
+Instead of re-running the whole analysis with the image inline, a
+regeneration sends a conversation of (original request, previous answer,
+refinement instruction) in which the image is a reference to a copy
+uploaded once through the File API.
+"""
+
+import hashlib
+import io
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from config.settings import (
+    REGENERATION_REUSE_UPLOADS,
+    UPLOAD_HANDLE_TTL_SECONDS,
+    UPLOAD_WAIT_SECONDS
+)
+from .client_pool import api_key_fingerprint, get_client_pool
+from .image_processor import format_byte_size
+
+
+@dataclass
+class UploadHandle:
+    """An image stored with the File API"""
+    file_name: str
+    file_uri: str
+    mime_type: str
+    size_bytes: int
+    expires_at: float
+
+    @property
+    def part(self) -> dict:
+        """Prompt part referring to the uploaded file"""
+        return {"file_data": {"mime_type": self.mime_type, "file_uri": self.file_uri}}
+
+
+class UploadCache:
+    """
+    Upload handles per (API key, image digest).
+
+    An image is uploaded on its first regeneration, not with the analysis,
+    since most analyses are never regenerated; later regenerations reuse
+    the handle until it expires.
+    """
+
+    def __init__(self, ttl_seconds: float = UPLOAD_HANDLE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._uploads: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upload")
+
+    @staticmethod
+    def _key(api_key: str, data: bytes) -> Tuple[str, str]:
+        return api_key_fingerprint(api_key), hashlib.sha256(data).hexdigest()
+
+    def _upload(self, api_key: str, data: bytes, mime_type: str) -> UploadHandle:
+        uploaded = get_client_pool().get_file_client(api_key).create_file(
+            io.BytesIO(data),
+            mime_type=mime_type,
+            display_name="medivision-image"
+        )
+        return UploadHandle(
+            file_name=uploaded.name,
+            file_uri=uploaded.uri,
+            mime_type=mime_type,
+            size_bytes=len(data),
+            expires_at=time.time() + self.ttl_seconds
+        )
+
+    def prefetch(self, api_key: str, data: bytes, mime_type: str) -> Future:
+        """Start uploading unless a live upload of the same image exists"""
+        key = self._key(api_key, data)
+        with self._lock:
+            future = self._uploads.get(key)
+            if future is not None and not self._is_stale(future):
+                return future
+            future = self._executor.submit(self._upload, api_key, data, mime_type)
+            self._uploads[key] = future
+            return future
+
+    def has(self, api_key: str, data: bytes) -> bool:
+        """Whether a live upload of the image exists (or is in progress)"""
+        with self._lock:
+            future = self._uploads.get(self._key(api_key, data))
+            return future is not None and not self._is_stale(future)
+
+    def get(self, api_key: str, data: bytes, mime_type: str, timeout: float = UPLOAD_WAIT_SECONDS) -> Optional[UploadHandle]:
+        """Handle for the image, uploading if needed; None if the upload failed or is too slow"""
+        try:
+            return self.prefetch(api_key, data, mime_type).result(timeout=timeout)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _is_stale(future: Future) -> bool:
+        if not future.done():
+            return False
+        if future.exception() is not None:
+            return True
+        return future.result().expires_at <= time.time()
+
+
+def build_followup_contents(prompt_parts: list, previous_response: str, instruction: str, image_part: dict = None) -> list:
+    """
+    Conversation asking the model to revise its previous answer.
+
+    prompt_parts is the original request; with image_part its inline image
+    is replaced by that (uploaded file) reference.
+    """
+    first_turn = [
+        image_part if image_part is not None and isinstance(part, dict) and "data" in part else part
+        for part in prompt_parts
+    ]
+    return [
+        {"role": "user", "parts": first_turn},
+        {"role": "model", "parts": [previous_response]},
+        {"role": "user", "parts": [f"Revise your analysis above. {instruction}"]}
+    ]
+
+
+def estimate_request_bytes(contents: list) -> int:
+    """Approximate request payload size; inline images are sent base64-encoded"""
+    total = 0
+    for part in contents:
+        if isinstance(part, str):
+            total += len(part.encode("utf-8"))
+        elif isinstance(part, dict) and "parts" in part:
+            total += estimate_request_bytes(part["parts"])
+        elif isinstance(part, dict) and "data" in part:
+            total += 4 * math.ceil(len(part["data"]) / 3)
+        elif isinstance(part, dict) and "file_data" in part:
+            total += len(part["file_data"]["file_uri"])
+        else:
+            total += len(str(part).encode("utf-8"))
+    return total
+
+
+@dataclass
+class RegenerationSavings:
+    """What one incremental regeneration saved over a full re-run"""
+    full_bytes: int
+    sent_bytes: int
+    full_seconds: float
+    regen_seconds: float
+    reused_upload: bool
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.full_bytes - self.sent_bytes
+
+    @property
+    def seconds_saved(self) -> float:
+        return self.full_seconds - self.regen_seconds
+
+    def summary(self) -> str:
+        if self.bytes_saved >= 0:
+            sent = f"sent {format_byte_size(self.sent_bytes)} instead of {format_byte_size(self.full_bytes)}"
+        else:
+            sent = f"sent {format_byte_size(self.sent_bytes)} (previous answer included)"
+        source = "reused uploaded image · " if self.reused_upload else ""
+        return (
+            f"♻️ Incremental regeneration: {source}{sent} · "
+            f"{self.regen_seconds:.1f}s vs {self.full_seconds:.1f}s for the full analysis"
+        )
+
+
+_upload_cache = None
+_upload_cache_lock = threading.Lock()
+
+
+def get_upload_cache() -> Optional[UploadCache]:
+    """Get the process-wide upload cache, or None when upload reuse is disabled"""
+    global _upload_cache
+    if not REGENERATION_REUSE_UPLOADS:
+        return None
+
+    if _upload_cache is None:
+        with _upload_cache_lock:
+            if _upload_cache is None:
+                _upload_cache = UploadCache()
+    return _upload_cache
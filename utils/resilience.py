@@ -0,0 +1,249 @@
+"""
+Retry, hedging and model fallback around generation
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional
+from config.settings import (
+    AVAILABLE_MODELS,
+    GENERATION_CONFIG,
+    SAFETY_SETTINGS,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_BASE_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
+    HEDGE_ENABLED,
+    HEDGE_LATENCY_BUDGET_SECONDS,
+    MODEL_FALLBACK_CHAINS
+)
+from .client_pool import get_client_pool
+from .rate_limiter import RateLimitExceeded, get_rate_limiter
+
+# google.api_core exception names worth retrying or failing over on
+TRANSIENT_ERROR_NAMES = {
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "InternalServerError",
+    "DeadlineExceeded",
+    "GatewayTimeout",
+    "BadGateway",
+    "Aborted",
+    "Unknown"
+}
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="generation")
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether an error is likely to succeed on retry or another model"""
+    if isinstance(error, (ConnectionError, TimeoutError, RateLimitExceeded)):
+        return True
+    if type(error).__name__ in TRANSIENT_ERROR_NAMES:
+        return True
+    return getattr(error, "code", None) in TRANSIENT_STATUS_CODES
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = RETRY_BASE_DELAY_SECONDS,
+    cap: float = RETRY_MAX_DELAY_SECONDS
+) -> float:
+    """Exponential backoff with full jitter for the given 0-based attempt"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def call_with_retry(
+    fn: Callable,
+    max_attempts: int = RETRY_MAX_ATTEMPTS,
+    base: float = RETRY_BASE_DELAY_SECONDS,
+    cap: float = RETRY_MAX_DELAY_SECONDS,
+    on_retry: Callable[[int, Exception, float], None] = None,
+    sleep: Callable[[float], None] = time.sleep
+):
+    """Call fn, retrying transient errors with jittered exponential backoff"""
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_transient_error(e):
+                raise
+            delay = backoff_delay(attempt, base, cap)
+            if on_retry:
+                on_retry(attempt + 1, e, delay)
+            sleep(delay)
+
+
+class ResilientStream:
+    """
+    A stream whose first chunk has already arrived.
+
+    Iterates like the SDK response (so it can be passed to stream_response)
+    and records which model answered and what it took to get there. A
+    fallback model's own rate-limit reservation is settled here, once the
+    stream is exhausted or closed.
+    """
+
+    def __init__(self, model_name: str, response, iterator, first_chunk, events: List[str], reservation=None):
+        self.model_name = model_name
+        self.response = response
+        self.events = events
+        self._iterator = iterator
+        self._first_chunk = first_chunk
+        self._reservation = reservation
+        self._settle_lock = threading.Lock()
+
+    def __iter__(self):
+        try:
+            if self._first_chunk is not None:
+                yield self._first_chunk
+                self._first_chunk = None
+            yield from self._iterator
+        finally:
+            self._settle()
+
+    def close(self):
+        """Abandon the stream (a losing hedge), cancelling the request and settling its quota"""
+        close = getattr(self._iterator, "close", None)
+        if close is not None:
+            close()
+        # The SDK response keeps the underlying gRPC call, which can be cancelled
+        cancel = getattr(getattr(self.response, "_iterator", None), "cancel", None)
+        if cancel is not None:
+            cancel()
+        self._settle()
+
+    def _settle(self):
+        with self._settle_lock:
+            reservation, self._reservation = self._reservation, None
+        if reservation is None:
+            return
+        # Without usage metadata the estimate stands
+        actual_tokens = getattr(self.usage_metadata, "total_token_count", None)
+        get_rate_limiter().settle(reservation, actual_tokens or reservation.reserved_tokens)
+
+    @property
+    def usage_metadata(self):
+        return getattr(self.response, "usage_metadata", None)
+
+
+def get_fallback_chain(model_name: str) -> List[str]:
+    """Configured fallback models for model_name, excluding unknown ones"""
+    return [m for m in MODEL_FALLBACK_CHAINS.get(model_name, []) if m in AVAILABLE_MODELS and m != model_name]
+
+
+def _pooled_model(api_key: str, model_name: str):
+    model_config = AVAILABLE_MODELS.get(model_name)
+    if not model_config:
+        raise ValueError(f"Model {model_name} not found")
+    return get_client_pool().get_model(
+        api_key=api_key,
+        model_id=model_config["name"],
+        generation_config=GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS
+    )
+
+
+def generate_with_fallback(
+    api_key: str,
+    model_name: str,
+    prompt_parts: list,
+    fallback_chain: Optional[List[str]] = None,
+    hedge_after: Optional[float] = None,
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+) -> ResilientStream:
+    """
+    Start a streamed generation that survives transient failures.
+
+    Each model is tried up to max_attempts times with jittered backoff until
+    its first chunk arrives; on persistent transient failure the next model in
+    the fallback chain is tried. With hedge_after set, if the current model has
+    not produced its first chunk within that many seconds, the next model is
+    started in parallel and whichever answers first wins. Non-transient errors
+    (bad key, blocked prompt) are raised without failing over.
+
+    The primary model's rate-limit slot is expected to be reserved by the
+    caller; fallback models only run if they have quota available right now,
+    and their reservation is refunded if they fail and settled by the
+    returned stream otherwise. Attempts that lose a hedge are closed.
+    """
+    if fallback_chain is None:
+        fallback_chain = get_fallback_chain(model_name)
+    if hedge_after is None and HEDGE_ENABLED:
+        hedge_after = HEDGE_LATENCY_BUDGET_SECONDS
+
+    candidates = [model_name] + list(fallback_chain)
+    events = []
+    events_lock = threading.Lock()
+    winner_chosen = threading.Event()
+
+    def _log(message: str):
+        with events_lock:
+            events.append(message)
+
+    def _attempt(candidate: str, is_fallback: bool):
+        rate_limiter = get_rate_limiter() if is_fallback else None
+        reservation = None
+        if rate_limiter is not None:
+            reservation = rate_limiter.reserve(api_key, candidate, max_wait_seconds=0)
+
+        def _first_chunk():
+            if winner_chosen.is_set():
+                raise RuntimeError("another model already answered")
+            response = model.generate_content(prompt_parts, stream=True)
+            iterator = iter(response)
+            return response, iterator, next(iterator, None)
+
+        try:
+            model = _pooled_model(api_key, candidate)
+            response, iterator, first_chunk = call_with_retry(
+                _first_chunk,
+                max_attempts=max_attempts,
+                on_retry=lambda n, e, delay: _log(f"{candidate}: retry {n} in {delay:.1f}s after {type(e).__name__}")
+            )
+        except Exception:
+            if reservation is not None:
+                rate_limiter.settle(reservation, 0)
+            raise
+        return ResilientStream(candidate, response, iterator, first_chunk, events, reservation)
+
+    def _discard(future):
+        # A losing attempt that still got its first chunk would otherwise stream on unread
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    last_error = None
+    index = 0
+    while index < len(candidates):
+        pending = {_executor.submit(_attempt, candidates[index], index > 0): candidates[index]}
+
+        if hedge_after and index + 1 < len(candidates):
+            done, _ = wait(pending, timeout=hedge_after)
+            if not done:
+                index += 1
+                _log(f"{pending[next(iter(pending))]}: no first byte after {hedge_after:g}s, hedging with {candidates[index]}")
+                pending[_executor.submit(_attempt, candidates[index], True)] = candidates[index]
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                candidate = pending.pop(future)
+                try:
+                    stream = future.result()
+                except Exception as e:
+                    last_error = e
+                    _log(f"{candidate}: failed with {type(e).__name__}")
+                    if not is_transient_error(e) and not pending:
+                        raise
+                    continue
+                winner_chosen.set()
+                for loser in pending:
+                    loser.add_done_callback(_discard)
+                return stream
+
+        index += 1
+
+    raise last_error
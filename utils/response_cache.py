@@ -0,0 +1,276 @@
+"""
+Content-addressed response cache with in-memory and on-disk tiers
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, Optional
+from config.settings import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_DB_PATH,
+    RESPONSE_CACHE_REPLAY_CHUNK_CHARS
+)
+
+CACHE_KEY_VERSION = b"medivision-response-v1"
+
+
+def build_cache_key(
+    model_name: str,
+    prompt_parts: list,
+    language: str,
+    instruction: str = None
+) -> str:
+    """
+    Build a content-addressed key for a generation request.
+
+    Every field is length-prefixed before hashing so that adjacent values can
+    never run together into the same digest.
+    """
+    digest = hashlib.sha256(CACHE_KEY_VERSION)
+
+    def _update(tag: bytes, value: bytes):
+        digest.update(tag)
+        digest.update(len(value).to_bytes(8, "big"))
+        digest.update(value)
+
+    _update(b"m", (model_name or "").encode())
+    _update(b"l", (language or "").encode())
+    _update(b"s", (instruction or "").encode())
+
+    def _update_parts(parts: list):
+        for part in parts:
+            if isinstance(part, dict) and "parts" in part:
+                _update(b"r", part.get("role", "").encode())
+                _update(b"n", str(len(part["parts"])).encode())
+                _update_parts(part["parts"])
+            elif isinstance(part, dict):
+                _update(b"i", part.get("mime_type", "").encode())
+                _update(b"d", bytes(part.get("data", b"")))
+            else:
+                _update(b"t", str(part).encode())
+
+    _update_parts(prompt_parts)
+
+    return digest.hexdigest()
+
+
+class MemoryCacheTier:
+    """Thread-safe LRU of responses bounded by total UTF-8 size"""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (response, size, expires_at)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, size, expires_at = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str, expires_at: float = None):
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        if expires_at is None:
+            expires_at = time.time() + self.ttl_seconds
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (response, size, expires_at)
+            self._size += size
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+
+class DiskCacheTier:
+    """SQLite-backed tier shared by every worker process on the host"""
+
+    PURGE_EVERY_N_WRITES = 100
+
+    def __init__(self, db_path: str, ttl_seconds: float):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        self._writes = 0
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_expires ON responses (expires_at)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str):
+        """Return (response, expires_at) or None"""
+        row = self._connection().execute(
+            "SELECT response, expires_at FROM responses WHERE cache_key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        return row
+
+    def set(self, key: str, response: str):
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (cache_key, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now + self.ttl_seconds)
+            )
+
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY_N_WRITES == 0:
+            self.purge_expired()
+
+    def purge_expired(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    def clear(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """Two-tier cache: per-process LRU in front of an optional shared disk tier"""
+
+    def __init__(self, memory: MemoryCacheTier, disk: Optional[DiskCacheTier] = None):
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        response = self.memory.get(key)
+        if response is None and self.disk is not None:
+            try:
+                row = self.disk.get(key)
+            except sqlite3.Error:
+                row = None
+            if row:
+                response, expires_at = row
+                self.memory.set(key, response, expires_at=expires_at)
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def set(self, key: str, response: str):
+        if not response:
+            return
+        self.memory.set(key, response)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, response)
+            except sqlite3.Error:
+                # The disk tier is best effort; the memory tier still holds it
+                pass
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the process-wide response cache, or None when caching is disabled"""
+    global _cache
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                disk = None
+                if RESPONSE_CACHE_DB_PATH:
+                    try:
+                        disk = DiskCacheTier(RESPONSE_CACHE_DB_PATH, RESPONSE_CACHE_TTL_SECONDS)
+                    except (sqlite3.Error, OSError):
+                        disk = None
+                memory = MemoryCacheTier(RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL_SECONDS)
+                _cache = ResponseCache(memory, disk)
+    return _cache
+
+
+class _CachedChunk:
+    """Minimal stand-in for a streamed GenerateContentResponse chunk"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class CachedResponse:
+    """Replays a cached response through the same chunk iteration as a live stream"""
+
+    def __init__(self, text: str, chunk_chars: int = RESPONSE_CACHE_REPLAY_CHUNK_CHARS):
+        self.text = text
+        self.chunk_chars = max(1, chunk_chars)
+        self.from_cache = True
+
+    def __iter__(self) -> Iterator[_CachedChunk]:
+        for start in range(0, len(self.text), self.chunk_chars):
+            yield _CachedChunk(self.text[start:start + self.chunk_chars])
+
+
+def replay_response(text: str) -> CachedResponse:
+    """Wrap cached text so it can be passed to stream_response"""
+    return CachedResponse(text)
@@ -4,6 +4,7 @@ Response rendering utilities with syntax highlighting
 
 import streamlit as st
 import re
+from .metrics import timed
 
 
 def render_response_with_syntax(response_text: str):
@@ -70,23 +71,140 @@ def split_response_sections(text: str) -> list:
     return sections
 
 
-def format_medical_response(response: str) -> str:
-    """Format response with medical-specific styling"""
-    
+# Literal rewrites applied to model output, in application order
+MEDICAL_REPLACEMENTS = [
     # Add icons to common medical sections
-    response = response.replace("**Observational Analysis:**", "🔍 **Observational Analysis:**")
-    response = response.replace("**General Insights:**", "💡 **General Insights:**")
-    response = response.replace("**Recommendations:**", "📋 **Recommendations:**")
-    response = response.replace("**Cautionary Notes:**", "⚠️ **Cautionary Notes:**")
-    response = response.replace("**Disclaimer:**", "⚕️ **Disclaimer:**")
-    
+    ("**Observational Analysis:**", "🔍 **Observational Analysis:**"),
+    ("**General Insights:**", "💡 **General Insights:**"),
+    ("**Recommendations:**", "📋 **Recommendations:**"),
+    ("**Cautionary Notes:**", "⚠️ **Cautionary Notes:**"),
+    ("**Disclaimer:**", "⚕️ **Disclaimer:**"),
     # Highlight important warnings
-    response = response.replace("consult a medical professional", "**consult a medical professional**")
-    response = response.replace("seek immediate medical attention", "**⚠️ SEEK IMMEDIATE MEDICAL ATTENTION**")
-    
+    ("consult a medical professional", "**consult a medical professional**"),
+    ("seek immediate medical attention", "**⚠️ SEEK IMMEDIATE MEDICAL ATTENTION**"),
+]
+
+
+@timed("format_medical_response")
+def format_medical_response(response: str) -> str:
+    """Format response with medical-specific styling"""
+    for pattern, replacement in MEDICAL_REPLACEMENTS:
+        response = response.replace(pattern, replacement)
     return response
 
 
+class IncrementalMedicalFormatter:
+    """
+    Streaming counterpart of format_medical_response.
+
+    Each call to feed() formats only the newly arrived text and returns the
+    formatted delta. A tail that could still grow into a section header or
+    warning phrase is held back until the next chunk (or flush()) decides it,
+    so patterns split across chunk boundaries are still rewritten.
+    """
+
+    def __init__(self, replacements: list = None):
+        replacements = replacements or MEDICAL_REPLACEMENTS
+        self._replacements = dict(replacements)
+        self._patterns = [pattern for pattern, _ in replacements]
+        # Longest pattern first so that alternation prefers full matches
+        ordered = sorted(self._patterns, key=len, reverse=True)
+        self._regex = re.compile("|".join(re.escape(p) for p in ordered))
+        self._max_len = max(len(p) for p in self._patterns)
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Consume a raw chunk and return the newly formatted text"""
+        if not chunk:
+            return ""
+        self._pending += chunk
+        return self._drain(final=False)
+
+    def flush(self) -> str:
+        """Return any held-back text once the stream has ended"""
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> str:
+        text = self._pending
+        output = []
+        last_end = 0
+        for match in self._regex.finditer(text):
+            output.append(text[last_end:match.start()])
+            output.append(self._replacements[match.group(0)])
+            last_end = match.end()
+
+        cut = len(text) if final else self._partial_match_start(text, last_end)
+        output.append(text[last_end:cut])
+        self._pending = text[cut:]
+        return "".join(output)
+
+    def _partial_match_start(self, text: str, start: int) -> int:
+        """Find where a possible unfinished pattern begins in the tail"""
+        for idx in range(max(start, len(text) - self._max_len + 1), len(text)):
+            tail = text[idx:]
+            if any(pattern.startswith(tail) for pattern in self._patterns):
+                return idx
+        return len(text)
+
+
+class StreamingMarkdownRenderer:
+    """
+    Render a growing markdown document as a series of frozen blocks.
+
+    Completed paragraphs are written once into their own element and never
+    re-sent; only the paragraph still being streamed is re-rendered, so the
+    per-chunk payload stays bounded by the size of the open paragraph rather
+    than the whole report.
+    """
+
+    def __init__(self, container=None):
+        self._container = container if container is not None else st.container()
+        self._placeholder = None
+        self._open_block = ""
+
+    def write(self, delta: str):
+        """Append formatted text and refresh only the open block"""
+        if not delta:
+            return
+        self._open_block += delta
+
+        boundary = self._last_block_boundary(self._open_block)
+        if boundary:
+            self._render(self._open_block[:boundary])
+            self._placeholder = None
+            self._open_block = self._open_block[boundary:]
+
+        if self._open_block:
+            self._render(self._open_block)
+
+    def close(self):
+        """Finish rendering; the open block becomes final"""
+        if self._open_block:
+            self._render(self._open_block)
+        self._placeholder = None
+        self._open_block = ""
+
+    def _render(self, text: str):
+        if self._placeholder is None:
+            self._placeholder = self._container.empty()
+        self._placeholder.markdown(text)
+
+    @staticmethod
+    def _last_block_boundary(text: str) -> int:
+        """Offset just past the last blank line outside a code fence, or 0"""
+        boundary = 0
+        in_fence = False
+        pos = 0
+        for line in text.splitlines(keepends=True):
+            pos += len(line)
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                in_fence = not in_fence
+            elif not stripped and not in_fence and line.endswith("\n"):
+                boundary = pos
+        return boundary
+
+
 def create_collapsible_section(title: str, content: str, expanded: bool = False):
     """Create a collapsible section"""
     with st.expander(title, expanded=expanded):
@@ -2,28 +2,104 @@
 Security utilities for API key encryption and validation
 """
 
-import streamlit as st
-from cryptography.fernet import Fernet
 import base64
 import hashlib
+import hmac
+import os
+import time
+import streamlit as st
+from config.settings import API_KEY_CACHE_TTL_SECONDS, SESSION_CRYPTO_KEY
+
+# Never leaves the process; session state, and every key encrypted under it, dies with it too
+_SERVER_SECRET = os.urandom(32)
+_KDF_INFO = b"medivision/session-api-key/v1"
+
+
+def _session_id() -> str:
+    ctx = st.runtime.scriptrunner.get_script_run_ctx()
+    return ctx.session_id if ctx else "local"
+
 
+def derive_session_key(session_id: str, secret: bytes = None) -> bytes:
+    """Fernet key for a session: HKDF-SHA256 over the server secret, salted with the session id"""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
-def generate_key_from_session() -> bytes:
-    """Generate encryption key from session"""
-    # Use a deterministic key based on session
-    # In production, use a proper key management system
-    session_id = st.runtime.scriptrunner.get_script_run_ctx().session_id
-    key = hashlib.sha256(session_id.encode()).digest()
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=session_id.encode(),
+        info=_KDF_INFO
+    ).derive(secret or _SERVER_SECRET)
     return base64.urlsafe_b64encode(key)
 
 
+class SessionCryptoContext:
+    """
+    A session's cipher, derived once, plus the last decrypted API key.
+
+    The plaintext is cached for ttl_seconds so reruns do not decrypt again;
+    an HMAC of the stored key lets store_api_key skip re-encrypting a key
+    that has not changed.
+    """
+
+    def __init__(self, session_id: str, ttl_seconds: float = API_KEY_CACHE_TTL_SECONDS):
+        from cryptography.fernet import Fernet  # loaded once a key is entered
+        self.ttl_seconds = ttl_seconds
+        self._fernet = Fernet(derive_session_key(session_id))
+        self._token = None
+        self._key_digest = None
+        self._plaintext = None
+        self._expires_at = 0.0
+
+    @staticmethod
+    def _digest(api_key: str) -> bytes:
+        return hmac.new(_SERVER_SECRET, api_key.encode(), hashlib.sha256).digest()
+
+    def _remember(self, token: str, api_key: str):
+        self._token = token
+        self._key_digest = self._digest(api_key)
+        self._plaintext = api_key
+        self._expires_at = time.monotonic() + self.ttl_seconds
+
+    def encrypt(self, api_key: str) -> str:
+        token = self._fernet.encrypt(api_key.encode()).decode()
+        self._remember(token, api_key)
+        return token
+
+    def decrypt(self, token: str) -> str:
+        if token == self._token and self._plaintext is not None and time.monotonic() < self._expires_at:
+            return self._plaintext
+        api_key = self._fernet.decrypt(token.encode()).decode()
+        self._remember(token, api_key)
+        return api_key
+
+    def holds(self, token: str, api_key: str) -> bool:
+        """Whether token is the encryption of api_key made by this context"""
+        return (
+            token == self._token
+            and self._key_digest is not None
+            and hmac.compare_digest(self._key_digest, self._digest(api_key))
+        )
+
+    def forget(self):
+        self._token = self._key_digest = self._plaintext = None
+        self._expires_at = 0.0
+
+
+def get_crypto_context() -> SessionCryptoContext:
+    """This session's crypto context, created on first use"""
+    context = st.session_state.get(SESSION_CRYPTO_KEY)
+    if context is None:
+        context = SessionCryptoContext(_session_id())
+        st.session_state[SESSION_CRYPTO_KEY] = context
+    return context
+
+
 def encrypt_api_key(api_key: str) -> str:
     """Encrypt API key for session storage"""
     try:
-        key = generate_key_from_session()
-        fernet = Fernet(key)
-        encrypted = fernet.encrypt(api_key.encode())
-        return encrypted.decode()
+        return get_crypto_context().encrypt(api_key)
     except Exception as e:
         st.error(f"Encryption error: {e}")
         return None
@@ -32,10 +108,7 @@ def encrypt_api_key(api_key: str) -> str:
 def decrypt_api_key(encrypted_key: str) -> str:
     """Decrypt API key from session storage"""
     try:
-        key = generate_key_from_session()
-        fernet = Fernet(key)
-        decrypted = fernet.decrypt(encrypted_key.encode())
-        return decrypted.decode()
+        return get_crypto_context().decrypt(encrypted_key)
     except Exception as e:
         st.error(f"Decryption error: {e}")
         return None
@@ -45,11 +118,11 @@ def validate_api_key(api_key: str) -> bool:
     """Validate Google API key format"""
     if not api_key:
         return False
-    
+
     # Basic validation - Google API keys typically start with "AIza" and are 39 characters
     if api_key.startswith("AIza") and len(api_key) == 39:
         return True
-    
+
     # Allow other formats but warn user
     return len(api_key) > 20
 
@@ -57,6 +130,10 @@ def validate_api_key(api_key: str) -> bool:
 def store_api_key(api_key: str):
     """Securely store API key in session"""
     if validate_api_key(api_key):
+        stored = st.session_state.get("api_key_encrypted")
+        if stored and SESSION_CRYPTO_KEY in st.session_state and get_crypto_context().holds(stored, api_key):
+            # The sidebar input still holds the same key; nothing to re-encrypt
+            return True
         encrypted = encrypt_api_key(api_key)
         if encrypted:
             st.session_state.api_key_encrypted = encrypted
@@ -75,3 +152,5 @@ def clear_api_key():
     """Clear stored API key"""
     if "api_key_encrypted" in st.session_state:
         del st.session_state.api_key_encrypted
+    if SESSION_CRYPTO_KEY in st.session_state:
+        st.session_state[SESSION_CRYPTO_KEY].forget()
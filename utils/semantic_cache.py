@@ -0,0 +1,300 @@
+"""
+Semantic cache for reworded text queries
+
+Queries are embedded with hashed TF-IDF: words (lightly stemmed, stopwords
+dropped) are feature-hashed with a sign bit into SEMANTIC_CACHE_FEATURES
+dimensions, using NumPy only. Each context (owner, model, language, style)
+keeps a dense matrix of L2-normalized rows, so a lookup is one
+matrix-vector product. Similarity alone cannot tell "60 year old man" from
+"60 year old woman", or notice one added fact, so a match must also use
+exactly the same content words: only word order, inflection, punctuation
+and stopwords may differ. Numbers, negations, laterality, sex, age and
+pregnancy words are never dropped or stemmed. IDF comes from the document
+frequencies of the cached queries; rows are re-weighted whenever the corpus
+has changed by a quarter since the last fit. Entries point at response
+cache keys and are evicted least recently used.
+"""
+
+import math
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional
+from config.settings import (
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_FEATURES,
+    SEMANTIC_CACHE_MAX_ENTRIES
+)
+from .metrics import register_gauge
+
+REFIT_RATIO = 1.25
+_WORD_RE = re.compile(r"\w+")
+_SUFFIXES = ("ing", "ed", "es", "s")
+_CONTRACTIONS = [("n't", " not"), ("'ve", ""), ("'m", ""), ("'re", ""), ("'ll", ""), ("'d", ""), ("'s", "")]
+_STOPWORDS = frozenset(
+    "a an the and or of in on at to for with from by is are was were be been has have had "
+    "i me my we our you your they their it its this that these those which who "
+    "as into about over some any very also so just get gets got do does did".split()
+)
+# Words that change the clinical meaning of an otherwise identical query; kept verbatim
+_CRITICAL_WORDS = frozenset(
+    "no not non without never none denies deny negative positive "
+    "left right bilateral upper lower "
+    "he she him his her man men woman women male female boy boys girl girls "
+    "baby babies infant infants newborn toddler child children kid kids teen teenager "
+    "adolescent adult elderly old young year years month months week weeks day days "
+    "one two three four five six seven eight nine ten eleven twelve "
+    "pregnant pregnancy trimester postpartum breastfeeding".split()
+)
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def normalize_query(text: str) -> str:
+    """Lowercased words joined by single spaces; equal for trivially different spellings"""
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+def _words(text: str) -> List[str]:
+    text = (text or "").lower().replace("\u2019", "'")
+    for contraction, replacement in _CONTRACTIONS:
+        text = text.replace(contraction, replacement)
+    return [
+        word if word in _CRITICAL_WORDS else _stem(word)
+        for word in _WORD_RE.findall(text)
+        if word in _CRITICAL_WORDS or word not in _STOPWORDS
+    ]
+
+
+def content_terms(text: str) -> frozenset:
+    """Words a match must share exactly, after stemming and dropping stopwords"""
+    return frozenset(_words(text))
+
+
+class HashedTfidfVectorizer:
+    """Signed feature hashing of words (stopwords dropped) with sublinear TF"""
+
+    def __init__(self, n_features: int = SEMANTIC_CACHE_FEATURES):
+        self.n_features = n_features
+
+    def term_frequencies(self, text: str):
+        """(feature indices, signed sublinear TF values) for text"""
+        import numpy as np
+
+        terms = Counter(_words(text))
+        features: Dict[int, float] = {}
+        for term, count in terms.items():
+            code = zlib.crc32(term.encode("utf-8"))
+            weight = 1.0 + math.log(count)
+            index = code % self.n_features
+            features[index] = features.get(index, 0.0) + (weight if code & 0x80000000 else -weight)
+        indices = np.fromiter(features.keys(), dtype=np.int64, count=len(features))
+        values = np.fromiter(features.values(), dtype=np.float32, count=len(features))
+        return indices, values
+
+
+@dataclass
+class SemanticMatch:
+    """Closest cached query at or above the similarity threshold"""
+    value: Any
+    similarity: float
+    query: str
+    entry_id: int
+
+
+class _Entry:
+    __slots__ = ("context", "query", "terms", "indices", "values", "value", "row")
+
+    def __init__(self, context, query, indices, values, value):
+        self.context = context
+        self.query = query
+        self.terms = content_terms(query)
+        self.indices = indices
+        self.values = values
+        self.value = value
+        self.row = -1
+
+
+class _Partition:
+    """Rows of one context, grown by doubling"""
+
+    def __init__(self, n_features: int):
+        import numpy as np
+        self.matrix = np.zeros((16, n_features), dtype=np.float32)
+        self.entry_ids: List[int] = []
+
+    def grow(self):
+        import numpy as np
+        grown = np.zeros((2 * len(self.matrix), self.matrix.shape[1]), dtype=np.float32)
+        grown[:len(self.matrix)] = self.matrix
+        self.matrix = grown
+
+
+class SemanticCache:
+    """Cosine-similarity lookup of earlier queries per context, with LRU eviction"""
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        n_features: int = SEMANTIC_CACHE_FEATURES,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES
+    ):
+        import numpy as np
+
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.vectorizer = HashedTfidfVectorizer(n_features)
+        self._partitions: Dict[Hashable, _Partition] = {}
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()  # least recently used first
+        self._by_query: Dict[tuple, int] = {}  # (context, normalized query) -> entry id
+        self._next_id = 0
+        self._df = np.zeros(n_features, dtype=np.float32)
+        self._idf = np.ones(n_features, dtype=np.float32)
+        self._fitted_docs = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(self, query: str, context: Hashable = None, threshold: float = None) -> Optional[SemanticMatch]:
+        """Most similar cached query in context if at least threshold similar, else None"""
+        import numpy as np
+
+        threshold = self.threshold if threshold is None else threshold
+        indices, values = self.vectorizer.term_frequencies(query)
+        with self._lock:
+            partition = self._partitions.get(context)
+            if partition is None or not len(indices):
+                self.misses += 1
+                return None
+            self._maybe_refit()
+
+            # The query is sparse: only its own feature columns contribute to the dot products
+            weights = values * self._idf[indices]
+            similarities = partition.matrix[:len(partition.entry_ids), indices] @ weights
+            similarities /= max(float(np.linalg.norm(weights)), 1e-12)
+            # Best candidates first; any added, dropped or changed content word disqualifies a match
+            candidates = np.flatnonzero(similarities >= threshold)
+            terms = content_terms(query)
+            for row in candidates[np.argsort(-similarities[candidates])]:
+                entry_id = partition.entry_ids[row]
+                entry = self._entries[entry_id]
+                if entry.terms == terms:
+                    self._entries.move_to_end(entry_id)
+                    self.hits += 1
+                    return SemanticMatch(entry.value, float(similarities[row]), entry.query, entry_id)
+            self.misses += 1
+            return None
+
+    def add(self, query: str, value: Any, context: Hashable = None):
+        """Cache value (e.g. a response cache key) for query in context"""
+        indices, values = self.vectorizer.term_frequencies(query)
+        if not len(indices):
+            return
+
+        with self._lock:
+            key = (context, normalize_query(query))
+            existing = self._by_query.get(key)
+            if existing is not None:
+                self._remove(existing)
+
+            entry_id = self._next_id
+            self._next_id += 1
+            entry = _Entry(context, query, indices, values, value)
+            self._entries[entry_id] = entry
+            self._by_query[key] = entry_id
+            self._df[indices] += 1
+
+            partition = self._partitions.get(context)
+            if partition is None:
+                partition = self._partitions[context] = _Partition(self.vectorizer.n_features)
+            entry.row = len(partition.entry_ids)
+            if entry.row == len(partition.matrix):
+                partition.grow()
+            partition.matrix[entry.row] = self._weighted(indices, values)
+            partition.entry_ids.append(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, match: SemanticMatch):
+        """Drop a match whose cached response is gone; it no longer counts as a hit"""
+        with self._lock:
+            if match.entry_id in self._entries:
+                self._remove(match.entry_id)
+            self.hits -= 1
+            self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _weighted(self, indices, values):
+        import numpy as np
+
+        vector = np.zeros(self.vectorizer.n_features, dtype=np.float32)
+        vector[indices] = values * self._idf[indices]
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _maybe_refit(self):
+        """Recompute IDF and every row once the corpus has grown or shrunk by REFIT_RATIO"""
+        import numpy as np
+
+        docs = len(self._entries)
+        if self._fitted_docs / REFIT_RATIO <= docs <= self._fitted_docs * REFIT_RATIO:
+            return
+        self._idf = (np.log((1 + docs) / (1 + self._df)) + 1).astype(np.float32)
+        self._fitted_docs = docs
+        for entry in self._entries.values():
+            self._partitions[entry.context].matrix[entry.row] = self._weighted(entry.indices, entry.values)
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        del self._by_query[(entry.context, normalize_query(entry.query))]
+        self._df[entry.indices] -= 1
+
+        # Move the last row into the freed slot
+        partition = self._partitions[entry.context]
+        last_id = partition.entry_ids.pop()
+        if last_id != entry_id:
+            moved = self._entries[last_id]
+            partition.matrix[entry.row] = partition.matrix[moved.row]
+            partition.entry_ids[entry.row] = last_id
+            moved.row = entry.row
+        if not partition.entry_ids:
+            del self._partitions[entry.context]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get the process-wide semantic cache, or None when it is disabled"""
+    global _cache
+    if not SEMANTIC_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                cache = SemanticCache()
+                register_gauge("semantic_cache_entries", "Queries held by the semantic cache",
+                               lambda: cache.stats()["entries"])
+                register_gauge("semantic_cache_hits", "Lookups answered with a similar earlier query",
+                               lambda: cache.stats()["hits"])
+                register_gauge("semantic_cache_misses", "Lookups with no similar enough earlier query",
+                               lambda: cache.stats()["misses"])
+                _cache = cache
+    return _cache
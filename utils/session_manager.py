@@ -3,15 +3,25 @@ Session and state management utilities
 """
 
 import streamlit as st
-from datetime import datetime
 from typing import Dict, List, Any
-from config.settings import MAX_HISTORY_ITEMS, SESSION_HISTORY_KEY, SESSION_TOKEN_KEY, SESSION_COST_KEY, SESSION_FEEDBACK_KEY
+from config.settings import (
+    HISTORY_PAGE_SIZE,
+    SESSION_HISTORY_KEY,
+    SESSION_TOKEN_KEY,
+    SESSION_COST_KEY,
+    SESSION_FEEDBACK_KEY,
+    SESSION_REGENERATION_KEY,
+    SESSION_CRYPTO_KEY,
+    SESSION_HEAP_KEY
+)
+from .history_store import HistoryStore, InMemoryHistoryStore, build_history_item, get_history_store
+from .session_memory import SessionHeap, get_session_ledger
 
 
 def initialize_session_state():
     """Initialize all session state variables"""
-    if SESSION_HISTORY_KEY not in st.session_state:
-        st.session_state[SESSION_HISTORY_KEY] = []
+    _get_store()
+    account_session_memory()
     
     if SESSION_TOKEN_KEY not in st.session_state:
         st.session_state[SESSION_TOKEN_KEY] = 0
@@ -22,90 +32,89 @@ def initialize_session_state():
     if SESSION_FEEDBACK_KEY not in st.session_state:
         st.session_state[SESSION_FEEDBACK_KEY] = {"positive": 0, "negative": 0}
     
-    if "current_response" not in st.session_state:
-        st.session_state.current_response = None
-    
     if "regenerate_count" not in st.session_state:
         st.session_state.regenerate_count = 0
 
 
+def _get_heap() -> SessionHeap:
+    if not isinstance(st.session_state.get(SESSION_HEAP_KEY), SessionHeap):
+        st.session_state[SESSION_HEAP_KEY] = SessionHeap()
+    return st.session_state[SESSION_HEAP_KEY]
+
+
+def get_session_value(key: str, default: Any = None) -> Any:
+    """Read state kept in this session's heap (offloadable under memory pressure)"""
+    return _get_heap().get(key, default)
+
+
+def set_session_value(key: str, value: Any):
+    """Keep bulky per-session state (responses, analyses) in the session heap"""
+    heap = _get_heap()
+    heap.set(key, value)
+    get_session_ledger().account(heap)
+
+
+def account_session_memory():
+    """Re-measure this session against the server-wide budget, marking it active"""
+    get_session_ledger().account(_get_heap())
+
+
+def _get_store() -> HistoryStore:
+    """Durable process-wide store, or this session's in-memory store"""
+    store = get_history_store()
+    if store is None:
+        heap = _get_heap()
+        store = heap.get(SESSION_HISTORY_KEY)
+        if not isinstance(store, InMemoryHistoryStore):
+            store = InMemoryHistoryStore()
+            heap.set(SESSION_HISTORY_KEY, store)
+    return store
+
+
+def set_history_owner(owner_id: str):
+    """Scope history to a stable identity (e.g. an API key fingerprint)"""
+    st.session_state.history_owner = owner_id
+
+
+def get_history_owner() -> str:
+    """Identity history is stored under; falls back to the session id"""
+    owner = st.session_state.get("history_owner")
+    if owner:
+        return owner
+    ctx = st.runtime.scriptrunner.get_script_run_ctx()
+    return f"session:{ctx.session_id}" if ctx else "session:local"
+
+
 def add_to_history(query: str, response: str, input_mode: str, language: str, model: str, tokens: int):
     """Add a conversation to history with a meaningful title"""
-    if SESSION_HISTORY_KEY not in st.session_state:
-        st.session_state[SESSION_HISTORY_KEY] = []
-
-    chat_name = generate_chat_title(query=query, input_mode=input_mode, language=language)
-
-    history_item = {
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "chat_name": chat_name,
-        "query": query,
-        "response": response,
-        "input_mode": input_mode,
-        "language": language,
-        "model": model,
-        "tokens": tokens
-    }
+    history_item = build_history_item(query, response, input_mode, language, model, tokens)
+    _get_store().add(get_history_owner(), history_item)
+    account_session_memory()
 
-    st.session_state[SESSION_HISTORY_KEY].insert(0, history_item)
-    if len(st.session_state[SESSION_HISTORY_KEY]) > MAX_HISTORY_ITEMS:
-        st.session_state[SESSION_HISTORY_KEY] = st.session_state[SESSION_HISTORY_KEY][:MAX_HISTORY_ITEMS]
-
-
-def generate_chat_title(query: str, input_mode: str, language: str, max_length: int = 60) -> str:
-    """Generate a richer, user-friendly chat title.
-
-    Logic:
-    - Image only: return 'Image Analysis' with language.
-    - If medical keywords found: combine up to two and append 'Assessment'.
-    - Else: Use first 8 words of the query as summary.
-    - Always truncate gracefully and title-case first word.
-    """
-    # Image-only case with no text
-    if (not query or query.strip() == "") and ("Image" in input_mode):
-        return f"Image Analysis ({language[:2].upper()})"
-
-    if not query:
-        return f"Medical Analysis ({language[:2].upper()})"
-
-    medical_keywords = [
-        "chest", "x-ray", "cough", "fever", "pain", "headache", "rash",
-        "swelling", "fracture", "injury", "scan", "mri", "ct", "ultrasound",
-        "heart", "lung", "brain", "knee", "shoulder", "back", "abdomen",
-        "diabetes", "infection", "wound", "tumor", "lesion", "fracture"
-    ]
-
-    q_lower = query.lower()
-    found = []
-    for kw in medical_keywords:
-        if kw in q_lower and kw not in found:
-            found.append(kw)
-        if len(found) == 2:
-            break
-
-    if found:
-        title = " & ".join([w.title() for w in found]) + " Assessment"
-    else:
-        words = query.strip().split()
-        snippet = " ".join(words[:8])
-        if len(words) > 8:
-            snippet += "..."
-        title = snippet[:max_length]
 
-    # Append language code for clarity
-    return f"{title} ({language[:2].upper()})"
+def get_history(offset: int = 0, limit: int = HISTORY_PAGE_SIZE) -> List[Dict[str, Any]]:
+    """Get a page of conversation history, most recent first"""
+    return _get_store().list(get_history_owner(), offset=offset, limit=limit)
+
+
+def get_history_item(item_id: int) -> Dict[str, Any]:
+    """Get a single conversation by id"""
+    return _get_store().get(get_history_owner(), item_id)
+
 
+def count_history() -> int:
+    """Get the number of stored conversations"""
+    return _get_store().count(get_history_owner())
 
-def get_history() -> List[Dict[str, Any]]:
-    """Get conversation history"""
-    if SESSION_HISTORY_KEY not in st.session_state:
-        return []
-    return st.session_state[SESSION_HISTORY_KEY]
+
+def get_history_stats() -> Dict[str, Any]:
+    """Get maintained history aggregates (count, tokens, languages, models)"""
+    return _get_store().stats(get_history_owner())
 
 
 def clear_history():
     """Clear conversation history"""
-    st.session_state[SESSION_HISTORY_KEY] = []
+    _get_store().clear(get_history_owner())
 
 
 def update_token_stats(tokens: int, cost: float):
@@ -127,6 +136,22 @@ def get_token_stats() -> Dict[str, Any]:
     }
 
 
+def record_regeneration_savings(bytes_saved: int, seconds_saved: float):
+    """Accumulate what incremental regenerations saved this session"""
+    if SESSION_REGENERATION_KEY not in st.session_state:
+        st.session_state[SESSION_REGENERATION_KEY] = {"count": 0, "bytes_saved": 0, "seconds_saved": 0.0}
+    
+    totals = st.session_state[SESSION_REGENERATION_KEY]
+    totals["count"] += 1
+    totals["bytes_saved"] += bytes_saved
+    totals["seconds_saved"] += seconds_saved
+
+
+def get_regeneration_savings() -> Dict[str, Any]:
+    """Get accumulated regeneration savings"""
+    return st.session_state.get(SESSION_REGENERATION_KEY, {"count": 0, "bytes_saved": 0, "seconds_saved": 0.0})
+
+
 def add_feedback(is_positive: bool):
     """Record user feedback"""
     if SESSION_FEEDBACK_KEY not in st.session_state:
@@ -147,7 +172,7 @@ def get_feedback_stats() -> Dict[str, int]:
 
 def reset_session():
     """Reset all session data"""
-    keys_to_keep = ["api_key_encrypted"]  # Keep encrypted API key
+    keys_to_keep = ["api_key_encrypted", SESSION_CRYPTO_KEY]  # Keep encrypted API key and its cipher
     for key in list(st.session_state.keys()):
         if key not in keys_to_keep:
             del st.session_state[key]
@@ -0,0 +1,276 @@
+"""
+Server-wide memory budget for session state
+
+Each session keeps its bulky state (in-memory history, the last response,
+analysis and query) in a SessionHeap, re-measured whenever it changes. When
+the total across sessions passes SESSION_MEMORY_BUDGET_BYTES, the least
+recently active sessions idle for SESSION_OFFLOAD_IDLE_SECONDS are pickled to
+this process's subdirectory of SESSION_OFFLOAD_DIR and their images spilled
+from the blob store. A heap loads itself back from disk the next time its
+session reads it.
+"""
+
+import atexit
+import itertools
+import logging
+import os
+import pickle
+import shutil
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional
+from config.settings import (
+    SESSION_MEMORY_BUDGET_BYTES,
+    SESSION_OFFLOAD_DIR,
+    SESSION_OFFLOAD_IDLE_SECONDS
+)
+from .blob_store import ImageRef, get_image_blob_store
+from .metrics import register_gauge
+
+LOW_WATER_RATIO = 0.8  # Offload down to this share of the budget, not just under it
+
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None), ImageRef)
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any, _seen: set = None) -> int:
+    """Approximate deep size in bytes; images count as their reference, the blob store budgets the bytes"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, _ATOMIC_TYPES):
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _seen)
+    return size
+
+
+class _HeapPickler(pickle.Pickler):
+    """Pickles ImageRefs by digest, collecting them so their blobs stay referenced"""
+
+    def __init__(self, file, images: Dict[str, ImageRef]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.images = images
+
+    def persistent_id(self, obj):
+        if isinstance(obj, ImageRef):
+            self.images[obj.digest] = obj
+            return obj.digest
+        return None
+
+
+class _HeapUnpickler(pickle.Unpickler):
+    def __init__(self, file, images: Dict[str, ImageRef]):
+        super().__init__(file)
+        self.images = images
+
+    def persistent_load(self, digest):
+        return self.images[digest]
+
+
+class SessionHeap:
+    """A session's offloadable state; reads load it back if the ledger moved it to disk"""
+
+    def __init__(self):
+        self.token = None  # Assigned by the ledger on first accounting
+        self._values: Optional[Dict[str, Any]] = {}
+        self._path = None
+        self._images: Dict[str, ImageRef] = {}  # Held while offloaded
+        self._lock = threading.Lock()
+
+    @property
+    def offloaded(self) -> bool:
+        return self._values is None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._resident().get(key, default)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._resident()[key] = value
+
+    def measure(self) -> int:
+        """Approximate bytes held, loading the values back first if they were offloaded"""
+        with self._lock:
+            return estimate_size(self._resident())
+
+    def offload(self, path: str) -> bool:
+        """Move the values to path; False if there is nothing to move or they cannot be pickled"""
+        with self._lock:
+            if not self._values:
+                return False
+            images = {}
+            temp_path = f"{path}.tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    _HeapPickler(f, images).dump(self._values)
+                os.replace(temp_path, path)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return False
+
+            self._values = None
+            self._path = path
+            self._images = images
+
+        store = get_image_blob_store()
+        for ref in images.values():
+            store.spill(ref)
+        return True
+
+    def _resident(self) -> Dict[str, Any]:
+        if self._values is None:
+            try:
+                with open(self._path, "rb") as f:
+                    self._values = _HeapUnpickler(f, self._images).load()
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+                # A missing, truncated or stale file loses this session's state, not the session
+                logger.warning("Could not load offloaded session state from %s: %s", self._path, e)
+                self._values = {}
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._path = None
+            self._images = {}
+        return self._values
+
+
+class SessionMemoryLedger:
+    """
+    Approximate bytes held by every session's heap, with least recently
+    active sessions offloaded to disk once the total passes the budget.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = SESSION_MEMORY_BUDGET_BYTES,
+        offload_dir: str = SESSION_OFFLOAD_DIR,
+        idle_seconds: float = SESSION_OFFLOAD_IDLE_SECONDS
+    ):
+        self.budget_bytes = budget_bytes
+        # Worker processes share offload_dir and number sessions independently, so each gets its own subdirectory
+        self.offload_dir = os.path.join(offload_dir, str(os.getpid()))
+        self.idle_seconds = idle_seconds
+        # token -> [weakref to heap, bytes, last active]; least recently active first
+        self._entries: "OrderedDict[int, list]" = OrderedDict()
+        self._tokens = itertools.count(1)
+        self._lock = threading.Lock()
+        # Finalizers can run mid-operation on any thread; ended sessions are removed under the lock later
+        self._pending_forgets = deque()
+        self.total_bytes = 0
+        self.offloads = 0
+
+        os.makedirs(self.offload_dir, exist_ok=True)
+        # Left by an earlier process with the same pid; those sessions died with it
+        for name in os.listdir(self.offload_dir):
+            if name.endswith((".pkl", ".pkl.tmp")):
+                os.remove(os.path.join(self.offload_dir, name))
+        atexit.register(shutil.rmtree, self.offload_dir, True)
+
+    def account(self, heap: SessionHeap) -> int:
+        """Mark heap's session active and re-measure it, offloading cold sessions if over budget"""
+        size = heap.measure()
+        with self._lock:
+            self._apply_forgets()
+            entry = self._entries.get(heap.token)
+            if entry is None:
+                heap.token = next(self._tokens)
+                entry = self._entries[heap.token] = [weakref.ref(heap), 0, 0.0]
+                weakref.finalize(heap, self._pending_forgets.append, heap.token)
+
+            self.total_bytes += size - entry[1]
+            entry[1] = size
+            entry[2] = time.monotonic()
+            self._entries.move_to_end(heap.token)
+
+            cold = self._choose_cold(keep=heap.token) if self.total_bytes > self.budget_bytes else []
+        # Pickling and writing happen outside the lock so other sessions' reruns don't wait on disk
+        for token, cold_heap, cold_entry in cold:
+            if cold_heap.offload(self._path(token)):
+                with self._lock:
+                    # Skip the refund if the session woke up and was re-measured meanwhile
+                    if cold_heap.offloaded and self._entries.get(token) is cold_entry:
+                        self.total_bytes -= cold_entry[1]
+                        cold_entry[1] = 0
+                    self.offloads += 1
+        return size
+
+    def _path(self, token: int) -> str:
+        return os.path.join(self.offload_dir, f"{token}.pkl")
+
+    def _choose_cold(self, keep: int) -> List[tuple]:
+        """(token, heap, entry) of the idle sessions to offload to get under the low-water mark"""
+        low_water = self.budget_bytes * LOW_WATER_RATIO
+        idle_since = time.monotonic() - self.idle_seconds
+        remaining = self.total_bytes
+        cold = []
+        for token, entry in self._entries.items():
+            if remaining <= low_water or entry[2] > idle_since:
+                break  # Everything after this was active more recently
+            heap = entry[0]()
+            if token == keep or heap is None or not entry[1]:
+                continue
+            cold.append((token, heap, entry))
+            remaining -= entry[1]
+        return cold
+
+    def _apply_forgets(self):
+        while self._pending_forgets:
+            token = self._pending_forgets.popleft()
+            entry = self._entries.pop(token, None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+            try:
+                os.remove(self._path(token))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._apply_forgets()
+            heaps = [entry[0]() for entry in self._entries.values()]
+            return {
+                "sessions": len(self._entries),
+                "offloaded": sum(1 for heap in heaps if heap is not None and heap.offloaded),
+                "memory_bytes": self.total_bytes,
+                "budget_bytes": self.budget_bytes,
+                "offloads": self.offloads
+            }
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_session_ledger() -> SessionMemoryLedger:
+    """Get the process-wide session memory ledger"""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                ledger = SessionMemoryLedger()
+                register_gauge("session_memory_bytes", "Approximate bytes of session state held in memory",
+                               lambda: ledger.stats()["memory_bytes"])
+                register_gauge("session_memory_budget_bytes", "Server-wide budget for session state",
+                               lambda: ledger.budget_bytes)
+                register_gauge("sessions", "Sessions tracked by the memory ledger",
+                               lambda: ledger.stats()["sessions"])
+                register_gauge("sessions_offloaded", "Sessions whose state is currently on disk",
+                               lambda: ledger.stats()["offloaded"])
+                _ledger = ledger
+    return _ledger
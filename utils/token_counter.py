@@ -2,16 +2,128 @@
 Token counting and cost estimation utilities
 """
 
-from typing import Dict
+import io
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from config.settings import TOKEN_COST
 
+# Gemini bills small images as one tile and larger images as 768px-class tiles
+IMAGE_TOKENS_PER_TILE = 258
+IMAGE_SMALL_MAX_SIDE = 384
+CHARS_PER_TOKEN = 4
+
 
 def estimate_tokens(text: str) -> int:
     """
     Estimate token count for text
     Rough estimation: ~4 characters per token
     """
-    return len(text) // 4
+    return len(text) // CHARS_PER_TOKEN
+
+
+def get_image_dimensions(image_data: bytes) -> Optional[Tuple[int, int]]:
+    """Read image width/height from its header without decoding pixels"""
+    try:
+        from PIL import Image
+        with Image.open(io.BytesIO(image_data)) as image:
+            return image.size
+    except Exception:
+        return None
+
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """Estimate tokens for an image from its dimensions"""
+    if width <= IMAGE_SMALL_MAX_SIDE and height <= IMAGE_SMALL_MAX_SIDE:
+        return IMAGE_TOKENS_PER_TILE
+
+    tile_size = min(max(int(min(width, height) / 1.5), 256), 768)
+    tiles = math.ceil(width / tile_size) * math.ceil(height / tile_size)
+    return tiles * IMAGE_TOKENS_PER_TILE
+
+
+def estimate_prompt_tokens(prompt_parts: list) -> int:
+    """
+    Estimate input tokens for prompt parts.
+
+    Text parts are measured by length and image parts by their dimensions;
+    image bytes are never converted to text.
+    """
+    total = 0
+    for part in prompt_parts:
+        if isinstance(part, str):
+            total += estimate_tokens(part)
+        elif isinstance(part, dict) and "parts" in part:
+            # A conversation turn ({"role", "parts"})
+            total += estimate_prompt_tokens(part["parts"])
+        elif isinstance(part, dict) and "data" in part:
+            dimensions = get_image_dimensions(part["data"])
+            total += estimate_image_tokens(*dimensions) if dimensions else IMAGE_TOKENS_PER_TILE
+        elif isinstance(part, dict):
+            # Uploaded file references and other non-text parts
+            total += IMAGE_TOKENS_PER_TILE
+        else:
+            total += estimate_tokens(str(part))
+    return total
+
+
+class OutputTokenCounter:
+    """Count output tokens incrementally while a response streams"""
+
+    def __init__(self):
+        self.chars = 0
+        self.chunks = 0
+
+    def add(self, chunk: str):
+        self.chars += len(chunk)
+        self.chunks += 1
+
+    @property
+    def tokens(self) -> int:
+        return self.chars // CHARS_PER_TOKEN
+
+
+@dataclass
+class TokenUsage:
+    """Input/output token counts and where they came from"""
+    input_tokens: int
+    output_tokens: int
+    source: str  # "reported", "estimated" or "cache"
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+def get_reported_usage(response) -> Optional[TokenUsage]:
+    """Read usage metadata reported by the API, if the response carries it"""
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return None
+
+    input_tokens = getattr(usage, "prompt_token_count", 0) or 0
+    # Thinking tokens of 2.5 models are billed as output
+    output_tokens = (getattr(usage, "candidates_token_count", 0) or 0) + \
+        (getattr(usage, "thoughts_token_count", 0) or 0)
+    if not input_tokens and not output_tokens:
+        return None
+    return TokenUsage(input_tokens, output_tokens, "reported")
+
+
+def resolve_token_usage(response, prompt_parts: list, output_counter: OutputTokenCounter) -> TokenUsage:
+    """Prefer API-reported usage and fall back to local estimates"""
+    if getattr(response, "from_cache", False):
+        return TokenUsage(0, 0, "cache")
+
+    reported = get_reported_usage(response)
+    if reported:
+        return reported
+
+    return TokenUsage(
+        input_tokens=estimate_prompt_tokens(prompt_parts),
+        output_tokens=output_counter.tokens,
+        source="estimated"
+    )
 
 
 def calculate_cost(input_tokens: int, output_tokens: int) -> float: